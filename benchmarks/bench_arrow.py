@@ -0,0 +1,81 @@
+"""Compare building Arrow tables and Polars frames directly or through pandas.
+
+Converts the /mapping, /latest and /5m responses for a synthetic full market
+with `to_arrow` and `to_polars`, and with the pandas detour they replace
+(`to_dataframe` followed by `pa.Table.from_pandas` or `pl.from_pandas`), and
+reports the median build time and the result's size. Converters whose
+libraries are not installed are skipped.
+
+Run with: uv run python benchmarks/bench_arrow.py [--items N] [--repeat N]
+"""
+
+import argparse
+import importlib.util
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from osrs_prices.models import AverageResponse, LatestResponse, MappingResponse
+from osrs_prices.pandas import to_dataframe
+from osrs_prices.synthetic import PayloadGenerator
+
+
+def _converters() -> dict[str, tuple[Callable[[Any], Any], Callable[[Any], int]]]:
+    converters: dict[str, tuple[Callable[[Any], Any], Callable[[Any], int]]] = {
+        "pandas": (to_dataframe, lambda df: int(df.memory_usage(deep=True).sum())),
+    }
+    if importlib.util.find_spec("pyarrow") is not None:
+        import pyarrow as pa
+
+        from osrs_prices.arrow import to_arrow
+
+        converters["arrow"] = (to_arrow, lambda table: table.nbytes)
+        converters["pandas->arrow"] = (
+            lambda response: pa.Table.from_pandas(to_dataframe(response)),
+            lambda table: table.nbytes,
+        )
+    if importlib.util.find_spec("polars") is not None:
+        import polars as pl
+
+        from osrs_prices.polars import to_polars
+
+        converters["polars"] = (to_polars, lambda df: int(df.estimated_size()))
+        if importlib.util.find_spec("pyarrow") is not None:
+            converters["pandas->polars"] = (
+                lambda response: pl.from_pandas(to_dataframe(response)),
+                lambda df: int(df.estimated_size()),
+            )
+    return converters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(items=args.items, seed=0)
+    responses = {
+        "mapping": MappingResponse.from_list(gen.mapping()),
+        "latest": LatestResponse.from_api(gen.latest()),
+        "5m": AverageResponse.from_api(gen.average("5m")),
+    }
+
+    print(f"{'converter':<16} {'frame':<8} {'KiB':>9} {'build ms':>9}")
+    for name, (convert, size_of) in _converters().items():
+        for frame, response in responses.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = convert(response)
+                timings.append(time.perf_counter() - start)
+            size = size_of(result)
+            print(
+                f"{name:<16} {frame:<8} {size / 1024:>9,.0f}"
+                f" {statistics.median(timings) * 1e3:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure TTLCache read throughput under thread contention.
+
+Compares the lock-free read path of TTLCache against a cache that takes a
+lock on every read, for thread counts from 1 to 64. On a free-threaded build
+(python3.13t) the locked variant stops scaling while the lock-free one does not.
+
+Run with: uv run python benchmarks/bench_cache_contention.py [--reads N]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from typing import Generic, TypeVar
+
+from osrs_prices.cache import TTLCache
+
+T = TypeVar("T")
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+
+
+class LockedTTLCache(Generic[T]):
+    """A TTL cache that locks on every read, for comparison."""
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._value: T | None = None
+        self._expiry = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> T | None:
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expiry:
+                return self._value
+            return None
+
+    def set(self, value: T) -> None:
+        with self._lock:
+            self._value = value
+            self._expiry = time.monotonic() + self._ttl
+
+
+def run(cache: TTLCache[object] | LockedTTLCache[object], threads: int, reads: int) -> float:
+    """Return total reads per second across `threads` threads."""
+    barrier = threading.Barrier(threads + 1)
+
+    def reader() -> None:
+        get = cache.get
+        barrier.wait()
+        for _ in range(reads):
+            get()
+
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * reads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=100_000, help="reads per thread")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>7} {'locked reads/s':>16} {'lock-free reads/s':>18} {'speedup':>8}")
+
+    value = object()
+    for threads in THREAD_COUNTS:
+        locked: LockedTTLCache[object] = LockedTTLCache(3600)
+        locked.set(value)
+        lock_free: TTLCache[object] = TTLCache(3600)
+        lock_free.set(value)
+
+        locked_rate = run(locked, threads, args.reads)
+        lock_free_rate = run(lock_free, threads, args.reads)
+        print(
+            f"{threads:>7} {locked_rate:>16,.0f} {lock_free_rate:>18,.0f} "
+            f"{lock_free_rate / locked_rate:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare the binary codec against JSON for bytes per point and decode throughput.
+
+Series are random walks with occasional gaps, since the codec's delta
+encoding depends on consecutive prices being close. The synthetic generator's
+timeseries jitter independently per bucket, which would understate it.
+
+Run with: uv run python benchmarks/bench_codec.py [--items N] [--points N]
+"""
+
+import argparse
+import io
+import json
+import random
+import time
+from collections.abc import Callable
+
+from osrs_prices.codec import Decoder, decode_timeseries, encode_timeseries
+from osrs_prices.models import TimeseriesDataPoint, TimeseriesResponse
+
+
+def make_series(points: int, rng: random.Random) -> list[TimeseriesDataPoint]:
+    """Build a random-walk 5m series with occasional gaps."""
+    price = rng.randint(100, 2_000_000)
+    series = []
+    for i in range(points):
+        price = max(1, price + int(rng.gauss(0, price * 0.002)))
+        traded = rng.random() > 0.1
+        series.append(
+            TimeseriesDataPoint(
+                timestamp=1704067200 + i * 300,
+                avgHighPrice=price + rng.randint(0, 3) if traded else None,
+                avgLowPrice=price - rng.randint(0, 3) if traded else None,
+                highPriceVolume=rng.randint(0, 50),
+                lowPriceVolume=rng.randint(0, 50),
+            )
+        )
+    return series
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Return the wall-clock seconds taken by func."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--points", type=int, default=365)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    all_series = [make_series(args.points, rng) for _ in range(args.items)]
+    total_points = args.items * args.points
+
+    json_blobs = [
+        json.dumps({"data": [p.model_dump(by_alias=True) for p in s]}).encode() for s in all_series
+    ]
+    binary_blobs = [encode_timeseries(s) for s in all_series]
+
+    json_bytes = sum(len(b) for b in json_blobs)
+    binary_bytes = sum(len(b) for b in binary_blobs)
+
+    rows = [
+        ("json", json_bytes, timed(lambda: [json.loads(b) for b in json_blobs])),
+        (
+            "json+models",
+            json_bytes,
+            timed(lambda: [TimeseriesResponse.from_api(json.loads(b)) for b in json_blobs]),
+        ),
+        (
+            "binary",
+            binary_bytes,
+            timed(lambda: [list(Decoder(io.BytesIO(b))) for b in binary_blobs]),
+        ),
+        (
+            "binary+models",
+            binary_bytes,
+            timed(lambda: [decode_timeseries(b) for b in binary_blobs]),
+        ),
+    ]
+
+    print(f"{total_points:,} points across {args.items} series")
+    print(f"{'format':<14} {'bytes/point':>12} {'decode points/s':>16}")
+    for name, size, seconds in rows:
+        print(f"{name:<14} {size / total_points:>12.2f} {total_points / seconds:>16,.0f}")
+    print(f"size ratio: {json_bytes / binary_bytes:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
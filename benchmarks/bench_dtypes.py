@@ -0,0 +1,61 @@
+"""Compare DataFrame memory and build time across dtype policies.
+
+Builds the /mapping, /latest and /5m frames for a synthetic full market with
+each policy and reports `memory_usage(deep=True)` and the median build time.
+The default policy's string columns depend on the pandas version: object on
+pandas 2, pyarrow-backed `str` on pandas 3.
+
+Run with: uv run python benchmarks/bench_dtypes.py [--items N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import time
+
+from osrs_prices.models import AverageResponse, LatestResponse, MappingResponse
+from osrs_prices.pandas import COMPACT_DTYPES, DEFAULT_DTYPES, DtypePolicy, to_dataframe
+from osrs_prices.synthetic import PayloadGenerator
+
+POLICIES = {
+    "default": DEFAULT_DTYPES,
+    "object strings": DtypePolicy(strings="object"),  # pandas 2's inference
+    "Int64": DtypePolicy(integers="Int64"),
+    "Int32": DtypePolicy(integers="Int32"),
+    "Int32+string": DtypePolicy(integers="Int32", strings="string"),
+    "Int32+category": DtypePolicy(integers="Int32", strings="category"),
+    "compact": COMPACT_DTYPES,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(items=args.items, seed=0)
+    responses = {
+        "mapping": MappingResponse.from_list(gen.mapping()),
+        "latest": LatestResponse.from_api(gen.latest()),
+        "5m": AverageResponse.from_api(gen.average("5m")),
+    }
+
+    print(f"{'policy':<16} {'frame':<8} {'KiB':>9} {'vs default':>11} {'build ms':>9}")
+    baseline: dict[str, int] = {}
+    for name, policy in POLICIES.items():
+        for frame, response in responses.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                df = to_dataframe(response, dtypes=policy)
+                timings.append(time.perf_counter() - start)
+            size = int(df.memory_usage(deep=True).sum())
+            baseline.setdefault(frame, size)
+            print(
+                f"{name:<16} {frame:<8} {size / 1024:>9,.0f} {size / baseline[frame]:>10.2f}x"
+                f" {statistics.median(timings) * 1e3:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
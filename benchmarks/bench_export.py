@@ -0,0 +1,78 @@
+"""Measure peak memory of exporting /5m snapshots as the batch grows.
+
+Exports a stream of synthetic snapshots with each streaming exporter, and for
+comparison with the batch approach it replaces: one DataFrame per snapshot
+with `to_dataframe`, concatenated and written with `DataFrame.to_parquet`.
+Reports wall time and peak memory, as traced Python allocations plus the peak
+of Arrow's memory pool, which tracemalloc does not see.
+
+Run with: uv run python benchmarks/bench_export.py [--items N] [--snapshots N ...]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from osrs_prices.export import export
+from osrs_prices.models import AverageResponse
+from osrs_prices.pandas import to_dataframe
+from osrs_prices.synthetic import DEFAULT_TIMESTAMP, PayloadGenerator
+
+
+def _snapshots(gen: PayloadGenerator, count: int) -> Iterator[AverageResponse]:
+    for i in range(count):
+        yield AverageResponse.from_api(gen.average("5m", DEFAULT_TIMESTAMP + 300 * i))
+
+
+def _batch(snapshots: Iterator[AverageResponse], root: Path) -> None:
+    frames = []
+    for snapshot in snapshots:
+        df = to_dataframe(snapshot).reset_index()
+        df.insert(0, "timestamp", snapshot.timestamp)
+        frames.append(df)
+    pd.concat(frames, ignore_index=True).to_parquet(root / "batch.parquet")
+
+
+def _measure(run: Callable[[Path], object]) -> tuple[float, int]:
+    pool = pa.default_memory_pool()
+    with tempfile.TemporaryDirectory() as root:
+        pool.release_unused()
+        tracemalloc.start()
+        base = pool.max_memory()
+        start = time.perf_counter()
+        run(Path(root))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak + max(pool.max_memory() - base, 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=4000)
+    parser.add_argument("--snapshots", type=int, nargs="+", default=[12, 36, 72])
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(items=args.items, seed=0)
+    methods: dict[str, Callable[[int], Callable[[Path], object]]] = {
+        "batch parquet": lambda n: lambda root: _batch(_snapshots(gen, n), root),
+        "parquet": lambda n: lambda root: export(_snapshots(gen, n), root, "5m"),
+        "csv.gz": lambda n: lambda root: export(_snapshots(gen, n), root, "5m", format="csv"),
+        "ndjson.gz": lambda n: lambda root: export(_snapshots(gen, n), root, "5m", format="ndjson"),
+    }
+
+    print(f"{'method':<14} {'snapshots':>9} {'seconds':>8} {'peak MiB':>9}")
+    for name, method in methods.items():
+        for count in args.snapshots:
+            elapsed, peak = _measure(method(count))
+            print(f"{name:<14} {count:>9} {elapsed:>8.2f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
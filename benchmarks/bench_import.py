@@ -0,0 +1,61 @@
+"""Measure cold import time of the package.
+
+Each statement runs in a fresh interpreter with `-X importtime`; the report
+shows the median cumulative import time of osrs_prices modules and the
+median wall time of the whole interpreter run.
+
+Run with: uv run python benchmarks/bench_import.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    "import osrs_prices",
+    "from osrs_prices import ValidationError",
+    "from osrs_prices import LatestResponse",
+    "from osrs_prices import Client",
+    "from osrs_prices import Client; from osrs_prices.pandas import to_dataframe",
+)
+
+
+def import_time_us(stderr: str) -> int:
+    """Sum the cumulative import time of top-level osrs_prices imports."""
+    total = 0
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        # Top-level imports have no indentation before the module name.
+        if len(parts) == 3 and parts[2].startswith(" osrs_prices"):
+            total += int(parts[1])
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'statement':<72} {'import ms':>10} {'process ms':>11}")
+    for statement in STATEMENTS:
+        imports, walls = [], []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", statement],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            walls.append(time.perf_counter() - start)
+            imports.append(import_time_us(result.stderr))
+        print(
+            f"{statement:<72} {statistics.median(imports) / 1000:>10.1f} "
+            f"{statistics.median(walls) * 1000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare the memory held by the pydantic models and the compact representations.
+
+Each representation is built from the raw JSON body while tracemalloc is
+tracing, so strings and numbers decoded from the body are counted against
+the objects that keep them. The report shows the bytes still allocated once
+the representation is built and the JSON intermediates are freed, and the
+time taken to build it.
+
+Run with: uv run python benchmarks/bench_memory.py [--items N]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from osrs_prices.compact import CompactLatest, CompactMapping
+from osrs_prices.models import LatestResponse, MappingResponse
+from osrs_prices.synthetic import PayloadGenerator
+
+
+def retained(build: Callable[[], object]) -> tuple[int, float]:
+    """Return the bytes retained by build()'s result and the seconds it took."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=4000)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(items=args.items, seed=42)
+    mapping_body = json.dumps(gen.mapping()).encode()
+    latest_body = json.dumps(gen.latest()).encode()
+    latest_items = len(json.loads(latest_body)["data"])
+
+    rows = [
+        (
+            "catalog",
+            "MappingResponse",
+            args.items,
+            retained(lambda: MappingResponse.from_list(json.loads(mapping_body))),
+        ),
+        (
+            "catalog",
+            "CompactMapping",
+            args.items,
+            retained(lambda: CompactMapping.from_list(json.loads(mapping_body))),
+        ),
+        (
+            "/latest",
+            "LatestResponse",
+            latest_items,
+            retained(lambda: LatestResponse.from_api(json.loads(latest_body))),
+        ),
+        (
+            "/latest",
+            "CompactLatest",
+            latest_items,
+            retained(lambda: CompactLatest.from_api(json.loads(latest_body))),
+        ),
+    ]
+
+    print(f"{'payload':<9} {'representation':<16} {'KiB':>9} {'bytes/item':>11} {'build ms':>9}")
+    for payload, name, items, (size, seconds) in rows:
+        print(
+            f"{payload:<9} {name:<16} {size / 1024:>9,.0f} {size / items:>11,.0f}"
+            f" {seconds * 1e3:>9.1f}"
+        )
+    for first, second in ((0, 1), (2, 3)):
+        ratio = rows[first][3][0] / rows[second][3][0]
+        print(f"{rows[second][1]}: {ratio:.1f}x smaller than {rows[first][1]}")
+
+
+if __name__ == "__main__":
+    main()
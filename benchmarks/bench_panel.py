@@ -0,0 +1,73 @@
+"""Compare building a multi-item timeseries panel with concatenating DataFrames.
+
+Builds an items x timestamps view of synthetic /timeseries responses in two
+ways: one DataFrame per item with `to_dataframe`, concatenated and pivoted to
+wide form, and `TimeseriesPanel.from_responses`. Every third item has its
+points shifted by half a bucket, so the time axes only partly overlap.
+Reports the median build time and peak traced memory of each.
+
+Run with: uv run python benchmarks/bench_panel.py [--items N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pandas as pd
+
+from osrs_prices.models import TimeseriesResponse
+from osrs_prices.pandas import to_dataframe
+from osrs_prices.panel import FIELDS, TimeseriesPanel
+from osrs_prices.synthetic import DEFAULT_TIMESTAMP, PayloadGenerator
+
+
+def _concat_pivot(responses: dict[int, TimeseriesResponse]) -> dict[str, pd.DataFrame]:
+    frames = pd.concat(
+        {item_id: to_dataframe(response) for item_id, response in responses.items()},
+        names=["item_id"],
+    ).reset_index()
+    return {
+        field: frames.pivot(index="item_id", columns="timestamp", values=field) for field in FIELDS
+    }
+
+
+def _measure(build: Callable[[], object], repeat: int) -> tuple[float, int]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(seed=0)
+    responses = {
+        item_id: TimeseriesResponse.from_api(
+            gen.timeseries(item_id, "5m", end=DEFAULT_TIMESTAMP - 150 * (i % 3 == 0))
+        )
+        for i, item_id in enumerate(gen.item_ids[: args.items])
+    }
+
+    print(f"{'method':<14} {'median ms':>10} {'peak MiB':>9}")
+    for name, build in (
+        ("concat+pivot", lambda: _concat_pivot(responses)),
+        ("panel", lambda: TimeseriesPanel.from_responses(responses)),
+    ):
+        median, peak = _measure(build, args.repeat)
+        print(f"{name:<14} {median * 1e3:>10.1f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Offline benchmark suite for parsing, enrichment and DataFrame conversion.
+
+Each stage runs on synthetic full-size payloads and reports latency
+percentiles, item throughput and peak traced memory. Results are written as
+JSON and compared against a stored baseline; the run fails if any stage's
+median latency or peak memory regresses by more than the threshold.
+
+Run with:
+    uv run python benchmarks/bench_suite.py                      # compare to baseline
+    uv run python benchmarks/bench_suite.py --save-baseline      # record a new baseline
+    uv run python benchmarks/bench_suite.py --items 40000 --stage parse_latest
+
+Baselines are machine-specific; record one on the machine that runs the comparison.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from osrs_prices import Client
+from osrs_prices.models import AverageResponse, LatestResponse, MappingResponse
+from osrs_prices.pandas import from_api, to_dataframe
+from osrs_prices.synthetic import PayloadGenerator
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+Setup = Callable[[PayloadGenerator], tuple[Callable[[], object], int]]
+STAGES: dict[str, Setup] = {}
+
+
+def stage(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark stage.
+
+    The decorated function receives the payload generator, does any untimed
+    preparation and returns the zero-argument callable to be timed along with
+    the number of items it processes.
+    """
+
+    def register(setup: Setup) -> Setup:
+        STAGES[name] = setup
+        return setup
+
+    return register
+
+
+def _offline_client(gen: PayloadGenerator) -> Client:
+    mapping = gen.mapping()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=mapping))
+    client = Client(user_agent="osrs-prices-benchmarks/1.0", transport=transport)
+    client._get_mapping_lookup()  # Warm the lookup so only enrichment is timed
+    return client
+
+
+@stage("parse_mapping")
+def _parse_mapping(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    payload = gen.mapping()
+    return lambda: MappingResponse.from_list(payload), len(payload)
+
+
+@stage("parse_latest")
+def _parse_latest(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    payload = gen.latest()
+    return lambda: LatestResponse.from_api(payload), len(payload["data"])
+
+
+@stage("parse_5m")
+def _parse_5m(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    payload = gen.average("5m")
+    return lambda: AverageResponse.from_api(payload), len(payload["data"])
+
+
+@stage("enrich_latest")
+def _enrich_latest(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    client = _offline_client(gen)
+    latest = LatestResponse.from_api(gen.latest())
+    return lambda: client._enrich_latest_response(latest), len(latest.data)
+
+
+@stage("enrich_5m")
+def _enrich_5m(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    client = _offline_client(gen)
+    averages = AverageResponse.from_api(gen.average("5m"))
+    return lambda: client._enrich_average_response(averages), len(averages.data)
+
+
+@stage("mapping_to_df")
+def _mapping_df(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    mapping = MappingResponse.from_list(gen.mapping())
+    return lambda: to_dataframe(mapping), len(mapping.items)
+
+
+@stage("latest_to_df")
+def _latest_df(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    latest = LatestResponse.from_api(gen.latest())
+    return lambda: to_dataframe(latest), len(latest.data)
+
+
+@stage("5m_to_df")
+def _average_df(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    averages = AverageResponse.from_api(gen.average("5m"))
+    return lambda: to_dataframe(averages), len(averages.data)
+
+
+@stage("mapping_json_to_df")
+def _mapping_json_df(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    payload = gen.mapping()
+    return lambda: from_api(payload, "mapping"), len(payload)
+
+
+@stage("latest_json_to_df")
+def _latest_json_df(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    payload = gen.latest()
+    return lambda: from_api(payload, "latest"), len(payload["data"])
+
+
+@stage("5m_json_to_df")
+def _average_json_df(gen: PayloadGenerator) -> tuple[Callable[[], object], int]:
+    payload = gen.average("5m")
+    return lambda: from_api(payload, "5m"), len(payload["data"])
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of samples by linear interpolation."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def run_stage(func: Callable[[], object], items: int, repeat: int, warmup: int) -> dict[str, float]:
+    """Time func and measure its peak memory."""
+    for _ in range(warmup):
+        func()
+
+    gc.collect()
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+
+    # Trace memory in a separate run so tracemalloc overhead doesn't skew timings.
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    median = statistics.median(latencies)
+    return {
+        "items": items,
+        "p50_ms": median * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "items_per_sec": items / median,
+        "peak_mib": peak / 2**20,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[tuple[str, str, float]]:
+    """Return (stage, metric, ratio) for every metric that regressed past threshold."""
+    regressions = []
+    for name, result in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "peak_mib"):
+            if base[metric] <= 0:
+                continue
+            ratio = result[metric] / base[metric]
+            if ratio > 1 + threshold:
+                regressions.append((name, metric, ratio))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--items", type=int, default=4000, help="catalog size")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--stage", action="append", choices=sorted(STAGES), help="run only these")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown, e.g. 0.2 for 20%%"
+    )
+    args = parser.parse_args()
+
+    gen = PayloadGenerator(items=args.items, seed=0)
+    results: dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "items": args.items,
+            "repeat": args.repeat,
+        },
+        "stages": {},
+    }
+
+    print(
+        f"{'stage':<20} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'items/s':>12} {'peak MiB':>9}"
+    )
+    for name in args.stage or STAGES:
+        func, items = STAGES[name](gen)
+        r = results["stages"][name] = run_stage(func, items, args.repeat, args.warmup)
+        print(
+            f"{name:<20} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+            f"{r['items_per_sec']:>12,.0f} {r['peak_mib']:>9.1f}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["meta"].get("items") != args.items:
+        print(f"baseline was recorded with --items {baseline['meta'].get('items')}; skipping")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, ratio in regressions:
+        print(f"REGRESSION {name} {metric}: {ratio:.2f}x baseline")
+    if regressions:
+        sys.exit(1)
+    print(f"no regressions beyond {args.threshold:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Load-test Client against a local stand-in for the prices API.
+
+Starts a stand-in API server in a separate process, serving synthetic
+payloads with configurable latency, jitter and injected 429/5xx errors,
+then drives `Client` from N threads for a fixed duration. Reports
+throughput, latency percentiles, outcomes, client CPU time per request and
+GC pauses in the client process.
+
+Run with:
+    uv run python benchmarks/load_harness.py --threads 32 --duration 10
+    uv run python benchmarks/load_harness.py --endpoint mapping --items 40000 \\
+        --latency 20 --jitter 10 --rate-429 0.01 --rate-5xx 0.005 --max-connections 10
+
+By default all threads share one Client (and so one connection pool); use
+--client-per-thread to give each thread its own.
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import httpx
+from bench_suite import percentile
+
+from osrs_prices import APIError, Client, RateLimitError
+from osrs_prices.synthetic import PayloadGenerator
+
+ENDPOINTS: dict[str, Callable[[Client, int], object]] = {
+    "latest": lambda client, _: client.get_latest(),
+    "5m": lambda client, _: client.get_5m_average(),
+    "1h": lambda client, _: client.get_1h_average(),
+    # The mapping is cached by the client, so bypass it to measure requests.
+    "mapping": lambda client, _: client.get_mapping(force_refresh=True),
+    "timeseries": lambda client, item_id: client.get_timeseries(item_id, "5m"),
+}
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    """Behaviour of the stand-in API server."""
+
+    items: int = 4000
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    seed: int = 0
+
+
+class StandInServer(ThreadingHTTPServer):
+    """HTTP server that mimics the prices API with synthetic payloads."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, config: StandInConfig, port: int = 0) -> None:
+        """Render the payloads and bind to localhost."""
+        gen = PayloadGenerator(items=config.items, seed=config.seed)
+        self.config = config
+        self.item_id = gen.item_ids[0]
+        self.bodies = {
+            "/latest": json.dumps(gen.latest()).encode(),
+            "/5m": json.dumps(gen.average("5m")).encode(),
+            "/1h": json.dumps(gen.average("1h")).encode(),
+            "/mapping": json.dumps(gen.mapping()).encode(),
+            "/timeseries": json.dumps(gen.timeseries(self.item_id)).encode(),
+        }
+        super().__init__(("127.0.0.1", port), _StandInHandler)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: StandInServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this every kept-alive
+    # response waits about 40 ms for a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        config = self.server.config
+        delay = config.latency + random.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        roll = random.random()
+        body = self.server.bodies.get(urlsplit(self.path).path)
+        if body is None:
+            status, body = 404, b'{"error": "not found"}'
+        elif roll < config.rate_429:
+            status, body = 429, b'{"error": "rate limited"}'
+        elif roll < config.rate_429 + config.rate_5xx:
+            status, body = 503, b'{"error": "unavailable"}'
+        else:
+            status = 200
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve(config: StandInConfig, ready: "multiprocessing.Queue[tuple[int, int]]") -> None:
+    server = StandInServer(config)
+    ready.put((server.server_address[1], server.item_id))
+    server.serve_forever()
+
+
+class _GCTimer:
+    """Records the duration of every garbage collection."""
+
+    def __init__(self) -> None:
+        self.pauses: list[float] = []
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self._start)
+
+
+def drive(
+    make_client: Callable[[], Client],
+    call: Callable[[Client, int], object],
+    item_id: int,
+    threads: int,
+    duration: float,
+    shared: bool,
+) -> tuple[list[float], Counter[str]]:
+    """Call the endpoint from `threads` threads until `duration` elapses.
+
+    Returns:
+        Latencies of successful calls and a count of outcomes.
+    """
+    shared_client = make_client() if shared else None
+    latencies: list[list[float]] = [[] for _ in range(threads)]
+    outcomes: list[Counter[str]] = [Counter() for _ in range(threads)]
+    start_barrier = threading.Barrier(threads + 1)
+    deadline = 0.0
+
+    def worker(index: int) -> None:
+        client = shared_client or make_client()
+        mine, counts = latencies[index], outcomes[index]
+        start_barrier.wait()
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                call(client, item_id)
+            except RateLimitError:
+                counts["429"] += 1
+            except APIError as exc:
+                counts[str(exc.status_code)] += 1
+            except httpx.HTTPError as exc:
+                counts[type(exc).__name__] += 1
+            else:
+                counts["ok"] += 1
+                mine.append(time.perf_counter() - start)
+        if not shared:
+            client.close()
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    deadline = time.perf_counter() + duration
+    start_barrier.wait()
+    for thread in workers:
+        thread.join()
+    if shared_client is not None:
+        shared_client.close()
+
+    return [x for per_thread in latencies for x in per_thread], sum(outcomes, Counter())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="latest")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--items", type=int, default=4000, help="payload item count")
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- latency jitter in ms")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of 429s")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="fraction of 503s")
+    parser.add_argument("--max-connections", type=int, help="client connection pool size")
+    parser.add_argument("--client-per-thread", action="store_true")
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        items=args.items,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+    )
+    ctx = multiprocessing.get_context("spawn")
+    ready: multiprocessing.Queue[tuple[int, int]] = ctx.Queue()
+    server = ctx.Process(target=_serve, args=(config, ready), daemon=True)
+    server.start()
+    port, item_id = ready.get(timeout=60)
+
+    limits = None
+    if args.max_connections:
+        limits = httpx.Limits(
+            max_connections=args.max_connections, max_keepalive_connections=args.max_connections
+        )
+
+    def make_client() -> Client:
+        return Client(
+            user_agent="osrs-prices-load-harness/1.0",
+            base_url=f"http://127.0.0.1:{port}",
+            limits=limits,
+        )
+
+    gc_timer = _GCTimer()
+    gc.callbacks.append(gc_timer)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    try:
+        latencies, outcomes = drive(
+            make_client,
+            ENDPOINTS[args.endpoint],
+            item_id,
+            args.threads,
+            args.duration,
+            shared=not args.client_per_thread,
+        )
+    finally:
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        gc.callbacks.remove(gc_timer)
+        server.terminate()
+
+    total = sum(outcomes.values())
+    print(f"endpoint /{args.endpoint}, {args.items} items, {args.threads} threads, {wall:.1f}s")
+    print(f"requests      {total:,} ({total / wall:,.0f}/s)")
+    for outcome, count in sorted(outcomes.items()):
+        print(f"  {outcome:<12}{count:>8,} ({count / max(total, 1):.2%})")
+    if latencies:
+        print(
+            "latency ms    "
+            f"p50 {percentile(latencies, 50) * 1000:.2f}  "
+            f"p95 {percentile(latencies, 95) * 1000:.2f}  "
+            f"p99 {percentile(latencies, 99) * 1000:.2f}  "
+            f"max {max(latencies) * 1000:.2f}"
+        )
+    print(f"client CPU    {cpu / max(total, 1) * 1000:.3f} ms/request ({cpu / wall:.0%} of a core)")
+    if gc_timer.pauses:
+        print(
+            f"GC pauses     {len(gc_timer.pauses)} totalling {sum(gc_timer.pauses) * 1000:.1f} ms, "
+            f"max {max(gc_timer.pauses) * 1000:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,84 @@
 """OSRS Prices - Python client for the OSRS Real-time Prices API."""
 
-from osrs_prices.client import Client
-from osrs_prices.exceptions import APIError, OSRSPricesError, RateLimitError, ValidationError
-from osrs_prices.models import (
-    AveragePrice,
-    AverageResponse,
-    EnrichedAveragePrice,
-    EnrichedAverageResponse,
-    EnrichedLatestPrice,
-    EnrichedLatestResponse,
-    EnrichedTimeseriesResponse,
-    ItemMapping,
-    LatestPrice,
-    LatestResponse,
-    MappingResponse,
-    Timestep,
-    TimeseriesDataPoint,
-    TimeseriesResponse,
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from osrs_prices.exceptions import (
+    APIError,
+    CodecError,
+    OSRSPricesError,
+    RateLimitError,
+    ValidationError,
 )
 
+if TYPE_CHECKING:
+    from osrs_prices.client import Client
+    from osrs_prices.hooks import Hooks, RequestEvent
+    from osrs_prices.models import (
+        AveragePrice,
+        AverageResponse,
+        EnrichedAveragePrice,
+        EnrichedAverageResponse,
+        EnrichedLatestPrice,
+        EnrichedLatestResponse,
+        EnrichedTimeseriesResponse,
+        ItemMapping,
+        LatestPrice,
+        LatestResponse,
+        MappingResponse,
+        Timestep,
+        TimeseriesDataPoint,
+        TimeseriesResponse,
+    )
+
+# Public names loaded on first access, so that `import osrs_prices` does not
+# pull in httpx and pydantic until they are needed.
+_LAZY = {
+    "Client": "osrs_prices.client",
+    "Hooks": "osrs_prices.hooks",
+    "RequestEvent": "osrs_prices.hooks",
+    "AveragePrice": "osrs_prices.models",
+    "AverageResponse": "osrs_prices.models",
+    "EnrichedAveragePrice": "osrs_prices.models",
+    "EnrichedAverageResponse": "osrs_prices.models",
+    "EnrichedLatestPrice": "osrs_prices.models",
+    "EnrichedLatestResponse": "osrs_prices.models",
+    "EnrichedTimeseriesResponse": "osrs_prices.models",
+    "ItemMapping": "osrs_prices.models",
+    "LatestPrice": "osrs_prices.models",
+    "LatestResponse": "osrs_prices.models",
+    "MappingResponse": "osrs_prices.models",
+    "Timestep": "osrs_prices.models",
+    "TimeseriesDataPoint": "osrs_prices.models",
+    "TimeseriesResponse": "osrs_prices.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
 __all__ = [
     # Client
     "Client",
     # Exceptions
     "APIError",
+    "CodecError",
     "OSRSPricesError",
     "RateLimitError",
     "ValidationError",
+    # Hooks
+    "Hooks",
+    "RequestEvent",
     # Models
     "AveragePrice",
     "AverageResponse",
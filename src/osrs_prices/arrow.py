@@ -0,0 +1,120 @@
+"""Apache Arrow conversion utilities for OSRS Prices API responses.
+
+Tables are built column by column from the same single pass over the response
+as `osrs_prices.pandas`, with one Arrow array per column and no pandas in
+between, so they can be handed to DuckDB, Polars or Parquet without a copy.
+`from_api` builds the same tables straight from decoded JSON.
+
+Unlike the default DataFrames, integer columns are nullable: a missing price is
+null rather than NaN in a float column. The row index becomes the first
+column ("id", "item_id" or "timestamp"), and response-level values such as an
+average's `timestamp` are stored as JSON in the schema metadata.
+"""
+
+import json
+from typing import Any
+
+import pyarrow as pa
+
+from osrs_prices.columns import (
+    BOOL_COLUMNS,
+    STRING_COLUMNS,
+    TIME_COLUMNS,
+    Columns,
+    Response,
+    ResponseKind,
+    from_json,
+    from_response,
+)
+
+_TIMESTAMP = pa.timestamp("s", tz="UTC")
+
+
+def to_arrow(response: Response, datetimes: bool = False) -> pa.Table:
+    """Convert an API response to an Arrow table.
+
+    Args:
+        response: Any of the API response types, plain or enriched.
+        datetimes: If True, the `high_time` and `low_time` columns hold UTC
+            timestamps instead of Unix seconds.
+
+    Returns:
+        An Arrow table with the response data.
+
+    Raises:
+        TypeError: If the response type is not supported.
+
+    Examples:
+        >>> from osrs_prices import Client
+        >>> from osrs_prices.arrow import to_arrow
+        >>> with Client(user_agent="my-app/1.0") as client:
+        ...     table = to_arrow(client.get_latest_with_mapping())
+        >>> duckdb.sql("SELECT name, high FROM table ORDER BY high DESC LIMIT 10")
+    """
+    return from_columns(from_response(response), datetimes)
+
+
+def from_api(data: Any, kind: ResponseKind, datetimes: bool = False) -> pa.Table:
+    """Convert decoded API JSON to an Arrow table without building models.
+
+    The result matches `to_arrow` on the parsed response. The JSON is not
+    validated, so this is best suited to trusted sources such as the API
+    itself, a proxy or a recorded cassette.
+
+    Args:
+        data: The decoded JSON body of a response.
+        kind: Which endpoint the body came from: "mapping", "latest", "5m",
+            "1h" or "timeseries".
+        datetimes: If True, the `high_time` and `low_time` columns hold UTC
+            timestamps instead of Unix seconds.
+
+    Returns:
+        An Arrow table with the response data.
+
+    Raises:
+        ValueError: If kind is not supported.
+    """
+    return from_columns(from_json(data, kind), datetimes)
+
+
+def metadata(table: pa.Table) -> dict[str, Any]:
+    """Return the response-level values stored in a table's schema metadata.
+
+    Args:
+        table: A table built by `to_arrow` or `from_api`.
+
+    Returns:
+        The values, e.g. `{"timestamp": 1704067200}` for an average.
+    """
+    return {key.decode(): json.loads(value) for key, value in (table.schema.metadata or {}).items()}
+
+
+def from_columns(table: Columns, datetimes: bool = False) -> pa.Table:
+    """Build an Arrow table from columns extracted by `osrs_prices.columns`.
+
+    Args:
+        table: The columns of a response.
+        datetimes: If True, the `high_time` and `low_time` columns hold UTC
+            timestamps instead of Unix seconds.
+
+    Returns:
+        An Arrow table with the index as its first column.
+    """
+    index_type = _TIMESTAMP if table.index_name == "timestamp" else pa.int64()
+    names = [table.index_name, *table.columns]
+    arrays = [pa.array(table.index, type=index_type)]
+    arrays.extend(
+        pa.array(values, type=_type(column, datetimes)) for column, values in table.columns.items()
+    )
+    attrs = {key: json.dumps(value) for key, value in table.attrs.items()}
+    return pa.Table.from_arrays(arrays, names=names, metadata=attrs or None)
+
+
+def _type(column: str, datetimes: bool) -> pa.DataType:
+    if column in BOOL_COLUMNS:
+        return pa.bool_()
+    if column in STRING_COLUMNS:
+        return pa.string()
+    if datetimes and column in TIME_COLUMNS:
+        return _TIMESTAMP
+    return pa.int64()
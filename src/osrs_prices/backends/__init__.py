@@ -0,0 +1,40 @@
+"""Cache backends for sharing API responses between clients and processes."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from osrs_prices.backends.base import CacheBackend
+
+if TYPE_CHECKING:
+    from osrs_prices.backends.daemon import DaemonBackend
+    from osrs_prices.backends.memory import MemoryBackend
+    from osrs_prices.backends.sqlite import SQLiteBackend
+
+# Backends are imported on first access, so that clients which only need the
+# CacheBackend protocol do not load sqlite3 or socketserver.
+_LAZY = {
+    "DaemonBackend": "osrs_prices.backends.daemon",
+    "MemoryBackend": "osrs_prices.backends.memory",
+    "SQLiteBackend": "osrs_prices.backends.sqlite",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+__all__ = [
+    "CacheBackend",
+    "DaemonBackend",
+    "MemoryBackend",
+    "SQLiteBackend",
+]
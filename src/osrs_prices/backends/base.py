@@ -0,0 +1,34 @@
+"""Cache backend protocol."""
+
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Protocol for key-value stores that cache raw API response bodies.
+
+    Values are bytes so that backends can be shared between processes. A TTL
+    of None means the entry never expires.
+    """
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value, replacing any existing one."""
+        ...
+
+    def delete(self, key: str) -> bool:
+        """Remove a value. Returns True if it was present."""
+        ...
+
+    def compare_and_set(
+        self, key: str, expected: bytes | None, value: bytes, ttl: float | None = None
+    ) -> bool:
+        """Atomically store value only if the current value equals expected.
+
+        An expected value of None means the key must be missing or expired.
+        Returns True if the value was stored.
+        """
+        ...
@@ -0,0 +1,305 @@
+"""Local cache daemon serving a shared cache over a Unix socket.
+
+Start the daemon once per user on a host:
+
+    python -m osrs_prices.backends.daemon
+
+and point every process at it with `DaemonBackend()`. Both default to
+`DEFAULT_SOCKET_PATH`, a socket in a directory only the current user can
+access: `$XDG_RUNTIME_DIR` when set, otherwise a per-user directory under the
+system temporary directory. The socket itself is readable and writable only by
+its owner. The daemon keeps entries in a `MemoryBackend` and purges expired
+ones periodically; a restart empties the cache.
+"""
+
+import argparse
+import errno
+import math
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+import time
+
+from osrs_prices.backends.memory import MemoryBackend
+
+
+def _uid() -> int | None:
+    getuid = getattr(os, "getuid", None)
+    return None if getuid is None else int(getuid())
+
+
+def _user_temp_dir() -> str:
+    uid = _uid()
+    user = os.environ.get("USERNAME", "user") if uid is None else str(uid)
+    return os.path.join(tempfile.gettempdir(), f"osrs-prices-{user}")
+
+
+def _default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or _user_temp_dir()
+    return os.path.join(runtime_dir, "osrs-prices.sock")
+
+
+DEFAULT_SOCKET_PATH = _default_socket_path()
+
+_GET = 1
+_SET = 2
+_DELETE = 3
+_CAS = 4
+
+_NONE = 0xFFFFFFFF
+
+# op, ttl (NaN for none), key length, expected length (_NONE for none), value length
+_REQUEST = struct.Struct("!BdIII")
+# status, value length (_NONE for none)
+_RESPONSE = struct.Struct("!BI")
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Cache daemon connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _encode_ttl(ttl: float | None) -> float:
+    return math.nan if ttl is None else ttl
+
+
+def _decode_ttl(ttl: float) -> float | None:
+    return None if math.isnan(ttl) else ttl
+
+
+class DaemonBackend:
+    """A cache backend that talks to the local cache daemon.
+
+    Each thread keeps its own connection. If a reused connection has been
+    dropped before a request is sent, it is re-established and the request
+    sent once more. A failure after the request was sent is raised as is,
+    since the daemon may already have applied it.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str] = DEFAULT_SOCKET_PATH, timeout: float = 1.0
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            path: Path of the daemon's Unix socket.
+            timeout: Socket timeout in seconds.
+        """
+        self._path = os.fspath(path)
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _socket(self) -> socket.socket:
+        sock: socket.socket | None = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self._timeout)
+            sock.connect(self._path)
+            self._local.sock = sock
+        return sock
+
+    def _call(
+        self,
+        op: int,
+        key: str,
+        expected: bytes | None = None,
+        value: bytes = b"",
+        ttl: float | None = None,
+    ) -> tuple[bool, bytes | None]:
+        key_bytes = key.encode()
+        header = _REQUEST.pack(
+            op,
+            _encode_ttl(ttl),
+            len(key_bytes),
+            _NONE if expected is None else len(expected),
+            len(value),
+        )
+        message = b"".join((header, key_bytes, expected or b"", value))
+
+        reused = getattr(self._local, "sock", None) is not None
+        try:
+            sock = self._socket()
+            sock.sendall(message)
+        except OSError:
+            self.close()
+            if not reused:
+                raise
+            sock = self._socket()
+            sock.sendall(message)
+        try:
+            status, size = _RESPONSE.unpack(_recv_exactly(sock, _RESPONSE.size))
+            payload = None if size == _NONE else _recv_exactly(sock, size)
+        except OSError:
+            self.close()
+            raise
+        return bool(status), payload
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None if missing or expired."""
+        return self._call(_GET, key)[1]
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value, replacing any existing one."""
+        self._call(_SET, key, value=value, ttl=ttl)
+
+    def delete(self, key: str) -> bool:
+        """Remove a value. Returns True if it was present."""
+        return self._call(_DELETE, key)[0]
+
+    def compare_and_set(
+        self, key: str, expected: bytes | None, value: bytes, ttl: float | None = None
+    ) -> bool:
+        """Atomically store value only if the current value equals expected."""
+        return self._call(_CAS, key, expected=expected, value=value, ttl=ttl)[0]
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        sock: socket.socket | None = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "CacheDaemon"
+
+    def handle(self) -> None:
+        backend = self.server.backend
+        sock = self.request
+        while True:
+            # A client that disconnects mid-message sent nothing to apply.
+            try:
+                header = _recv_exactly(sock, _REQUEST.size)
+                op, ttl, key_size, expected_size, value_size = _REQUEST.unpack(header)
+                key = _recv_exactly(sock, key_size).decode()
+                expected = None if expected_size == _NONE else _recv_exactly(sock, expected_size)
+                value = _recv_exactly(sock, value_size)
+            except OSError:
+                return
+
+            status, payload = True, None
+            if op == _GET:
+                payload = backend.get(key)
+                status = payload is not None
+            elif op == _SET:
+                backend.set(key, value, _decode_ttl(ttl))
+            elif op == _DELETE:
+                status = backend.delete(key)
+            elif op == _CAS:
+                status = backend.compare_and_set(key, expected, value, _decode_ttl(ttl))
+            else:
+                return
+
+            size = _NONE if payload is None else len(payload)
+            try:
+                sock.sendall(_RESPONSE.pack(status, size) + (payload or b""))
+            except OSError:
+                return
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket file left behind by a daemon that is no longer running.
+
+    Raises:
+        FileExistsError: If path is not a socket owned by the current user.
+        OSError: If a daemon is still listening on it.
+    """
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return
+    uid = _uid()
+    if not stat.S_ISSOCK(info.st_mode) or (uid is not None and info.st_uid != uid):
+        raise FileExistsError(errno.EEXIST, "Not a socket owned by the current user", path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise OSError(errno.EADDRINUSE, "A cache daemon is already listening", path)
+
+
+class CacheDaemon(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix socket server exposing a MemoryBackend."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = DEFAULT_SOCKET_PATH,
+        backend: MemoryBackend | None = None,
+        purge_interval: float = 60.0,
+    ) -> None:
+        """Bind the daemon to a Unix socket, replacing a stale socket file.
+
+        The socket's directory is created private to the current user if
+        missing, and the socket is made accessible only to its owner. A socket
+        file is replaced only if the current user owns it and no daemon is
+        listening on it.
+
+        Args:
+            path: Path of the Unix socket to listen on.
+            backend: The store to serve. A new MemoryBackend by default.
+            purge_interval: Seconds between purges of expired entries while
+                serving.
+        """
+        path = os.fspath(path)
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.realpath(directory) == os.path.realpath(_user_temp_dir()):
+            # Anyone can create this directory first in a shared temp directory.
+            info = os.lstat(directory)
+            uid = _uid()
+            if uid is not None and (info.st_uid != uid or info.st_mode & 0o077):
+                raise PermissionError(
+                    errno.EPERM, "Socket directory is not private to the current user", directory
+                )
+        _remove_stale_socket(path)
+        self._path = path
+        self.backend = MemoryBackend() if backend is None else backend
+        self._purge_interval = purge_interval
+        self._next_purge = time.monotonic() + purge_interval
+        super().__init__(path, _Handler)
+
+    def server_bind(self) -> None:
+        """Bind the socket and restrict it to the current user."""
+        super().server_bind()
+        os.chmod(self._path, 0o600)
+
+    def service_actions(self) -> None:
+        """Purge expired entries every `purge_interval` seconds."""
+        now = time.monotonic()
+        if now >= self._next_purge:
+            self.backend.purge_expired()
+            self._next_purge = now + self._purge_interval
+
+
+def main() -> None:
+    """Run the cache daemon until interrupted."""
+    parser = argparse.ArgumentParser(description="Run the osrs_prices cache daemon.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    args = parser.parse_args()
+
+    with CacheDaemon(args.socket) as server:
+        print(f"osrs_prices cache daemon listening on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""In-process cache backend."""
+
+import threading
+import time
+
+
+class MemoryBackend:
+    """A thread-safe in-memory cache backend.
+
+    Useful on its own to share cached responses between clients in one process,
+    and as the store behind the cache daemon. Expired entries are dropped when
+    read, and all of them at most every `purge_interval` seconds on write, so
+    keys that are never read again do not pile up.
+    """
+
+    def __init__(self, purge_interval: float | None = 60.0) -> None:
+        """Initialize the backend.
+
+        Args:
+            purge_interval: Minimum seconds between automatic purges of
+                expired entries. None disables them.
+        """
+        self._entries: dict[str, tuple[bytes, float | None]] = {}
+        self._lock = threading.Lock()
+        self._purge_interval = purge_interval
+        self._next_purge = time.monotonic() + (purge_interval or 0.0)
+
+    def _current(self, key: str, now: float) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if expiry is not None and now >= expiry:
+            del self._entries[key]
+            return None
+        return value
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None if missing or expired."""
+        with self._lock:
+            return self._current(key, time.monotonic())
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value, replacing any existing one."""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, None if ttl is None else now + ttl)
+            self._maybe_purge(now)
+
+    def delete(self, key: str) -> bool:
+        """Remove a value. Returns True if it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def compare_and_set(
+        self, key: str, expected: bytes | None, value: bytes, ttl: float | None = None
+    ) -> bool:
+        """Atomically store value only if the current value equals expected."""
+        now = time.monotonic()
+        with self._lock:
+            if self._current(key, now) != expected:
+                return False
+            self._entries[key] = (value, None if ttl is None else now + ttl)
+            self._maybe_purge(now)
+            return True
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        with self._lock:
+            return self._purge(time.monotonic())
+
+    def _maybe_purge(self, now: float) -> None:
+        if self._purge_interval is not None and now >= self._next_purge:
+            self._purge(now)
+
+    def _purge(self, now: float) -> int:
+        expired = [
+            key
+            for key, (_, expiry) in self._entries.items()
+            if expiry is not None and now >= expiry
+        ]
+        for key in expired:
+            del self._entries[key]
+        if self._purge_interval is not None:
+            self._next_purge = now + self._purge_interval
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,116 @@
+"""SQLite cache backend shared by processes on one host."""
+
+import os
+import sqlite3
+import threading
+import time
+
+
+class SQLiteBackend:
+    """A cache backend stored in a SQLite database in WAL mode.
+
+    Many processes can open the same database file: WAL mode lets readers
+    proceed while a writer commits. Each thread uses its own connection.
+    Expiry uses wall-clock time so it is consistent between processes.
+    Expired rows are skipped when read and deleted by `purge_expired`, which
+    writes also run at most every `purge_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        timeout: float = 5.0,
+        purge_interval: float | None = 300.0,
+    ) -> None:
+        """Initialize the backend, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            timeout: Seconds to wait for a lock held by another process.
+            purge_interval: Minimum seconds between automatic purges of
+                expired rows by this instance. None disables them.
+        """
+        self._path = os.fspath(path)
+        self._timeout = timeout
+        self._local = threading.local()
+        self._purge_interval = purge_interval
+        self._next_purge = time.monotonic() + (purge_interval or 0.0)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly where needed.
+            conn = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _expires(ttl: float | None) -> float | None:
+        return None if ttl is None else time.time() + ttl
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None if missing or expired."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return None if row is None else bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value, replacing any existing one."""
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+            (key, value, self._expires(ttl)),
+        )
+        if self._purge_interval is not None and time.monotonic() >= self._next_purge:
+            self.purge_expired()
+
+    def delete(self, key: str) -> bool:
+        """Remove a value. Returns True if it was present."""
+        cursor = self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def compare_and_set(
+        self, key: str, expected: bytes | None, value: bytes, ttl: float | None = None
+    ) -> bool:
+        """Atomically store value only if the current value equals expected."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = self.get(key)
+            if current != expected:
+                conn.execute("ROLLBACK")
+                return False
+            self.set(key, value, ttl)
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        if self._purge_interval is not None:
+            self._next_purge = time.monotonic() + self._purge_interval
+        cursor = self._connection().execute(
+            "DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (time.time(),)
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
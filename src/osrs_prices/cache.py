@@ -1,14 +1,37 @@
-"""Thread-safe TTL cache implementation."""
+"""Thread-safe cache implementations."""
 
+import itertools
+import sys
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from enum import Enum
 from typing import Generic, TypeVar
 
+from osrs_prices.constants import TIMESTEP_SECONDS
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.history import TimeseriesHistory
+from osrs_prices.models.timeseries import TimeseriesResponse, Timestep
+
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+class _Default(Enum):
+    """Marks an argument that was not given, where None has a meaning."""
+
+    TTL = "default"
 
 
 class TTLCache(Generic[T]):
-    """A simple thread-safe cache with time-to-live expiration."""
+    """A simple thread-safe cache with time-to-live expiration.
+
+    The value and its expiry are held together in one immutable tuple that
+    writers replace with a single attribute assignment, so readers see either
+    the old or the new entry and never need to take the lock.
+    """
 
     def __init__(self, ttl: float) -> None:
         """Initialize the cache.
@@ -17,8 +40,7 @@ class TTLCache(Generic[T]):
             ttl: Time-to-live in seconds for cached values.
         """
         self._ttl = ttl
-        self._value: T | None = None
-        self._expiry: float = 0.0
+        self._entry: tuple[T, float] | None = None
         self._lock = threading.Lock()
 
     def get(self) -> T | None:
@@ -27,10 +49,10 @@ class TTLCache(Generic[T]):
         Returns:
             The cached value, or None if expired or not set.
         """
-        with self._lock:
-            if self._value is not None and time.monotonic() < self._expiry:
-                return self._value
-            return None
+        entry = self._entry
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
 
     def set(self, value: T) -> None:
         """Set a value in the cache.
@@ -39,16 +61,330 @@ class TTLCache(Generic[T]):
             value: The value to cache.
         """
         with self._lock:
-            self._value = value
-            self._expiry = time.monotonic() + self._ttl
+            self._entry = (value, time.monotonic() + self._ttl)
 
     def invalidate(self) -> None:
         """Manually invalidate the cache."""
         with self._lock:
-            self._value = None
-            self._expiry = 0.0
+            self._entry = None
 
     @property
     def ttl(self) -> float:
         """Return the TTL setting."""
         return self._ttl
+
+
+class TimeseriesCache:
+    """A thread-safe cache of merged timeseries history.
+
+    Entries are keyed by (item_id, timestep) and expire at the next bucket
+    boundary for their timestep, when the API can first have a new point.
+    The API publishes a bucket shortly after it closes, so an entry that
+    lacks the newest closed bucket expires after `retry_interval` instead.
+    Expired entries keep their history so a refresh only appends new points.
+    Histories are returned as copies, so callers never see a later merge.
+    """
+
+    def __init__(self, retry_interval: float = 30.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            retry_interval: Seconds until an entry that lacks the newest
+                closed bucket is refreshed.
+        """
+        self._entries: dict[tuple[int, str], tuple[TimeseriesHistory, float]] = {}
+        self._lock = threading.Lock()
+        self._retry_interval = retry_interval
+
+    def get(self, item_id: int, timestep: Timestep) -> TimeseriesHistory | None:
+        """Get the history for an item if it hasn't expired.
+
+        Returns:
+            A copy of the cached history, or None if expired or not set.
+        """
+        with self._lock:
+            entry = self._entries.get((item_id, timestep))
+            if entry is not None and time.time() < entry[1]:
+                return entry[0].copy()
+            return None
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether (item_id, timestep) has history, expired or not."""
+        with self._lock:
+            return key in self._entries
+
+    def merge(
+        self, response: TimeseriesResponse, timestep: Timestep, item_id: int | None = None
+    ) -> TimeseriesHistory:
+        """Merge a fresh response into the cached history and reset its expiry.
+
+        Args:
+            response: A response fetched from the API.
+            timestep: The timestep the response was fetched with.
+            item_id: The item the response was requested for. Defaults to the
+                response's item_id.
+
+        Returns:
+            A copy of the merged history.
+
+        Raises:
+            ValidationError: If neither item_id nor the response's item_id is set.
+        """
+        if item_id is None:
+            item_id = response.item_id
+        if item_id is None:
+            raise ValidationError("Cannot cache a TimeseriesResponse without item_id")
+        key = (item_id, timestep)
+        with self._lock:
+            entry = self._entries.get(key)
+            history = entry[0] if entry is not None else TimeseriesHistory(*key)
+            history.merge(response.data)
+            now = time.time()
+            step = TIMESTEP_SECONDS[timestep]
+            expiry = (now // step + 1) * step
+            newest_closed = (now // step - 1) * step
+            tail = history.tail
+            if tail is None or tail < newest_closed:
+                expiry = min(expiry, now + self._retry_interval)
+            self._entries[key] = (history, expiry)
+            return history.copy()
+
+    def invalidate(self) -> None:
+        """Manually invalidate the cache, discarding all history."""
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How an endpoint's responses are stored in a shared response cache.
+
+    Attributes:
+        ttl: Time-to-live in seconds for cached responses. None never expires.
+    """
+
+    ttl: float | None
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A point-in-time snapshot of cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Shard(Generic[K, T]):
+    """One independently locked partition of an LRUCache."""
+
+    __slots__ = ("bytes", "entries", "evictions", "expirations", "hits", "lock", "misses")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> (value, expiry or None, size in bytes, last-use tick)
+        self.entries: OrderedDict[K, tuple[T, float | None, int, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+class LRUCache(Generic[K, T]):
+    """A bounded, thread-safe keyed cache with per-entry TTL.
+
+    Entries are evicted least-recently-used first once either the entry limit or
+    the approximate byte budget is exceeded. Keys are spread over independently
+    locked shards so concurrent lookups for different keys rarely contend. The
+    limits apply to the cache as a whole: each entry records when it was last
+    used, and eviction removes the oldest entry across all shards.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[T], int] | None = None,
+        shards: int = 8,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries held.
+            max_bytes: Optional approximate memory budget in bytes.
+            ttl: Default time-to-live in seconds for entries. None never expires.
+            sizeof: Function estimating an entry's size in bytes, used when `set`
+                   is not given an explicit size. Defaults to `sys.getsizeof`.
+            shards: Number of independently locked partitions.
+
+        Raises:
+            ValidationError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValidationError("max_entries must be at least 1")
+        shards = max(1, min(shards, max_entries))
+        self._shards = [_Shard[K, T]() for _ in range(shards)]
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._sizeof: Callable[[T], int] = sizeof or sys.getsizeof
+        # Cache-wide totals. Taken after a shard lock, never before one.
+        self._lock = threading.Lock()
+        self._entries = 0
+        self._bytes = 0
+        self._ticks = itertools.count()
+
+    def _shard(self, key: K) -> _Shard[K, T]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _account(self, entries: int, size: int) -> None:
+        with self._lock:
+            self._entries += entries
+            self._bytes += size
+
+    def _over_limit(self) -> bool:
+        with self._lock:
+            return self._entries > self._max_entries or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            )
+
+    def _evict(self) -> None:
+        """Evict least-recently-used entries until the cache is within its limits."""
+        while self._over_limit():
+            # Each shard's first entry is its least recently used; the oldest of
+            # those is the least recently used entry of the whole cache.
+            victim: _Shard[K, T] | None = None
+            oldest = 0
+            for shard in self._shards:
+                with shard.lock:
+                    if shard.entries:
+                        tick = next(iter(shard.entries.values()))[3]
+                        if victim is None or tick < oldest:
+                            victim, oldest = shard, tick
+            if victim is None:
+                return
+            with victim.lock:
+                if not victim.entries:
+                    continue
+                _, (_, _, size, _) = victim.entries.popitem(last=False)
+                victim.bytes -= size
+                victim.evictions += 1
+                self._account(-1, -size)
+
+    def get(self, key: K) -> T | None:
+        """Get a cached value if it exists and hasn't expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if expired or not set.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                return None
+            value, expiry, size, _ = entry
+            if expiry is not None and time.monotonic() >= expiry:
+                del shard.entries[key]
+                shard.bytes -= size
+                shard.expirations += 1
+                shard.misses += 1
+                self._account(-1, -size)
+                return None
+            shard.entries[key] = (value, expiry, size, next(self._ticks))
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def set(
+        self,
+        key: K,
+        value: T,
+        ttl: float | None | _Default = _Default.TTL,
+        size: int | None = None,
+    ) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: Time-to-live in seconds. None never expires. Defaults to the
+                cache's TTL.
+            size: Approximate size of the value in bytes. Estimated if omitted.
+        """
+        if ttl is _Default.TTL:
+            ttl = self._ttl
+        expiry = None if ttl is None else time.monotonic() + ttl
+        size = self._sizeof(value) if size is None else size
+
+        shard = self._shard(key)
+        with shard.lock:
+            old = shard.entries.pop(key, None)
+            if old is not None:
+                shard.bytes -= old[2]
+                self._account(-1, -old[2])
+            if self._max_bytes is not None and size > self._max_bytes:
+                # Never admit a value that would evict everything else.
+                shard.evictions += 1
+                return
+            shard.entries[key] = (value, expiry, size, next(self._ticks))
+            shard.bytes += size
+            self._account(1, size)
+        self._evict()
+
+    def delete(self, key: K) -> bool:
+        """Remove a value from the cache.
+
+        Returns:
+            True if the key was present.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.pop(key, None)
+            if entry is None:
+                return False
+            shard.bytes -= entry[2]
+            self._account(-1, -entry[2])
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries. Statistics are kept."""
+        for shard in self._shards:
+            with shard.lock:
+                self._account(-len(shard.entries), -shard.bytes)
+                shard.entries.clear()
+                shard.bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return aggregated hit, miss, eviction and size statistics."""
+        totals = [0, 0, 0, 0, 0, 0]
+        for shard in self._shards:
+            with shard.lock:
+                counts = (
+                    shard.hits,
+                    shard.misses,
+                    shard.evictions,
+                    shard.expirations,
+                    len(shard.entries),
+                    shard.bytes,
+                )
+            totals = [a + b for a, b in zip(totals, counts)]
+        return CacheStats(*totals)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._entries
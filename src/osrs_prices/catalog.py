@@ -0,0 +1,358 @@
+"""A read-only item catalog shared between processes.
+
+One process publishes the mapping into a `multiprocessing.shared_memory`
+block, and any process on the same host attaches to it by name. Attached
+processes read items straight from the shared block, so they neither parse
+the mapping nor hold their own copy of it:
+
+    >>> with Client(user_agent="my-app/1.0") as client:
+    ...     catalog = SharedCatalog.publish(client.get_mapping())
+    >>> catalog.name
+    'psm_1a2b3c4d'
+
+    >>> # In another process
+    >>> with SharedCatalog.attach("psm_1a2b3c4d") as catalog:
+    ...     catalog[4151].name
+    'Abyssal whip'
+
+The block holds fixed-width columns for ids, membership, alch values, buy
+limits and store value, a dense index from item id to row for O(1) lookups,
+and a UTF-8 string table of item names. Examine text and icons are not
+included. Numbers are stored in native byte order, so the block is only
+meant to be shared between processes on one host.
+
+The publisher owns the block: it should stay open while other processes
+use it, and `unlink()` removes it once every process is done.
+"""
+
+import os
+import struct
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import Literal, TypeVar
+
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models.items import MappingResponse
+
+MAGIC = b"OSRSCAT\x00"
+VERSION = 1
+
+# magic, version, item count, highest item id, string table size
+_HEADER = struct.Struct("=8sIIII")
+_MISSING = -1
+_INT32_MAX = 2**31 - 1
+
+# Blocks published by this process, which its resource tracker must keep.
+_published: set[str] = set()
+
+_C = TypeVar("_C", bound="SharedCatalog")
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogItem:
+    """An item read from a shared catalog.
+
+    Attributes:
+        id: The item ID.
+        name: The item name.
+        members: Whether the item is members-only.
+        lowalch: Low alchemy value, if any.
+        highalch: High alchemy value, if any.
+        limit: Grand Exchange buy limit, if known.
+        value: Store value, if any.
+    """
+
+    id: int
+    name: str
+    members: bool
+    lowalch: int | None
+    highalch: int | None
+    limit: int | None
+    value: int | None
+
+
+def _layout(count: int, max_id: int) -> dict[str, tuple[int, int]]:
+    """Return the (offset, length) in bytes of each section of the block."""
+    sizes = {
+        "ids": 4 * count,
+        "lowalch": 4 * count,
+        "highalch": 4 * count,
+        "limit": 4 * count,
+        "value": 4 * count,
+        "name_offsets": 4 * (count + 1),
+        "index": 4 * (max_id + 1),
+        "members": count,
+    }
+    layout = {}
+    offset = _HEADER.size
+    for section, size in sizes.items():
+        layout[section] = (offset, size)
+        offset += (size + 7) & ~7
+    layout["strings"] = (offset, 0)
+    return layout
+
+
+def _int32(value: int | None, field: str, item_id: int) -> int:
+    if value is None:
+        return _MISSING
+    if not 0 <= value <= _INT32_MAX:
+        raise ValidationError(f"Item {item_id} {field} {value} does not fit in the catalog")
+    return value
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block without registering it for cleanup at exit."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    shm = shared_memory.SharedMemory(name)
+    # Before 3.13 the resource tracker would unlink the block when this
+    # process exits, removing it for every other process too.
+    if os.name == "posix" and shm.name not in _published:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class SharedCatalog:
+    """Item metadata in a shared memory block, readable from any process.
+
+    Create one with `publish` or `attach` rather than directly.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        """Map the columns of a catalog block.
+
+        Args:
+            shm: The shared memory block holding a published catalog.
+            owner: Whether this process published the block.
+
+        Raises:
+            ValidationError: If the block does not hold a catalog of a
+                supported version.
+        """
+        self._shm = shm
+        self._owner = owner
+        buf = shm.buf
+        if buf is None or len(buf) < _HEADER.size:
+            raise ValidationError(f"Shared memory block {shm.name!r} is not an item catalog")
+        magic, version, count, max_id, strings_size = _HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValidationError(f"Shared memory block {shm.name!r} is not an item catalog")
+        if version != VERSION:
+            raise ValidationError(f"Unsupported catalog version: {version}")
+        self._count: int = count
+        self._max_id: int = max_id
+
+        self._buf = buf.toreadonly()
+        layout = _layout(count, max_id)
+        self._views: list[memoryview] = [self._buf]
+
+        def column(section: str, fmt: Literal["i", "I", "B"]) -> "memoryview[int]":
+            offset, size = layout[section]
+            view = self._buf[offset : offset + size].cast(fmt)
+            self._views.append(view)
+            return view
+
+        self._ids = column("ids", "i")
+        self._lowalch = column("lowalch", "i")
+        self._highalch = column("highalch", "i")
+        self._limit = column("limit", "i")
+        self._value = column("value", "i")
+        self._name_offsets = column("name_offsets", "I")
+        self._index = column("index", "i")
+        self._members = column("members", "B")
+        start = layout["strings"][0]
+        self._strings = self._buf[start : start + strings_size]
+        self._views.append(self._strings)
+
+    @classmethod
+    def publish(cls, mapping: MappingResponse, name: str | None = None) -> "SharedCatalog":
+        """Write a mapping into a new shared memory block.
+
+        Args:
+            mapping: The item mapping to publish.
+            name: Optional name for the block. A unique name is generated if
+                None; read it back from `name` to pass to other processes.
+
+        Returns:
+            The published catalog, owned by this process.
+
+        Raises:
+            ValidationError: If an item has a negative ID or a value too large
+                for the catalog's 32-bit columns.
+            FileExistsError: If a block with the given name already exists.
+        """
+        items = sorted(mapping.items, key=lambda item: item.id)
+        if items and items[0].id < 0:
+            raise ValidationError(f"Item ID {items[0].id} cannot be stored in the catalog")
+        count = len(items)
+        max_id = items[-1].id if items else 0
+        names = [item.name.encode() for item in items]
+        strings = b"".join(names)
+        layout = _layout(count, max_id)
+        size = layout["strings"][0] + len(strings)
+
+        columns: dict[str, list[int]] = {
+            "ids": [],
+            "lowalch": [],
+            "highalch": [],
+            "limit": [],
+            "value": [],
+        }
+        members = bytearray()
+        name_offsets = [0]
+        index = [_MISSING] * (max_id + 1)
+        for row, (item, encoded) in enumerate(zip(items, names, strict=True)):
+            columns["ids"].append(_int32(item.id, "id", item.id))
+            columns["lowalch"].append(_int32(item.lowalch, "lowalch", item.id))
+            columns["highalch"].append(_int32(item.highalch, "highalch", item.id))
+            columns["limit"].append(_int32(item.limit, "limit", item.id))
+            columns["value"].append(_int32(item.value, "value", item.id))
+            members.append(item.members)
+            name_offsets.append(name_offsets[-1] + len(encoded))
+            index[item.id] = row
+
+        shm = shared_memory.SharedMemory(name, create=True, size=max(size, 1))
+        try:
+            buf = shm.buf
+            assert buf is not None
+            _HEADER.pack_into(buf, 0, MAGIC, VERSION, count, max_id, len(strings))
+            packed = {section: struct.pack(f"={len(v)}i", *v) for section, v in columns.items()}
+            packed["members"] = bytes(members)
+            packed["name_offsets"] = struct.pack(f"={len(name_offsets)}I", *name_offsets)
+            packed["index"] = struct.pack(f"={len(index)}i", *index)
+            for section, data in packed.items():
+                offset = layout[section][0]
+                buf[offset : offset + len(data)] = data
+            start = layout["strings"][0]
+            buf[start : start + len(strings)] = strings
+            catalog = cls(shm, owner=True)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        _published.add(shm.name)
+        return catalog
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCatalog":
+        """Attach to a catalog published by another process.
+
+        Args:
+            name: The name of the published block.
+
+        Returns:
+            A read-only view of the catalog.
+
+        Raises:
+            FileNotFoundError: If no block with that name exists.
+            ValidationError: If the block is not an item catalog.
+        """
+        shm = _open(name)
+        try:
+            return cls(shm, owner=False)
+        except BaseException:
+            shm.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        """Return the shared memory block name to attach with."""
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, item_id: object) -> bool:
+        return isinstance(item_id, int) and self._row(item_id) is not None
+
+    def __iter__(self) -> Iterator[CatalogItem]:
+        for row in range(self._count):
+            yield self._item(row)
+
+    def __getitem__(self, item_id: int) -> CatalogItem:
+        item = self.get(item_id)
+        if item is None:
+            raise KeyError(item_id)
+        return item
+
+    def get(self, item_id: int) -> CatalogItem | None:
+        """Look up an item by ID.
+
+        Args:
+            item_id: The item ID.
+
+        Returns:
+            The item, or None if it is not in the catalog.
+        """
+        row = self._row(item_id)
+        return None if row is None else self._item(row)
+
+    def get_name(self, item_id: int) -> str | None:
+        """Return an item's name without reading its other fields."""
+        row = self._row(item_id)
+        return None if row is None else self._name(row)
+
+    def ids(self) -> list[int]:
+        """Return every item ID in ascending order."""
+        return self._ids.tolist()
+
+    def _row(self, item_id: int) -> int | None:
+        if not 0 <= item_id <= self._max_id:
+            return None
+        row = self._index[item_id]
+        return None if row == _MISSING else row
+
+    def _name(self, row: int) -> str:
+        start, end = self._name_offsets[row], self._name_offsets[row + 1]
+        return str(self._strings[start:end], "utf-8")
+
+    def _item(self, row: int) -> CatalogItem:
+        lowalch = self._lowalch[row]
+        highalch = self._highalch[row]
+        limit = self._limit[row]
+        value = self._value[row]
+        return CatalogItem(
+            self._ids[row],
+            self._name(row),
+            bool(self._members[row]),
+            None if lowalch == _MISSING else lowalch,
+            None if highalch == _MISSING else highalch,
+            None if limit == _MISSING else limit,
+            None if value == _MISSING else value,
+        )
+
+    def close(self) -> None:
+        """Detach from the block. Other processes are unaffected."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the block once every process has detached.
+
+        Raises:
+            ValidationError: If this process did not publish the catalog.
+        """
+        if not self._owner:
+            raise ValidationError("Only the publishing process can unlink a catalog")
+        self._shm.unlink()
+        _published.discard(self._shm.name)
+
+    def __enter__(self: _C) -> _C:  # noqa: PYI019 - typing.Self needs Python 3.11
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Detach from the block, and remove it if this process published it."""
+        self.close()
+        if self._owner:
+            self.unlink()
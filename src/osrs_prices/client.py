@@ -1,16 +1,28 @@
 """Main OSRS Prices API client."""
 
+import time
+from collections.abc import Hashable, Mapping
 from types import TracebackType
-from typing import overload
+from typing import TYPE_CHECKING, Any, overload
 
 import httpx
 
-from osrs_prices.constants import BLOCKED_USER_AGENTS, DEFAULT_CACHE_TTL, DEFAULT_TIMEOUT
+from osrs_prices.backends.base import CacheBackend
+from osrs_prices.cache import CachePolicy, LRUCache, TimeseriesCache
+from osrs_prices.constants import (
+    BASE_URL,
+    BLOCKED_USER_AGENTS,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_TIMEOUT,
+)
 from osrs_prices.endpoints.averages import FiveMinuteEndpoint, OneHourEndpoint
+from osrs_prices.endpoints.base import BaseEndpoint
 from osrs_prices.endpoints.latest import LatestEndpoint
 from osrs_prices.endpoints.mapping import MappingEndpoint
 from osrs_prices.endpoints.timeseries import TimeseriesEndpoint
 from osrs_prices.exceptions import ValidationError
+from osrs_prices.history import TimeseriesHistory
+from osrs_prices.hooks import Hooks, RequestEvent
 from osrs_prices.models.enriched import (
     EnrichedAveragePrice,
     EnrichedAverageResponse,
@@ -22,6 +34,31 @@ from osrs_prices.models.items import ItemMapping, MappingResponse
 from osrs_prices.models.prices import AverageResponse, LatestResponse
 from osrs_prices.models.timeseries import Timestep, TimeseriesResponse
 
+if TYPE_CHECKING:
+    from osrs_prices.metrics import MetricsRegistry
+    from osrs_prices.prefork import WarmMapping
+
+
+def validate_user_agent(user_agent: str) -> None:
+    """Validate that the user agent is acceptable.
+
+    Args:
+        user_agent: The user agent string to validate.
+
+    Raises:
+        ValidationError: If the user agent is invalid.
+    """
+    if not user_agent or not user_agent.strip():
+        raise ValidationError("User-Agent must not be empty")
+
+    user_agent_lower = user_agent.lower()
+    for blocked in BLOCKED_USER_AGENTS:
+        if blocked in user_agent_lower:
+            raise ValidationError(
+                f"User-Agent must not contain blocked agent: {blocked}. "
+                "Please use a descriptive agent like 'my-app/1.0 contact@example.com'"
+            )
+
 
 class Client:
     """Client for the OSRS Real-time Prices API.
@@ -40,6 +77,17 @@ class Client:
         user_agent: str,
         timeout: float = DEFAULT_TIMEOUT,
         cache_ttl: float = DEFAULT_CACHE_TTL,
+        timeseries_cache: bool = False,
+        response_cache: LRUCache[Hashable, Any] | None = None,
+        cache_policies: Mapping[str, CachePolicy | None] | None = None,
+        cache_backend: CacheBackend | None = None,
+        base_url: str = BASE_URL,
+        http_client: httpx.Client | None = None,
+        transport: httpx.BaseTransport | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        hooks: Hooks | None = None,
+        metrics: "MetricsRegistry | None" = None,
     ) -> None:
         """Initialize the client.
 
@@ -48,45 +96,98 @@ class Client:
                        Must not be a generic library agent (e.g., "python-requests").
             timeout: Request timeout in seconds.
             cache_ttl: Time-to-live for the mapping cache in seconds.
+            timeseries_cache: If True, cache timeseries data until the next bucket
+                       boundary and accumulate history beyond the API's window.
+            response_cache: Optional keyed cache shared by all endpoints. Responses
+                       are cached according to each endpoint's cache policy.
+            cache_policies: Optional per-path overrides of the endpoints' cache
+                       policies, e.g. {"/latest": CachePolicy(ttl=10)}. Map a path
+                       to None to opt that endpoint out of the response cache.
+            cache_backend: Optional backend (e.g. SQLiteBackend or DaemonBackend)
+                       for sharing raw responses with other processes. Used for
+                       the mapping and for every endpoint with a cache policy.
+            base_url: Root URL of the API, e.g. a local `osrs_prices.proxy` or
+                       mirror. Defaults to the public prices.runescape.wiki API.
+            http_client: Optional preconfigured httpx client to send requests with.
+                       Its User-Agent header is replaced, and it is not closed by
+                       `close()`. Cannot be combined with transport, limits or http2.
+            transport: Optional httpx transport, e.g. `httpx.MockTransport` or an
+                       `httpx.HTTPTransport` with its own pool and retry settings.
+            limits: Optional connection pool limits for the default transport,
+                       including keep-alive settings (`max_keepalive_connections`
+                       and `keepalive_expiry`).
+            http2: If True, enable HTTP/2 on the default transport. Requires
+                       `pip install osrs-prices[http2]`.
+            hooks: Optional hook registry to share with other clients. A new,
+                       empty registry is created by default and exposed as
+                       `client.hooks`.
+            metrics: Optional metrics registry to record request, error, timing
+                       and cache metrics into. See `osrs_prices.metrics`.
 
         Raises:
-            ValidationError: If the user_agent is invalid or blocked.
+            ValidationError: If the user_agent is invalid or blocked, or if the
+                HTTP options conflict (http_client with any other HTTP option, or
+                transport with limits or http2).
         """
-        self._validate_user_agent(user_agent)
+        validate_user_agent(user_agent)
 
-        self._http_client = httpx.Client(
-            headers={"User-Agent": user_agent},
-            timeout=timeout,
+        if http_client is not None:
+            if transport is not None or limits is not None or http2:
+                raise ValidationError(
+                    "transport, limits and http2 cannot be combined with http_client"
+                )
+            http_client.headers["User-Agent"] = user_agent
+            self._owns_http_client = False
+            self._http_client = http_client
+        else:
+            if transport is not None and (limits is not None or http2):
+                raise ValidationError(
+                    "limits and http2 configure the default transport and cannot be "
+                    "combined with transport"
+                )
+            options: dict[str, Any] = {}
+            if limits is not None:
+                options["limits"] = limits
+            self._owns_http_client = True
+            self._http_options: dict[str, Any] = {
+                "headers": {"User-Agent": user_agent},
+                "timeout": timeout,
+                "transport": transport,
+                "http2": http2,
+                **options,
+            }
+            self._http_client = httpx.Client(**self._http_options)
+
+        self._latest = LatestEndpoint(self._http_client, response_cache, cache_backend)
+        self._mapping = MappingEndpoint(
+            self._http_client,
+            cache_ttl=cache_ttl,
+            response_cache=response_cache,
+            cache_backend=cache_backend,
         )
-
-        self._latest = LatestEndpoint(self._http_client)
-        self._mapping = MappingEndpoint(self._http_client, cache_ttl=cache_ttl)
-        self._five_minute = FiveMinuteEndpoint(self._http_client)
-        self._one_hour = OneHourEndpoint(self._http_client)
-        self._timeseries = TimeseriesEndpoint(self._http_client)
+        self._five_minute = FiveMinuteEndpoint(self._http_client, response_cache, cache_backend)
+        self._one_hour = OneHourEndpoint(self._http_client, response_cache, cache_backend)
+        self._timeseries = TimeseriesEndpoint(self._http_client, response_cache, cache_backend)
+
+        self.hooks = Hooks() if hooks is None else hooks
+        if metrics is not None:
+            metrics.attach(self.hooks)
+        for endpoint in self._endpoints():
+            endpoint.base_url = base_url.rstrip("/")
+            endpoint.hooks = self.hooks
+
+        if cache_policies:
+            for endpoint in self._endpoints():
+                if endpoint.path in cache_policies:
+                    endpoint.cache_policy = cache_policies[endpoint.path]
+        self._timeseries_cache = TimeseriesCache() if timeseries_cache else None
 
         self._name_to_id_cache: dict[str, int] | None = None
         self._mapping_lookup_cache: dict[int, ItemMapping] | None = None
 
-    def _validate_user_agent(self, user_agent: str) -> None:
-        """Validate that the user agent is acceptable.
-
-        Args:
-            user_agent: The user agent string to validate.
-
-        Raises:
-            ValidationError: If the user agent is invalid.
-        """
-        if not user_agent or not user_agent.strip():
-            raise ValidationError("User-Agent must not be empty")
-
-        user_agent_lower = user_agent.lower()
-        for blocked in BLOCKED_USER_AGENTS:
-            if blocked in user_agent_lower:
-                raise ValidationError(
-                    f"User-Agent must not contain blocked agent: {blocked}. "
-                    "Please use a descriptive agent like 'my-app/1.0 contact@example.com'"
-                )
+    def _endpoints(self) -> list[BaseEndpoint[Any]]:
+        """Return all endpoint instances owned by the client."""
+        return [self._latest, self._mapping, self._five_minute, self._one_hour, self._timeseries]
 
     def __enter__(self) -> "Client":
         """Enter the context manager."""
@@ -102,8 +203,30 @@ class Client:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client and release resources."""
-        self._http_client.close()
+        """Close the HTTP client and release resources.
+
+        An http_client passed to the constructor is left open for its owner.
+        """
+        if self._owns_http_client:
+            self._http_client.close()
+
+    def reset_after_fork(self) -> None:
+        """Replace HTTP connections inherited from a parent process.
+
+        Call this in a forked child before using a client created in the
+        parent. Pooled connections still belong to the parent, so they are
+        abandoned rather than closed: closing them could shut down the
+        parent's sockets or send it an HTTP/2 GOAWAY. The child gets a new,
+        empty connection pool with the same settings.
+
+        A transport or http_client passed to the constructor is kept as is;
+        resetting its connections is up to its owner.
+        """
+        if not self._owns_http_client or self._http_options["transport"] is not None:
+            return
+        self._http_client = httpx.Client(**self._http_options)
+        for endpoint in self._endpoints():
+            endpoint._client = self._http_client
 
     def get_latest(self, item_id: int | None = None) -> LatestResponse:
         """Get the latest instant-buy and instant-sell prices.
@@ -153,17 +276,75 @@ class Client:
         """
         return self._one_hour.fetch(timestamp)
 
-    def get_timeseries(self, item_id: int, timestep: Timestep) -> TimeseriesResponse:
+    def get_timeseries(
+        self,
+        item_id: int,
+        timestep: Timestep,
+        force_refresh: bool = False,
+        full_history: bool = False,
+    ) -> TimeseriesResponse:
         """Get historical timeseries data for an item.
 
+        With the timeseries cache enabled, data is reused until the next bucket
+        boundary and each refresh merges only the points newer than those held.
+        Refreshes of held history bypass the response cache, which may still
+        hold the body that history was merged from.
+
         Args:
             item_id: The item ID to fetch data for.
             timestep: The time interval for data points ("5m", "1h", "6h", or "24h").
+            force_refresh: If True, bypass the timeseries and response caches and
+                fetch fresh data.
+            full_history: If True, return all history accumulated by the timeseries
+                         cache rather than just the API's window. Data points are
+                         ordered oldest first.
 
         Returns:
             The timeseries data.
+
+        Raises:
+            ValidationError: If full_history is requested without the timeseries cache.
         """
-        return self._timeseries.fetch(item_id, timestep)
+        if self._timeseries_cache is None:
+            if full_history:
+                raise ValidationError("full_history requires Client(timeseries_cache=True)")
+            return self._timeseries.fetch(item_id, timestep, force_refresh)
+
+        history = self.get_timeseries_history(item_id, timestep, force_refresh)
+        return history.to_response(None if full_history else history.window)
+
+    def get_timeseries_history(
+        self, item_id: int, timestep: Timestep, force_refresh: bool = False
+    ) -> TimeseriesHistory:
+        """Get the accumulated timeseries history for an item as compact arrays.
+
+        Args:
+            item_id: The item ID to fetch data for.
+            timestep: The time interval for data points ("5m", "1h", "6h", or "24h").
+            force_refresh: If True, fetch and merge fresh data even if not expired.
+
+        Returns:
+            A copy of the merged history held by the timeseries cache.
+
+        Raises:
+            ValidationError: If the client was created without the timeseries cache.
+        """
+        if self._timeseries_cache is None:
+            raise ValidationError("Timeseries history requires Client(timeseries_cache=True)")
+
+        if not force_refresh:
+            cached = self._timeseries_cache.get(item_id, timestep)
+            if cached is not None:
+                return cached
+
+        refresh = force_refresh or (item_id, timestep) in self._timeseries_cache
+        response = self._timeseries.fetch(item_id, timestep, refresh)
+        return self._timeseries_cache.merge(response, timestep, item_id)
+
+    def invalidate_timeseries_cache(self) -> None:
+        """Manually invalidate the timeseries cache, discarding accumulated history."""
+        if self._timeseries_cache is not None:
+            self._timeseries_cache.invalidate()
 
     def invalidate_mapping_cache(self) -> None:
         """Manually invalidate the mapping cache."""
@@ -171,6 +352,20 @@ class Client:
         self._name_to_id_cache = None
         self._mapping_lookup_cache = None
 
+    def adopt_mapping(self, warm: "WarmMapping") -> None:
+        """Use an already loaded mapping and its lookup indexes.
+
+        The mapping is cached for `cache_ttl` from now, like a fetched one,
+        and the indexes are used as they are rather than copied. See
+        `osrs_prices.prefork` for sharing them with forked workers.
+
+        Args:
+            warm: The mapping and indexes, e.g. from `prefork.warm_up`.
+        """
+        self._mapping._cache.set(warm.mapping)
+        self._mapping_lookup_cache = warm.by_id
+        self._name_to_id_cache = warm.by_name
+
     def get_item_by_name(self, name: str) -> ItemMapping | None:
         """Find an item by its exact name.
 
@@ -265,6 +460,7 @@ class Client:
             Enriched latest response with item metadata.
         """
         lookup = self._get_mapping_lookup()
+        start = time.perf_counter()
 
         items = []
         for item_id, price in latest.data.items():
@@ -288,7 +484,10 @@ class Client:
                     )
                 )
 
-        return EnrichedLatestResponse(items=items)
+        enriched = EnrichedLatestResponse(items=items)
+        if self.hooks:
+            self._emit_enriched("latest", start, len(items))
+        return enriched
 
     def _enrich_average_response(
         self, averages: AverageResponse
@@ -302,6 +501,7 @@ class Client:
             Enriched average response with item metadata.
         """
         lookup = self._get_mapping_lookup()
+        start = time.perf_counter()
 
         items = []
         for item_id, price in averages.data.items():
@@ -325,7 +525,15 @@ class Client:
                     )
                 )
 
-        return EnrichedAverageResponse(items=items, timestamp=averages.timestamp)
+        enriched = EnrichedAverageResponse(items=items, timestamp=averages.timestamp)
+        if self.hooks:
+            self._emit_enriched("average", start, len(items))
+        return enriched
+
+    def _emit_enriched(self, kind: str, start: float, count: int) -> None:
+        """Emit an `enriched` event for an enrichment that began at start."""
+        durations = {"enrich": time.perf_counter() - start}
+        self.hooks.emit(RequestEvent("enriched", kind, {}, size=count, durations=durations))
 
     def get_timeseries_with_mapping(
         self, item_id: int, timestep: Timestep
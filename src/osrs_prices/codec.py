@@ -0,0 +1,295 @@
+"""Compact binary encoding for price history.
+
+Encodes sequences of `TimeseriesDataPoint` or of per-bucket `AveragePrice`
+snapshots (paired with their bucket timestamps). Each record is stored as:
+
+* a null bitmap byte, one bit per value field that is present,
+* the delta-of-delta of the timestamp as a zig-zag varint,
+* for every present field, the delta from that field's previous present value
+  as a zig-zag varint.
+
+Bucketed history has a fixed step and slowly moving prices, so most records
+shrink to a handful of bytes. Streams start with a short header identifying
+the record kind so the two sequence types cannot be confused.
+
+Example:
+    >>> from osrs_prices.codec import decode_timeseries, encode_timeseries
+    >>> with Client(user_agent="my-app/1.0") as client:
+    ...     timeseries = client.get_timeseries(4151, "5m")
+    >>> data = encode_timeseries(timeseries.data)
+    >>> assert decode_timeseries(data) == timeseries.data
+"""
+
+import io
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from osrs_prices.exceptions import CodecError
+from osrs_prices.models.prices import AveragePrice
+from osrs_prices.models.timeseries import TimeseriesDataPoint
+
+MAGIC = b"OSPC"
+VERSION = 1
+
+KIND_TIMESERIES = 1
+KIND_AVERAGE = 2
+
+Record = tuple[int, int | None, int | None, int | None, int | None]
+"""A decoded record: (timestamp, avg_high_price, avg_low_price, high_price_volume,
+low_price_volume)."""
+
+_HEADER_SIZE = len(MAGIC) + 2
+# Bitmap byte plus five varints of at most 10 bytes each for 64-bit values.
+_MAX_RECORD_SIZE = 1 + 5 * 10
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    # Zig-zag maps signed deltas onto unsigned ints: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...
+    value = value << 1 if value >= 0 else (-value << 1) - 1
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class Encoder:
+    """Streaming encoder that writes records to a binary stream."""
+
+    def __init__(self, stream: BinaryIO, kind: int = KIND_TIMESERIES) -> None:
+        """Initialize the encoder and write the stream header.
+
+        Args:
+            stream: A writable binary stream.
+            kind: `KIND_TIMESERIES` or `KIND_AVERAGE`.
+        """
+        if kind not in (KIND_TIMESERIES, KIND_AVERAGE):
+            raise CodecError(f"Unknown record kind: {kind}")
+        self._stream = stream
+        self._buffer = bytearray(MAGIC)
+        self._buffer += bytes((VERSION, kind))
+        self._prev_timestamp = 0
+        self._prev_delta = 0
+        self._prev_values = [0, 0, 0, 0]
+        self.count = 0
+
+    def write(
+        self,
+        timestamp: int,
+        avg_high_price: int | None,
+        avg_low_price: int | None,
+        high_price_volume: int | None,
+        low_price_volume: int | None,
+    ) -> None:
+        """Encode a single record.
+
+        Args:
+            timestamp: Unix timestamp of the bucket.
+            avg_high_price: Average instant-buy price, or None.
+            avg_low_price: Average instant-sell price, or None.
+            high_price_volume: Instant-buy volume, or None.
+            low_price_volume: Instant-sell volume, or None.
+        """
+        out = self._buffer
+        values = (avg_high_price, avg_low_price, high_price_volume, low_price_volume)
+        bitmap = 0
+        for bit, value in enumerate(values):
+            if value is not None:
+                bitmap |= 1 << bit
+        out.append(bitmap)
+
+        delta = timestamp - self._prev_timestamp
+        _write_varint(out, delta - self._prev_delta)
+        self._prev_timestamp = timestamp
+        self._prev_delta = delta
+
+        prev = self._prev_values
+        for i, value in enumerate(values):
+            if value is not None:
+                _write_varint(out, value - prev[i])
+                prev[i] = value
+
+        self.count += 1
+        if len(out) >= 65536:
+            self.flush()
+
+    def write_point(self, point: TimeseriesDataPoint) -> None:
+        """Encode a timeseries data point."""
+        self.write(
+            point.timestamp,
+            point.avg_high_price,
+            point.avg_low_price,
+            point.high_price_volume,
+            point.low_price_volume,
+        )
+
+    def write_average(self, timestamp: int, price: AveragePrice) -> None:
+        """Encode an average price snapshot for the bucket at `timestamp`."""
+        self.write(
+            timestamp,
+            price.avg_high_price,
+            price.avg_low_price,
+            price.high_price_volume,
+            price.low_price_volume,
+        )
+
+    def flush(self) -> None:
+        """Write any buffered bytes to the underlying stream."""
+        if self._buffer:
+            self._stream.write(bytes(self._buffer))
+            self._buffer.clear()
+
+
+class Decoder:
+    """Streaming decoder that yields records from a binary stream."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 65536) -> None:
+        """Initialize the decoder and read the stream header.
+
+        Args:
+            stream: A readable binary stream positioned at a header.
+            chunk_size: Number of bytes to read from the stream at a time.
+
+        Raises:
+            CodecError: If the header is missing or unsupported.
+        """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        header = stream.read(_HEADER_SIZE)
+        if len(header) != _HEADER_SIZE or header[: len(MAGIC)] != MAGIC:
+            raise CodecError("Not an osrs_prices encoded stream")
+        if header[len(MAGIC)] != VERSION:
+            raise CodecError(f"Unsupported stream version: {header[len(MAGIC)]}")
+        self.kind = header[len(MAGIC) + 1]
+
+    def __iter__(self) -> Iterator[Record]:
+        buf = b""
+        pos = 0
+        eof = False
+        timestamp = 0
+        delta = 0
+        prev = [0, 0, 0, 0]
+
+        while True:
+            if not eof and len(buf) - pos < _MAX_RECORD_SIZE:
+                parts = [buf[pos:]]
+                size = len(parts[0])
+                while size < _MAX_RECORD_SIZE:
+                    chunk = self._stream.read(self._chunk_size)
+                    if not chunk:
+                        eof = True
+                        break
+                    parts.append(chunk)
+                    size += len(chunk)
+                buf = b"".join(parts)
+                pos = 0
+            if pos >= len(buf):
+                return
+
+            try:
+                bitmap = buf[pos]
+                pos += 1
+                values: list[int | None] = [None, None, None, None]
+                for field in range(-1, 4):
+                    if field >= 0 and not bitmap >> field & 1:
+                        continue
+                    raw = 0
+                    shift = 0
+                    while True:
+                        byte = buf[pos]
+                        pos += 1
+                        raw |= (byte & 0x7F) << shift
+                        if byte < 0x80:
+                            break
+                        shift += 7
+                    value = (raw >> 1) ^ -(raw & 1)
+                    if field < 0:
+                        delta += value
+                        timestamp += delta
+                    else:
+                        prev[field] += value
+                        values[field] = prev[field]
+            except IndexError:
+                raise CodecError("Truncated record at end of stream") from None
+
+            yield (timestamp, values[0], values[1], values[2], values[3])
+
+
+def encode_timeseries(points: Iterable[TimeseriesDataPoint]) -> bytes:
+    """Encode timeseries data points to bytes.
+
+    Args:
+        points: Data points, ideally in timestamp order.
+
+    Returns:
+        The encoded stream.
+    """
+    out = io.BytesIO()
+    encoder = Encoder(out, KIND_TIMESERIES)
+    for point in points:
+        encoder.write_point(point)
+    encoder.flush()
+    return out.getvalue()
+
+
+def decode_timeseries(data: bytes) -> list[TimeseriesDataPoint]:
+    """Decode bytes produced by `encode_timeseries`.
+
+    Raises:
+        CodecError: If the data is malformed or holds average snapshots.
+    """
+    decoder = _decoder(data, KIND_TIMESERIES)
+    return [
+        TimeseriesDataPoint(
+            timestamp=ts,
+            avgHighPrice=avg_high,
+            avgLowPrice=avg_low,
+            highPriceVolume=high_volume,
+            lowPriceVolume=low_volume,
+        )
+        for ts, avg_high, avg_low, high_volume, low_volume in decoder
+    ]
+
+
+def encode_averages(snapshots: Iterable[tuple[int, AveragePrice]]) -> bytes:
+    """Encode per-bucket average price snapshots for one item to bytes.
+
+    Args:
+        snapshots: (timestamp, price) pairs, ideally in timestamp order.
+
+    Returns:
+        The encoded stream.
+    """
+    out = io.BytesIO()
+    encoder = Encoder(out, KIND_AVERAGE)
+    for timestamp, price in snapshots:
+        encoder.write_average(timestamp, price)
+    encoder.flush()
+    return out.getvalue()
+
+
+def decode_averages(data: bytes) -> list[tuple[int, AveragePrice]]:
+    """Decode bytes produced by `encode_averages`.
+
+    Raises:
+        CodecError: If the data is malformed or holds timeseries points.
+    """
+    decoder = _decoder(data, KIND_AVERAGE)
+    return [
+        (
+            ts,
+            AveragePrice(
+                avgHighPrice=avg_high,
+                avgLowPrice=avg_low,
+                highPriceVolume=high_volume,
+                lowPriceVolume=low_volume,
+            ),
+        )
+        for ts, avg_high, avg_low, high_volume, low_volume in decoder
+    ]
+
+
+def _decoder(data: bytes, kind: int) -> Decoder:
+    decoder = Decoder(io.BytesIO(data))
+    if decoder.kind != kind:
+        raise CodecError(f"Expected record kind {kind}, found {decoder.kind}")
+    return decoder
@@ -0,0 +1,207 @@
+"""Column-wise extraction of API responses for DataFrame and Arrow converters.
+
+Each response is read in a single pass into one list of Python values per
+column, without an intermediate record per item. The pandas, Arrow and Polars
+converters build their arrays from these lists, so the three agree on column
+names, order and index for every response type.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from osrs_prices.models import (
+    AverageResponse,
+    EnrichedAverageResponse,
+    EnrichedLatestResponse,
+    EnrichedTimeseriesResponse,
+    LatestResponse,
+    MappingResponse,
+    TimeseriesResponse,
+)
+
+ResponseKind = Literal["mapping", "latest", "5m", "1h", "timeseries"]
+
+Response = (
+    MappingResponse
+    | LatestResponse
+    | AverageResponse
+    | TimeseriesResponse
+    | EnrichedLatestResponse
+    | EnrichedAverageResponse
+    | EnrichedTimeseriesResponse
+)
+
+# Columns in model field order, paired with the API's JSON keys.
+MAPPING_COLUMNS = {
+    "name": "name",
+    "examine": "examine",
+    "members": "members",
+    "lowalch": "lowalch",
+    "highalch": "highalch",
+    "limit": "limit",
+    "value": "value",
+    "icon": "icon",
+}
+LATEST_COLUMNS = {
+    "high": "high",
+    "high_time": "highTime",
+    "low": "low",
+    "low_time": "lowTime",
+}
+AVERAGE_COLUMNS = {
+    "avg_high_price": "avgHighPrice",
+    "high_price_volume": "highPriceVolume",
+    "avg_low_price": "avgLowPrice",
+    "low_price_volume": "lowPriceVolume",
+}
+TIMESERIES_COLUMNS = {
+    "avg_high_price": "avgHighPrice",
+    "avg_low_price": "avgLowPrice",
+    "high_price_volume": "highPriceVolume",
+    "low_price_volume": "lowPriceVolume",
+}
+# Non-integer columns; every other column holds integers.
+STRING_COLUMNS = frozenset({"name", "examine", "icon"})
+BOOL_COLUMNS = frozenset({"members"})
+# Integer columns holding Unix-second trade times.
+TIME_COLUMNS = frozenset({"high_time", "low_time"})
+
+
+@dataclass
+class Columns:
+    """One response as lists of Python values.
+
+    Attributes:
+        index_name: "id" for the mapping, "item_id" for prices, or
+            "timestamp" for a timeseries (Unix seconds).
+        index: The index value of each row.
+        columns: Column values keyed by name, in model field order.
+        attrs: Response-level values, such as an average's `timestamp` or an
+            enriched timeseries' `item_id` and `item`.
+    """
+
+    index_name: str
+    index: list[int]
+    columns: dict[str, list[Any]]
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+def from_response(response: Response) -> Columns:
+    """Extract the columns of a parsed API response.
+
+    Args:
+        response: Any of the API response types, plain or enriched.
+
+    Returns:
+        The response's columns.
+
+    Raises:
+        TypeError: If response type is not supported.
+    """
+    if isinstance(response, MappingResponse):
+        mapping = response.items
+        return Columns(
+            "id", [item.id for item in mapping], _model_columns(mapping, MAPPING_COLUMNS)
+        )
+    elif isinstance(response, LatestResponse):
+        latest = list(response.data.values())
+        return Columns("item_id", list(response.data), _model_columns(latest, LATEST_COLUMNS))
+    elif isinstance(response, AverageResponse):
+        averages = list(response.data.values())
+        return Columns(
+            "item_id",
+            list(response.data),
+            _model_columns(averages, AVERAGE_COLUMNS),
+            {"timestamp": response.timestamp},
+        )
+    elif isinstance(response, TimeseriesResponse):
+        points = response.data
+        return Columns(
+            "timestamp",
+            [point.timestamp for point in points],
+            _model_columns(points, TIMESERIES_COLUMNS),
+        )
+    elif isinstance(response, EnrichedLatestResponse):
+        enriched_latest = response.items
+        return Columns(
+            "item_id",
+            [item.id for item in enriched_latest],
+            _model_columns(enriched_latest, {**MAPPING_COLUMNS, **LATEST_COLUMNS}),
+        )
+    elif isinstance(response, EnrichedAverageResponse):
+        enriched_averages = response.items
+        return Columns(
+            "item_id",
+            [item.id for item in enriched_averages],
+            _model_columns(enriched_averages, {**MAPPING_COLUMNS, **AVERAGE_COLUMNS}),
+            {"timestamp": response.timestamp},
+        )
+    elif isinstance(response, EnrichedTimeseriesResponse):
+        points = response.data
+        return Columns(
+            "timestamp",
+            [point.timestamp for point in points],
+            _model_columns(points, TIMESERIES_COLUMNS),
+            {"item_id": response.item.id, "item": response.item.model_dump()},
+        )
+    else:
+        raise TypeError(f"Unsupported response type: {type(response)}")
+
+
+def from_json(data: Any, kind: ResponseKind) -> Columns:
+    """Extract the columns of a decoded JSON body, without building models.
+
+    Args:
+        data: The decoded JSON body of a response.
+        kind: Which endpoint the body came from: "mapping", "latest", "5m",
+            "1h" or "timeseries".
+
+    Returns:
+        The body's columns, matching `from_response` on the parsed response.
+
+    Raises:
+        ValueError: If kind is not supported.
+    """
+    if kind == "mapping":
+        return Columns(
+            "id",
+            [item["id"] for item in data],
+            {column: [item.get(key) for item in data] for column, key in MAPPING_COLUMNS.items()},
+        )
+    elif kind == "latest":
+        prices = data.get("data", {})
+        return Columns("item_id", _int_keys(prices), _json_columns(prices, LATEST_COLUMNS))
+    elif kind in ("5m", "1h"):
+        prices = data.get("data", {})
+        return Columns(
+            "item_id",
+            _int_keys(prices),
+            _json_columns(prices, AVERAGE_COLUMNS),
+            {"timestamp": data.get("timestamp", 0)},
+        )
+    elif kind == "timeseries":
+        points = data.get("data", [])
+        return Columns(
+            "timestamp",
+            [point["timestamp"] for point in points],
+            {
+                column: [point.get(key) for point in points]
+                for column, key in TIMESERIES_COLUMNS.items()
+            },
+        )
+    else:
+        raise ValueError(f"Unsupported response kind: {kind!r}")
+
+
+def _int_keys(prices: dict[str, Any]) -> list[int]:
+    return [int(item_id) for item_id in prices]
+
+
+def _json_columns(prices: dict[str, Any], columns: dict[str, str]) -> dict[str, list[Any]]:
+    values = list(prices.values())
+    return {column: [price.get(key) for price in values] for column, key in columns.items()}
+
+
+def _model_columns(models: Sequence[Any], columns: dict[str, str]) -> dict[str, list[Any]]:
+    return {column: [getattr(model, column) for model in models] for column in columns}
@@ -0,0 +1,299 @@
+"""Memory-compact representations of the item mapping and latest prices.
+
+The pydantic models keep every field of every item in its own per-instance
+dict, including examine text and icon filenames that most consumers never
+read. These classes hold the same data in a fraction of the memory:
+
+- `CompactMapping` keeps one slotted `CompactItem` per item with an interned
+  name, and stores examine text and icons as UTF-8 in one shared buffer,
+  decoded only when an item's `examine` or `icon` is read.
+- `CompactLatest` keeps a `/latest` snapshot in int64 columns, sorted by
+  item ID, and builds a `LatestPrice` only for the item asked for.
+
+Both can be built from the parsed models or straight from the API's JSON,
+which skips model validation entirely:
+
+    >>> mapping = CompactMapping.from_list(raw_mapping_json)
+    >>> mapping[4151].name
+    'Abyssal whip'
+    >>> latest = CompactLatest.from_api(raw_latest_json)
+    >>> latest[4151].high
+    2500000
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from osrs_prices.constants import NULL_INT64
+from osrs_prices.models.items import ItemMapping, MappingResponse
+from osrs_prices.models.prices import LatestPrice, LatestResponse
+
+
+def _pack(value: int | None) -> int:
+    return NULL_INT64 if value is None else value
+
+
+def _unpack(value: int) -> int | None:
+    return None if value == NULL_INT64 else value
+
+
+class _TextTable:
+    """Optional strings stored as UTF-8 in a single buffer."""
+
+    __slots__ = ("_blob", "_nulls", "_offsets")
+
+    def __init__(self, values: Iterable[str | None]) -> None:
+        parts: list[bytes] = []
+        offsets = array("I", [0])
+        nulls = bytearray()
+        for value in values:
+            encoded = b"" if value is None else value.encode()
+            parts.append(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+            nulls.append(value is None)
+        self._blob = b"".join(parts)
+        self._offsets = offsets
+        self._nulls = bytes(nulls)
+
+    def __getitem__(self, row: int) -> str | None:
+        if self._nulls[row]:
+            return None
+        return self._blob[self._offsets[row] : self._offsets[row + 1]].decode()
+
+
+class CompactItem:
+    """Metadata for one item in a `CompactMapping`.
+
+    Fields match `ItemMapping`. `examine` and `icon` are decoded from the
+    mapping's shared text buffers each time they are read.
+    """
+
+    __slots__ = (
+        "_examine",
+        "_icon",
+        "_row",
+        "highalch",
+        "id",
+        "limit",
+        "lowalch",
+        "members",
+        "name",
+        "value",
+    )
+
+    def __init__(
+        self,
+        row: int,
+        examine: _TextTable,
+        icon: _TextTable,
+        id: int,
+        name: str,
+        members: bool,
+        lowalch: int | None,
+        highalch: int | None,
+        limit: int | None,
+        value: int | None,
+    ) -> None:
+        self._row = row
+        self._examine = examine
+        self._icon = icon
+        self.id = id
+        self.name = name
+        self.members = members
+        self.lowalch = lowalch
+        self.highalch = highalch
+        self.limit = limit
+        self.value = value
+
+    @property
+    def examine(self) -> str | None:
+        """Return the item's examine text."""
+        return self._examine[self._row]
+
+    @property
+    def icon(self) -> str:
+        """Return the item's icon filename."""
+        return self._icon[self._row] or ""
+
+    def to_model(self) -> ItemMapping:
+        """Return the item as an ItemMapping."""
+        return ItemMapping(
+            id=self.id,
+            name=self.name,
+            examine=self.examine,
+            members=self.members,
+            lowalch=self.lowalch,
+            highalch=self.highalch,
+            limit=self.limit,
+            value=self.value,
+            icon=self.icon,
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactItem(id={self.id}, name={self.name!r})"
+
+
+class CompactMapping:
+    """The item mapping as slotted records sorted by item ID."""
+
+    __slots__ = ("_by_name", "_examine", "_icon", "_ids", "_items")
+
+    def __init__(self, items: Iterable[dict[str, Any] | ItemMapping]) -> None:
+        """Build a compact mapping.
+
+        Args:
+            items: Items as API dicts (as returned by /mapping) or ItemMapping
+                models.
+        """
+        rows = [
+            item if isinstance(item, dict) else item.model_dump(by_alias=True) for item in items
+        ]
+        rows.sort(key=lambda row: row["id"])
+        self._examine = _TextTable(row.get("examine") for row in rows)
+        self._icon = _TextTable(row.get("icon") for row in rows)
+        self._ids = array("q", (row["id"] for row in rows))
+        self._items = [
+            CompactItem(
+                index,
+                self._examine,
+                self._icon,
+                row["id"],
+                sys.intern(row["name"]),
+                row["members"],
+                row.get("lowalch"),
+                row.get("highalch"),
+                row.get("limit"),
+                row.get("value"),
+            )
+            for index, row in enumerate(rows)
+        ]
+        self._by_name: dict[str, CompactItem] | None = None
+
+    @classmethod
+    def from_list(cls, data: list[dict[str, Any]]) -> "CompactMapping":
+        """Build a compact mapping from the /mapping JSON, without validation."""
+        return cls(data)
+
+    @classmethod
+    def from_response(cls, mapping: MappingResponse) -> "CompactMapping":
+        """Build a compact mapping from a parsed MappingResponse."""
+        return cls(mapping.items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[CompactItem]:
+        return iter(self._items)
+
+    def __contains__(self, item_id: object) -> bool:
+        return isinstance(item_id, int) and self.get(item_id) is not None
+
+    def __getitem__(self, item_id: int) -> CompactItem:
+        item = self.get(item_id)
+        if item is None:
+            raise KeyError(item_id)
+        return item
+
+    def get(self, item_id: int) -> CompactItem | None:
+        """Look up an item by ID.
+
+        Args:
+            item_id: The item ID.
+
+        Returns:
+            The item, or None if it is not in the mapping.
+        """
+        row = bisect_left(self._ids, item_id)
+        if row < len(self._ids) and self._ids[row] == item_id:
+            return self._items[row]
+        return None
+
+    def get_by_name(self, name: str) -> CompactItem | None:
+        """Find an item by its exact name. The name index is built on first use."""
+        if self._by_name is None:
+            self._by_name = {item.name: item for item in self._items}
+        return self._by_name.get(name)
+
+    def to_response(self) -> MappingResponse:
+        """Return the mapping as a MappingResponse."""
+        return MappingResponse(items=[item.to_model() for item in self._items])
+
+
+class CompactLatest:
+    """A /latest snapshot held in int64 columns sorted by item ID.
+
+    Missing values are stored as `NULL_INT64`.
+    """
+
+    __slots__ = ("_high", "_high_time", "_ids", "_low", "_low_time")
+
+    def __init__(self, data: dict[Any, dict[str, Any] | LatestPrice]) -> None:
+        """Build a compact snapshot.
+
+        Args:
+            data: Prices keyed by item ID, as API dicts (the "data" object of
+                /latest, with string keys) or LatestPrice models.
+        """
+        rows = sorted(
+            (
+                int(item_id),
+                price if isinstance(price, dict) else price.model_dump(by_alias=True),
+            )
+            for item_id, price in data.items()
+        )
+        self._ids = array("q", (item_id for item_id, _ in rows))
+        self._high = array("q", (_pack(price.get("high")) for _, price in rows))
+        self._high_time = array("q", (_pack(price.get("highTime")) for _, price in rows))
+        self._low = array("q", (_pack(price.get("low")) for _, price in rows))
+        self._low_time = array("q", (_pack(price.get("lowTime")) for _, price in rows))
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "CompactLatest":
+        """Build a snapshot from the /latest JSON, without validation."""
+        return cls(data.get("data", {}))
+
+    @classmethod
+    def from_response(cls, latest: LatestResponse) -> "CompactLatest":
+        """Build a snapshot from a parsed LatestResponse."""
+        return cls(dict(latest.data))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return isinstance(item_id, int) and self._row(item_id) is not None
+
+    def __getitem__(self, item_id: int) -> LatestPrice:
+        price = self.get(item_id)
+        if price is None:
+            raise KeyError(item_id)
+        return price
+
+    def _row(self, item_id: int) -> int | None:
+        row = bisect_left(self._ids, item_id)
+        if row < len(self._ids) and self._ids[row] == item_id:
+            return row
+        return None
+
+    def get(self, item_id: int) -> LatestPrice | None:
+        """Return the prices for an item, or None if it has none."""
+        row = self._row(item_id)
+        if row is None:
+            return None
+        return LatestPrice(
+            high=_unpack(self._high[row]),
+            highTime=_unpack(self._high_time[row]),
+            low=_unpack(self._low[row]),
+            lowTime=_unpack(self._low_time[row]),
+        )
+
+    def ids(self) -> list[int]:
+        """Return every item ID in ascending order."""
+        return self._ids.tolist()
+
+    def to_response(self) -> LatestResponse:
+        """Return the snapshot as a LatestResponse."""
+        return LatestResponse(data={item_id: self[item_id] for item_id in self._ids})
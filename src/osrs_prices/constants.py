@@ -5,6 +5,15 @@ BASE_URL = "https://prices.runescape.wiki/api/v1/osrs"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CACHE_TTL = 3600  # 1 hour in seconds
 
+TIMESTEP_SECONDS = {
+    "5m": 300,
+    "1h": 3600,
+    "6h": 21600,
+    "24h": 86400,
+}
+
+NULL_INT64 = -(2**63)  # Sentinel for missing values in int64 arrays
+
 BLOCKED_USER_AGENTS = frozenset({
     "python-requests",
     "python-httpx",
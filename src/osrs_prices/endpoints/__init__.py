@@ -1,10 +1,38 @@
 """Endpoint classes for the OSRS Prices API."""
 
-from osrs_prices.endpoints.averages import FiveMinuteEndpoint, OneHourEndpoint
-from osrs_prices.endpoints.base import BaseEndpoint
-from osrs_prices.endpoints.latest import LatestEndpoint
-from osrs_prices.endpoints.mapping import MappingEndpoint
-from osrs_prices.endpoints.timeseries import TimeseriesEndpoint
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from osrs_prices.endpoints.averages import FiveMinuteEndpoint, OneHourEndpoint
+    from osrs_prices.endpoints.base import BaseEndpoint
+    from osrs_prices.endpoints.latest import LatestEndpoint
+    from osrs_prices.endpoints.mapping import MappingEndpoint
+    from osrs_prices.endpoints.timeseries import TimeseriesEndpoint
+
+# Endpoints are imported from their modules on first access.
+_LAZY = {
+    "BaseEndpoint": "osrs_prices.endpoints.base",
+    "FiveMinuteEndpoint": "osrs_prices.endpoints.averages",
+    "LatestEndpoint": "osrs_prices.endpoints.latest",
+    "MappingEndpoint": "osrs_prices.endpoints.mapping",
+    "OneHourEndpoint": "osrs_prices.endpoints.averages",
+    "TimeseriesEndpoint": "osrs_prices.endpoints.timeseries",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
 
 __all__ = [
     "BaseEndpoint",
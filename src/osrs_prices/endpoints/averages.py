@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from osrs_prices.cache import CachePolicy
 from osrs_prices.endpoints.base import BaseEndpoint
 from osrs_prices.models.prices import AverageResponse
 
@@ -10,6 +11,7 @@ class FiveMinuteEndpoint(BaseEndpoint[AverageResponse]):
     """Endpoint for fetching 5-minute average prices."""
 
     path = "/5m"
+    cache_policy = CachePolicy(ttl=60.0)
 
     def _parse_response(self, data: Any) -> AverageResponse:
         """Parse the API response into an AverageResponse."""
@@ -33,6 +35,7 @@ class OneHourEndpoint(BaseEndpoint[AverageResponse]):
     """Endpoint for fetching 1-hour average prices."""
 
     path = "/1h"
+    cache_policy = CachePolicy(ttl=300.0)
 
     def _parse_response(self, data: Any) -> AverageResponse:
         """Parse the API response into an AverageResponse."""
@@ -1,28 +1,57 @@
 """Base endpoint class for all API endpoints."""
 
+import json
+import logging
+import sqlite3
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from collections.abc import Hashable
+from typing import Any, Generic, Literal, TypeVar
+from urllib.parse import urlencode
 
 import httpx
 
+from osrs_prices.backends.base import CacheBackend
+from osrs_prices.cache import CachePolicy, LRUCache
 from osrs_prices.constants import BASE_URL
 from osrs_prices.exceptions import APIError, RateLimitError
+from osrs_prices.hooks import EventKind, Hooks, RequestEvent
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+# Errors a cache backend can raise when its store is unreachable or broken.
+_BACKEND_ERRORS = (OSError, sqlite3.Error)
+
 
 class BaseEndpoint(ABC, Generic[T]):
     """Abstract base class for API endpoints."""
 
     path: str
-
-    def __init__(self, client: httpx.Client) -> None:
+    base_url: str = BASE_URL
+    cache_policy: CachePolicy | None = None
+    hooks: Hooks | None = None
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        response_cache: LRUCache[Hashable, Any] | None = None,
+        cache_backend: CacheBackend | None = None,
+    ) -> None:
         """Initialize the endpoint.
 
         Args:
             client: The httpx client to use for requests.
+            response_cache: Optional in-process cache for parsed responses. Only
+                           used when the endpoint has a `cache_policy`.
+            cache_backend: Optional backend for sharing raw response bodies with
+                          other clients and processes. Only used when the
+                          endpoint has a `cache_policy`.
         """
         self._client = client
+        self._response_cache = response_cache
+        self._cache_backend = cache_backend
 
     @abstractmethod
     def _parse_response(self, data: Any) -> T:
@@ -35,11 +64,21 @@ class BaseEndpoint(ABC, Generic[T]):
             The parsed model instance.
         """
 
-    def _request(self, params: dict[str, Any] | None = None) -> T:
+    def _parse(self, data: Any, params: dict[str, Any] | None) -> T:
+        """Parse a response body for the request made with params.
+
+        Endpoints whose models need request details override this rather
+        than keeping them on the instance, which concurrent requests share.
+        """
+        return self._parse_response(data)
+
+    def _request(self, params: dict[str, Any] | None = None, force_refresh: bool = False) -> T:
         """Make a request to the endpoint.
 
         Args:
             params: Optional query parameters.
+            force_refresh: If True, skip cached responses and fetch fresh data,
+                which then replaces them.
 
         Returns:
             The parsed response model.
@@ -48,9 +87,137 @@ class BaseEndpoint(ABC, Generic[T]):
             RateLimitError: If the API returns a 429 status.
             APIError: If the API returns any other error status.
         """
-        url = f"{BASE_URL}{self.path}"
+        policy = self.cache_policy
+        cache = self._response_cache
+        if policy is None or (cache is None and self._cache_backend is None):
+            return self._fetch(params)[0]
+
+        key = (self.path, tuple(sorted(params.items())) if params else ())
+        if cache is not None and not force_refresh:
+            cached: T | None = cache.get(key)
+            if cached is not None:
+                if self.hooks:
+                    self._emit_cache("cache_hit", params, "memory")
+                return cached
+
+        shared = None if force_refresh else self._load_shared(params)
+        if shared is not None:
+            result, body = shared
+        else:
+            if self.hooks:
+                self._emit_cache("cache_miss", params)
+            result, body = self._fetch(params)
+            self._store_shared(params, body, policy.ttl)
+
+        if cache is not None:
+            cache.set(key, result, ttl=policy.ttl, size=len(body))
+        return result
+
+    def _backend_key(self, params: dict[str, Any] | None) -> str:
+        """Return the cache backend key for a request."""
+        query = urlencode(sorted(params.items())) if params else ""
+        return f"osrs_prices:{self.path}?{query}"
+
+    def _load_shared(self, params: dict[str, Any] | None) -> tuple[T, bytes] | None:
+        """Parse a response body held by the cache backend, if any.
+
+        A backend that fails is treated as a miss, so the response is fetched.
+        """
+        if self._cache_backend is None:
+            return None
+        try:
+            body = self._cache_backend.get(self._backend_key(params))
+        except _BACKEND_ERRORS:
+            logger.warning("Cache backend lookup for %s failed", self.path, exc_info=True)
+            return None
+        if body is None:
+            return None
+        if self.hooks:
+            self._emit_cache("cache_hit", params, "backend", len(body))
+        return self._parse(json.loads(body), params), body
+
+    def _emit_cache(
+        self,
+        kind: Literal["cache_hit", "cache_miss"],
+        params: dict[str, Any] | None,
+        cache: str | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Emit a cache event to the registered hooks."""
+        assert self.hooks is not None
+        self.hooks.emit(RequestEvent(kind, self.path, params or {}, size=size, cache=cache))
+
+    def _store_shared(self, params: dict[str, Any] | None, body: bytes, ttl: float | None) -> None:
+        """Store a response body in the cache backend, if any.
+
+        A backend that fails is skipped; the response is still returned.
+        """
+        if self._cache_backend is None:
+            return
+        try:
+            self._cache_backend.set(self._backend_key(params), body, ttl)
+        except _BACKEND_ERRORS:
+            logger.warning("Cache backend store for %s failed", self.path, exc_info=True)
+
+    def _fetch(self, params: dict[str, Any] | None) -> tuple[T, bytes]:
+        """Fetch and parse a response, returning it with its raw body."""
+        url = f"{self.base_url}{self.path}"
+        if self.hooks:
+            return self._fetch_instrumented(url, params, self.hooks)
+
         response = self._client.get(url, params=params)
+        self._raise_for_status(response)
+        return self._parse(response.json(), params), response.content
+
+    def _fetch_instrumented(
+        self, url: str, params: dict[str, Any] | None, hooks: Hooks
+    ) -> tuple[T, bytes]:
+        """Fetch and parse a response, emitting an event after each stage."""
+        event_params = params or {}
+        durations: dict[str, float] = {}
+
+        def emit(kind: EventKind, **fields: Any) -> None:
+            hooks.emit(
+                RequestEvent(kind, self.path, event_params, durations=dict(durations), **fields)
+            )
 
+        emit("request_start")
+        start = mark = time.perf_counter()
+        request = self._client.build_request("GET", url, params=params)
+        try:
+            response = self._client.send(request, stream=True)
+            try:
+                now = time.perf_counter()
+                durations["headers"], mark = now - mark, now
+                emit("response_headers", status=response.status_code)
+                body = response.read()
+            finally:
+                response.close()
+        except httpx.TransportError as exc:
+            durations["total"] = time.perf_counter() - start
+            emit("request_failed", error=type(exc).__name__)
+            raise
+        now = time.perf_counter()
+        durations["body"], mark = now - mark, now
+        emit("body_received", status=response.status_code, size=len(body))
+
+        self._raise_for_status(response)
+
+        data = json.loads(body)
+        now = time.perf_counter()
+        durations["decode"], mark = now - mark, now
+        emit("json_decoded", status=response.status_code, size=len(body))
+
+        result = self._parse(data, params)
+        now = time.perf_counter()
+        durations["parse"] = now - mark
+        durations["total"] = now - start
+        emit("model_parsed", status=response.status_code, size=len(body))
+        return result, body
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise the matching exception for an error response."""
         if response.status_code == 429:
             raise RateLimitError()
 
@@ -59,5 +226,3 @@ class BaseEndpoint(ABC, Generic[T]):
                 f"API request failed: {response.status_code} {response.text}",
                 status_code=response.status_code,
             )
-
-        return self._parse_response(response.json())
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from osrs_prices.cache import CachePolicy
 from osrs_prices.endpoints.base import BaseEndpoint
 from osrs_prices.models.prices import LatestResponse
 
@@ -10,6 +11,7 @@ class LatestEndpoint(BaseEndpoint[LatestResponse]):
     """Endpoint for fetching latest instant-buy/sell prices."""
 
     path = "/latest"
+    cache_policy = CachePolicy(ttl=60.0)
 
     def _parse_response(self, data: Any) -> LatestResponse:
         """Parse the API response into a LatestResponse."""
@@ -1,8 +1,10 @@
 """Item mapping endpoint with caching."""
 
+from collections.abc import Hashable
 from typing import Any
 
-from osrs_prices.cache import TTLCache
+from osrs_prices.backends.base import CacheBackend
+from osrs_prices.cache import LRUCache, TTLCache
 from osrs_prices.constants import DEFAULT_CACHE_TTL
 from osrs_prices.endpoints.base import BaseEndpoint
 from osrs_prices.models.items import MappingResponse
@@ -13,14 +15,27 @@ class MappingEndpoint(BaseEndpoint[MappingResponse]):
 
     path = "/mapping"
 
-    def __init__(self, client: Any, cache_ttl: float = DEFAULT_CACHE_TTL) -> None:
+    def __init__(
+        self,
+        client: Any,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        response_cache: LRUCache[Hashable, Any] | None = None,
+        cache_backend: CacheBackend | None = None,
+    ) -> None:
         """Initialize the mapping endpoint.
 
+        The parsed mapping is held in its own TTL cache, so it has no
+        `cache_policy` for the shared response cache by default. A cache
+        backend, if given, is consulted whenever the TTL cache misses.
+
         Args:
             client: The httpx client to use for requests.
             cache_ttl: Time-to-live for the cache in seconds.
+            response_cache: Optional shared cache for parsed responses.
+            cache_backend: Optional backend for sharing the raw mapping with
+                          other clients and processes.
         """
-        super().__init__(client)
+        super().__init__(client, response_cache, cache_backend)
         self._cache: TTLCache[MappingResponse] = TTLCache(cache_ttl)
 
     def _parse_response(self, data: Any) -> MappingResponse:
@@ -39,9 +54,21 @@ class MappingEndpoint(BaseEndpoint[MappingResponse]):
         if not force_refresh:
             cached = self._cache.get()
             if cached is not None:
+                if self.hooks:
+                    self._emit_cache("cache_hit", None, "memory")
                 return cached
+            shared = self._load_shared(None)
+            if shared is not None:
+                self._cache.set(shared[0])
+                return shared[0]
 
-        response = self._request()
+        if self.cache_policy is None:
+            if self.hooks and not force_refresh:
+                self._emit_cache("cache_miss", None)
+            response, body = self._fetch(None)
+            self._store_shared(None, body, self._cache.ttl)
+        else:
+            response = self._request(force_refresh=force_refresh)
         self._cache.set(response)
         return response
 
@@ -22,3 +22,7 @@ class RateLimitError(APIError):
 
 class ValidationError(OSRSPricesError):
     """Raised when input validation fails."""
+
+
+class CodecError(OSRSPricesError):
+    """Raised when encoded price history is malformed."""
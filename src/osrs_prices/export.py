@@ -0,0 +1,340 @@
+"""Streaming export of average price snapshots to Parquet, CSV and NDJSON.
+
+Exporters take `/5m` or `/1h` snapshots one at a time, for example from a
+poller or a backfill, and write them under a Hive-style partitioned directory
+that Parquet readers, DuckDB and Spark understand:
+
+    root/timestep=5m/date=2024-01-01/part-1704067200.parquet
+
+Existing files are never overwritten: if a part's name is taken, for example
+by an earlier export of the same snapshots, the new part is numbered
+(`part-1704067200-1.parquet`).
+
+Each row is one item in one snapshot: the snapshot's `timestamp`, the
+`item_id`, then the response's columns (with the item metadata first for
+enriched responses). Memory does not grow with the number of snapshots.
+Parquet rows are buffered only until a row group is full, and CSV and NDJSON
+rows are written through gzip as they arrive.
+
+Example:
+    >>> from osrs_prices.export import ParquetExporter
+    >>> with ParquetExporter("./lake", "5m") as exporter:
+    ...     for snapshot in snapshots:
+    ...         exporter.write(snapshot)
+    >>> exporter.paths
+    [PosixPath('lake/timestep=5m/date=2024-01-01/part-1704067200.parquet'), ...]
+
+Parquet export requires the arrow extra; CSV and NDJSON need no dependencies.
+"""
+
+import csv
+import gzip
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Literal, TypeVar
+
+from osrs_prices.columns import Columns, from_response
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models import AverageResponse, EnrichedAverageResponse
+
+ExportFormat = Literal["parquet", "csv", "ndjson"]
+
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
+_E = TypeVar("_E", bound="_Exporter")
+
+
+class _Exporter(ABC):
+    """Writes snapshots to one file per date partition."""
+
+    suffix = ""
+
+    def __init__(self, root: str | os.PathLike[str], timestep: str) -> None:
+        self._root = Path(root)
+        self._timestep = timestep
+        self._date: str | None = None
+        self._columns: tuple[str, ...] | None = None
+        self.paths: list[Path] = []
+        """Every file written so far, in the order they were opened."""
+
+    def __enter__(self: _E) -> _E:  # noqa: PYI019 - typing.Self needs Python 3.11
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, response: AverageResponse | EnrichedAverageResponse) -> None:
+        """Write one snapshot.
+
+        A snapshot from a different UTC date than the previous one closes the
+        current file and starts one in the new date's partition.
+
+        Args:
+            response: An average snapshot, plain or enriched.
+
+        Raises:
+            TypeError: If the response is not an average snapshot.
+            ValidationError: If plain and enriched snapshots are mixed.
+        """
+        if not isinstance(response, (AverageResponse, EnrichedAverageResponse)):
+            raise TypeError(f"Unsupported response type: {type(response)}")
+        table = from_response(response)
+        names = tuple(table.columns)
+        if self._columns is None:
+            self._columns = names
+        elif names != self._columns:
+            raise ValidationError("Plain and enriched snapshots cannot be mixed in one export")
+
+        timestamp = response.timestamp
+        date = datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat()
+        if date != self._date:
+            self._close_file()
+            directory = self._root / f"timestep={self._timestep}" / f"date={date}"
+            directory.mkdir(parents=True, exist_ok=True)
+            path = _claim(directory, f"part-{timestamp}", self.suffix)
+            self._open(path)
+            self._date = date
+            self.paths.append(path)
+        self._write(timestamp, table)
+
+    def write_all(self, responses: Iterable[AverageResponse | EnrichedAverageResponse]) -> None:
+        """Write every snapshot from an iterable, consuming it lazily."""
+        for response in responses:
+            self.write(response)
+
+    def close(self) -> None:
+        """Finish the current file. The exporter can keep writing afterwards."""
+        self._close_file()
+
+    def _close_file(self) -> None:
+        if self._date is not None:
+            self._close()
+            self._date = None
+
+    @abstractmethod
+    def _open(self, path: Path) -> None:
+        """Start writing a new file at path, which exists and is empty."""
+
+    @abstractmethod
+    def _write(self, timestamp: int, table: Columns) -> None:
+        """Write one snapshot's rows to the current file."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Finish the current file."""
+
+
+def _claim(directory: Path, stem: str, suffix: str) -> Path:
+    """Create and return a new empty file, numbering it if the name is taken.
+
+    Creating the file exclusively means neither a second exporter nor a
+    reopened one can overwrite a part written earlier.
+    """
+    path = directory / f"{stem}{suffix}"
+    sequence = 0
+    while True:
+        try:
+            with path.open("x"):
+                return path
+        except FileExistsError:
+            sequence += 1
+            path = directory / f"{stem}-{sequence}{suffix}"
+
+
+class ParquetExporter(_Exporter):
+    """Export snapshots to Parquet files in row groups (requires pyarrow).
+
+    Whole snapshots are buffered until they hold at least `row_group_size`
+    rows, then written as one row group. Empty snapshots add no rows, and a
+    file of only empty snapshots has the schema but no row groups.
+    `timestamp` is a UTC timestamp column and integer columns are nullable.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        timestep: str,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = "zstd",
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            root: Directory to write partitions under.
+            timestep: The snapshots' timestep, e.g. "5m" or "1h".
+            row_group_size: Minimum rows per row group.
+            compression: Parquet compression codec.
+        """
+        super().__init__(root, timestep)
+        self._row_group_size = row_group_size
+        self._compression = compression
+        self._path: Path | None = None
+        self._writer: Any = None
+        self._buffer: list[Any] = []
+        self._buffered = 0
+
+    def _open(self, path: Path) -> None:
+        self._path = path
+
+    def _write(self, timestamp: int, table: Columns) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from osrs_prices.arrow import from_columns
+
+        snapshot = from_columns(table).replace_schema_metadata(None)
+        stamps = pa.repeat(pa.scalar(timestamp, type=pa.timestamp("s", tz="UTC")), len(snapshot))
+        snapshot = snapshot.add_column(0, "timestamp", stamps)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self._path, snapshot.schema, compression=self._compression
+            )
+        if not len(snapshot):
+            return
+        self._buffer.append(snapshot)
+        self._buffered += len(snapshot)
+        if self._buffered >= self._row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        import pyarrow as pa
+
+        try:
+            group = pa.concat_tables(self._buffer)
+            self._writer.write_table(group, row_group_size=len(group))
+        finally:
+            self._buffer = []
+            self._buffered = 0
+
+    def _close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._path = None
+
+
+class _TextExporter(_Exporter):
+    """Writes rows through a gzip text stream."""
+
+    def __init__(self, root: str | os.PathLike[str], timestep: str, compresslevel: int = 6) -> None:
+        """Initialize the exporter.
+
+        Args:
+            root: Directory to write partitions under.
+            timestep: The snapshots' timestep, e.g. "5m" or "1h".
+            compresslevel: gzip compression level, from 1 (fastest) to 9.
+        """
+        super().__init__(root, timestep)
+        self._compresslevel = compresslevel
+        self._file: IO[str] | None = None
+
+    def _open(self, path: Path) -> None:
+        # Kept open across snapshots and closed in _close.
+        self._file = gzip.open(path, "wt", compresslevel=self._compresslevel, newline="")  # noqa: SIM115
+        self._start(self._file)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _start(self, file: IO[str]) -> None:
+        pass
+
+    def _names(self) -> list[str]:
+        assert self._columns is not None
+        return ["timestamp", "item_id", *self._columns]
+
+    def _rows(self, timestamp: int, table: Columns) -> Iterator[tuple[Any, ...]]:
+        stamps = [timestamp] * len(table.index)
+        return zip(stamps, table.index, *table.columns.values())
+
+
+class CSVExporter(_TextExporter):
+    """Export snapshots to gzip-compressed CSV files.
+
+    `timestamp` is in Unix seconds, and missing values are empty fields.
+    """
+
+    suffix = ".csv.gz"
+
+    def _start(self, file: IO[str]) -> None:
+        self._writer = csv.writer(file)
+        self._writer.writerow(self._names())
+
+    def _write(self, timestamp: int, table: Columns) -> None:
+        self._writer.writerows(self._rows(timestamp, table))
+
+
+class NDJSONExporter(_TextExporter):
+    """Export snapshots to gzip-compressed newline-delimited JSON files.
+
+    Each line is one row as a JSON object, with `timestamp` in Unix seconds
+    and missing values as null.
+    """
+
+    suffix = ".ndjson.gz"
+
+    def _write(self, timestamp: int, table: Columns) -> None:
+        assert self._file is not None
+        names = self._names()
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        self._file.writelines(
+            encode(dict(zip(names, row))) + "\n" for row in self._rows(timestamp, table)
+        )
+
+
+_EXPORTERS: dict[str, type[_Exporter]] = {
+    "parquet": ParquetExporter,
+    "csv": CSVExporter,
+    "ndjson": NDJSONExporter,
+}
+
+
+def export(
+    responses: Iterable[AverageResponse | EnrichedAverageResponse],
+    root: str | os.PathLike[str],
+    timestep: str,
+    format: ExportFormat = "parquet",
+    **options: Any,
+) -> list[Path]:
+    """Export a stream of average snapshots.
+
+    Args:
+        responses: The snapshots, e.g. a generator polling `/5m`. It is
+            consumed lazily.
+        root: Directory to write partitions under.
+        timestep: The snapshots' timestep, e.g. "5m" or "1h".
+        format: "parquet", "csv" or "ndjson".
+        **options: Passed to the exporter, e.g. `row_group_size` for Parquet
+            or `compresslevel` for CSV and NDJSON.
+
+    Returns:
+        Every file written.
+
+    Raises:
+        ValueError: If format is not supported.
+    """
+    exporter_class = _EXPORTERS.get(format)
+    if exporter_class is None:
+        raise ValueError(f"Unsupported export format: {format!r}")
+    with exporter_class(root, timestep, **options) as exporter:
+        exporter.write_all(responses)
+    return exporter.paths
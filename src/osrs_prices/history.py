@@ -0,0 +1,127 @@
+"""Compact in-memory timeseries history."""
+
+from array import array
+from collections.abc import Iterable
+
+from osrs_prices.constants import NULL_INT64
+from osrs_prices.models.timeseries import TimeseriesDataPoint, TimeseriesResponse, Timestep
+
+_FIELDS = ("avg_high_price", "avg_low_price", "high_price_volume", "low_price_volume")
+
+
+def _pack(value: int | None) -> int:
+    return NULL_INT64 if value is None else value
+
+
+def _unpack(value: int) -> int | None:
+    return None if value == NULL_INT64 else value
+
+
+class TimeseriesHistory:
+    """Timeseries data for one item held in int64 arrays.
+
+    History only grows forwards: merging a response appends the points that
+    are newer than the current tail and ignores the rest. Missing values are
+    stored as `NULL_INT64`.
+    """
+
+    __slots__ = (
+        "avg_high_price",
+        "avg_low_price",
+        "high_price_volume",
+        "item_id",
+        "low_price_volume",
+        "timestamps",
+        "timestep",
+        "window",
+    )
+
+    def __init__(self, item_id: int, timestep: Timestep) -> None:
+        """Initialize an empty history.
+
+        Args:
+            item_id: The item this history belongs to.
+            timestep: The bucket size of the data points.
+        """
+        self.item_id = item_id
+        self.timestep = timestep
+        self.window = 0
+        self.timestamps: array[int] = array("q")
+        self.avg_high_price: array[int] = array("q")
+        self.avg_low_price: array[int] = array("q")
+        self.high_price_volume: array[int] = array("q")
+        self.low_price_volume: array[int] = array("q")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def copy(self) -> "TimeseriesHistory":
+        """Return an independent copy that later merges do not change."""
+        other = TimeseriesHistory(self.item_id, self.timestep)
+        other.window = self.window
+        for name in ("timestamps", *_FIELDS):
+            setattr(other, name, array("q", getattr(self, name)))
+        return other
+
+    @property
+    def tail(self) -> int | None:
+        """Return the timestamp of the newest point, or None if empty."""
+        return self.timestamps[-1] if self.timestamps else None
+
+    def merge(self, points: Iterable[TimeseriesDataPoint]) -> int:
+        """Append the points newer than the current tail.
+
+        Points may arrive in any order; duplicates are resolved by timestamp.
+
+        Args:
+            points: Data points from an API response.
+
+        Returns:
+            The number of points appended.
+        """
+        tail = self.tail
+        fresh: dict[int, TimeseriesDataPoint] = {}
+        count = 0
+        for point in points:
+            count += 1
+            if tail is None or point.timestamp > tail:
+                fresh[point.timestamp] = point
+        self.window = count
+
+        for timestamp in sorted(fresh):
+            point = fresh[timestamp]
+            self.timestamps.append(timestamp)
+            self.avg_high_price.append(_pack(point.avg_high_price))
+            self.avg_low_price.append(_pack(point.avg_low_price))
+            self.high_price_volume.append(_pack(point.high_price_volume))
+            self.low_price_volume.append(_pack(point.low_price_volume))
+        return len(fresh)
+
+    def to_points(self, last: int | None = None) -> list[TimeseriesDataPoint]:
+        """Materialize data points, oldest first.
+
+        Args:
+            last: Only return the newest `last` points. Returns all if None.
+        """
+        start = 0 if last is None else max(0, len(self) - last)
+        columns = [self.timestamps] + [getattr(self, name) for name in _FIELDS]
+        return [
+            TimeseriesDataPoint(
+                timestamp=timestamp,
+                avgHighPrice=_unpack(avg_high),
+                avgLowPrice=_unpack(avg_low),
+                highPriceVolume=_unpack(high_volume),
+                lowPriceVolume=_unpack(low_volume),
+            )
+            for timestamp, avg_high, avg_low, high_volume, low_volume in zip(
+                *(column[start:] for column in columns)
+            )
+        ]
+
+    def to_response(self, last: int | None = None) -> TimeseriesResponse:
+        """Build a TimeseriesResponse from the history.
+
+        Args:
+            last: Only include the newest `last` points. Includes all if None.
+        """
+        return TimeseriesResponse(item_id=self.item_id, data=self.to_points(last))
@@ -0,0 +1,127 @@
+"""Request lifecycle events for instrumenting API calls.
+
+Register a callback on a client's hook registry to observe every request:
+
+    >>> def log(event: RequestEvent) -> None:
+    ...     print(event.kind, event.path, event.status, event.durations)
+    >>> client = Client(user_agent="my-app/1.0")
+    >>> client.hooks.register(log, kinds={"model_parsed", "cache_hit"})
+
+A request that goes to the network emits, in order: `request_start`,
+`response_headers`, `body_received`, `json_decoded` and `model_parsed`.
+Requests answered by a cache emit `cache_hit` instead; requests that miss
+a cache emit `cache_miss` before `request_start`. Error responses stop
+after `body_received`, before the error is raised. Requests that fail without
+a complete response, such as connection errors and timeouts, emit
+`request_failed` instead of the remaining events.
+
+The client also emits `enriched` after joining latest or average prices with
+the item mapping. Its path is the kind of response enriched ("latest" or
+"average"), its size is the number of items and its durations hold "enrich".
+
+When no callbacks are registered, endpoints skip instrumentation entirely.
+"""
+
+import threading
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+EventKind = Literal[
+    "request_start",
+    "response_headers",
+    "body_received",
+    "json_decoded",
+    "model_parsed",
+    "cache_hit",
+    "cache_miss",
+    "enriched",
+    "request_failed",
+]
+
+EVENT_KINDS: tuple[EventKind, ...] = (
+    "request_start",
+    "response_headers",
+    "body_received",
+    "json_decoded",
+    "model_parsed",
+    "cache_hit",
+    "cache_miss",
+    "enriched",
+    "request_failed",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RequestEvent:
+    """A point in the lifecycle of an endpoint request.
+
+    Attributes:
+        kind: The lifecycle stage.
+        path: The endpoint path, e.g. "/latest", or the response kind for
+            `enriched` events.
+        params: The request's query parameters.
+        status: HTTP status code, once headers have been received.
+        size: Response body size in bytes, once the body has been received
+            or read from a cache backend. The item count for `enriched`.
+        durations: Seconds spent in each completed stage so far, keyed by
+            "headers", "body", "decode" and "parse", plus "total" on
+            `model_parsed`, or "enrich" on `enriched`.
+        cache: For cache events, which cache: "memory" or "backend".
+        error: For `request_failed`, the exception's class name, e.g.
+            "ConnectError".
+    """
+
+    kind: EventKind
+    path: str
+    params: Mapping[str, Any]
+    status: int | None = None
+    size: int | None = None
+    durations: Mapping[str, float] = field(default_factory=dict)
+    cache: str | None = None
+    error: str | None = None
+
+
+Callback = Callable[[RequestEvent], object]
+
+
+class Hooks:
+    """A thread-safe registry of request event callbacks.
+
+    Callbacks run synchronously on the requesting thread, and exceptions they
+    raise propagate to the caller. Registration copies the callback list, so
+    emitting events takes no lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._callbacks: tuple[tuple[Callback, frozenset[str] | None], ...] = ()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._callbacks)
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def register(self, callback: Callback, kinds: Collection[EventKind] | None = None) -> None:
+        """Call callback for every event, or only for the given kinds.
+
+        Args:
+            callback: Function taking a RequestEvent.
+            kinds: Optional event kinds to subscribe to. All kinds if None.
+        """
+        entry = (callback, None if kinds is None else frozenset(kinds))
+        with self._lock:
+            self._callbacks = (*self._callbacks, entry)
+
+    def unregister(self, callback: Callback) -> None:
+        """Remove every registration of callback."""
+        with self._lock:
+            self._callbacks = tuple(e for e in self._callbacks if e[0] != callback)
+
+    def emit(self, event: RequestEvent) -> None:
+        """Deliver an event to the subscribed callbacks."""
+        for callback, kinds in self._callbacks:
+            if kinds is None or event.kind in kinds:
+                callback(event)
@@ -0,0 +1,365 @@
+"""In-process metrics with OpenMetrics text exposition.
+
+Pass a registry to one or more clients and scrape it:
+
+    >>> from osrs_prices.metrics import MetricsRegistry, serve_metrics
+    >>> registry = MetricsRegistry()
+    >>> client = Client(user_agent="my-app/1.0", metrics=registry)
+    >>> server = serve_metrics(registry, port=9464)  # GET http://127.0.0.1:9464/metrics
+    >>> print(registry.render())
+
+Client metrics are collected from request hooks (see `osrs_prices.hooks`), so
+they add no cost to clients created without a registry. No external
+dependencies are required.
+"""
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.hooks import Hooks, RequestEvent
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+"""Histogram bucket upper bounds in seconds."""
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric(ABC):
+    """A metric family with a fixed set of label names."""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        if labels.keys() != set(self.label_names):
+            raise ValidationError(
+                f"{self.name} expects labels {self.label_names}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.label_names)
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Yield the family's sample lines."""
+
+    def render(self) -> str:
+        """Render the family in OpenMetrics text format."""
+        header = f"# TYPE {self.name} {self.type}\n# HELP {self.name} {self.help}\n"
+        return header + "".join(line + "\n" for line in self.samples())
+
+
+class Counter(_Metric):
+    """A monotonically increasing count."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        """Initialize the counter. The name should not end in `_total`."""
+        super().__init__(name, help, labels)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given label values."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield the family's sample lines."""
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}_total{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        """Initialize the gauge."""
+        super().__init__(name, help, labels)
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given label values."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield the family's sample lines."""
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """A distribution of observed values in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric family name.
+            help: Description of the metric.
+            labels: Label names.
+            buckets: Ascending bucket upper bounds; +Inf is added automatically.
+        """
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: bucket counts (non-cumulative, last is +Inf), sum.
+        self._values: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for the given label values."""
+        key = self._key(labels)
+        index = next((i for i, b in enumerate(self.buckets) if value <= b), len(self.buckets))
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the given label values."""
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> Iterator[str]:
+        """Yield the family's sample lines."""
+        with self._lock:
+            items = sorted((k, (list(c), t[0])) for k, (c, t) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if math.isinf(bound) else repr(float(bound))
+                labels = _format_labels((*self.label_names, "le"), (*key, le))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """A collection of metric families, with the client metrics built in."""
+
+    def __init__(self, namespace: str = "osrs_prices") -> None:
+        """Initialize the registry and its client metrics.
+
+        Args:
+            namespace: Prefix for every built-in metric name.
+        """
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        ns = namespace
+        endpoint = ("endpoint",)
+
+        self.requests = self.counter(f"{ns}_requests", "Requests sent to the API.", endpoint)
+        self.errors = self.counter(
+            f"{ns}_errors", "Error responses by HTTP status.", ("endpoint", "status")
+        )
+        self.connection_errors = self.counter(
+            f"{ns}_connection_errors",
+            "Requests that failed without a response, by exception type.",
+            ("endpoint", "error"),
+        )
+        self.rate_limited = self.counter(
+            f"{ns}_rate_limited", "Responses with status 429.", endpoint
+        )
+        self.response_bytes = self.counter(
+            f"{ns}_response_bytes", "Response body bytes received.", endpoint
+        )
+        self.request_seconds = self.histogram(
+            f"{ns}_request_seconds", "Time from request start to parsed model.", endpoint
+        )
+        self.decode_seconds = self.histogram(
+            f"{ns}_decode_seconds", "Time spent decoding JSON.", endpoint
+        )
+        self.validation_seconds = self.histogram(
+            f"{ns}_validation_seconds", "Time spent validating models.", endpoint
+        )
+        self.enrichment_seconds = self.histogram(
+            f"{ns}_enrichment_seconds", "Time spent joining prices with the mapping.", ("kind",)
+        )
+        self.cache_hits = self.counter(
+            f"{ns}_cache_hits", "Responses served from a cache.", ("endpoint", "cache")
+        )
+        self.cache_misses = self.counter(
+            f"{ns}_cache_misses", "Cache lookups that went to the API.", endpoint
+        )
+        self.mapping_cache_bytes = self.gauge(
+            f"{ns}_mapping_cache_bytes", "Size of the most recently cached mapping body."
+        )
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValidationError(
+                        f"Metric {metric.name} already registered as {existing.type}"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """Register a counter, or return the existing one with that name."""
+        metric = self._register(Counter(name, help, labels))
+        assert isinstance(metric, Counter)
+        return metric
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        """Register a gauge, or return the existing one with that name."""
+        metric = self._register(Gauge(name, help, labels))
+        assert isinstance(metric, Gauge)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Register a histogram, or return the existing one with that name."""
+        metric = self._register(Histogram(name, help, labels, buckets))
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in OpenMetrics text format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics) + "# EOF\n"
+
+    def observe(self, event: RequestEvent) -> None:
+        """Update the client metrics from a request event."""
+        kind = event.kind
+        path = event.path
+        if kind == "request_start":
+            self.requests.inc(endpoint=path)
+        elif kind == "body_received":
+            self.response_bytes.inc(event.size or 0, endpoint=path)
+            if event.status == 429:
+                self.rate_limited.inc(endpoint=path)
+            elif event.status != 200:
+                self.errors.inc(endpoint=path, status=str(event.status))
+        elif kind == "json_decoded":
+            self.decode_seconds.observe(event.durations["decode"], endpoint=path)
+        elif kind == "model_parsed":
+            self.validation_seconds.observe(event.durations["parse"], endpoint=path)
+            self.request_seconds.observe(event.durations["total"], endpoint=path)
+            if path == "/mapping":
+                self.mapping_cache_bytes.set(event.size or 0)
+        elif kind == "cache_hit":
+            self.cache_hits.inc(endpoint=path, cache=event.cache or "")
+            if path == "/mapping" and event.cache == "backend":
+                self.mapping_cache_bytes.set(event.size or 0)
+        elif kind == "cache_miss":
+            self.cache_misses.inc(endpoint=path)
+        elif kind == "enriched":
+            self.enrichment_seconds.observe(event.durations["enrich"], kind=path)
+        elif kind == "request_failed":
+            self.connection_errors.inc(endpoint=path, error=event.error or "")
+
+    def attach(self, hooks: Hooks) -> None:
+        """Collect client metrics from every event emitted to hooks."""
+        hooks.register(self.observe)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: "MetricsServer"
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """HTTP server exposing a registry at `/metrics`."""
+
+    daemon_threads = True
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int) -> None:
+        """Bind the server. Call `serve_forever` to start serving."""
+        self.registry = registry
+        super().__init__((host, port), _MetricsHandler)
+
+
+def serve_metrics(
+    registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464
+) -> MetricsServer:
+    """Serve a registry at `http://host:port/metrics` from a daemon thread.
+
+    Args:
+        registry: The registry to expose.
+        host: Interface to listen on.
+        port: Port to listen on. Use 0 to pick a free port.
+
+    Returns:
+        The running server. Call `shutdown()` and `server_close()` to stop it.
+    """
+    server = MetricsServer(registry, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -1,24 +1,61 @@
 """Pydantic models for the OSRS Prices API."""
 
-from osrs_prices.models.enriched import (
-    EnrichedAveragePrice,
-    EnrichedAverageResponse,
-    EnrichedLatestPrice,
-    EnrichedLatestResponse,
-    EnrichedTimeseriesResponse,
-)
-from osrs_prices.models.items import ItemMapping, MappingResponse
-from osrs_prices.models.prices import (
-    AveragePrice,
-    AverageResponse,
-    LatestPrice,
-    LatestResponse,
-)
-from osrs_prices.models.timeseries import (
-    Timestep,
-    TimeseriesDataPoint,
-    TimeseriesResponse,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from osrs_prices.models.enriched import (
+        EnrichedAveragePrice,
+        EnrichedAverageResponse,
+        EnrichedLatestPrice,
+        EnrichedLatestResponse,
+        EnrichedTimeseriesResponse,
+    )
+    from osrs_prices.models.items import ItemMapping, MappingResponse
+    from osrs_prices.models.prices import (
+        AveragePrice,
+        AverageResponse,
+        LatestPrice,
+        LatestResponse,
+    )
+    from osrs_prices.models.timeseries import (
+        Timestep,
+        TimeseriesDataPoint,
+        TimeseriesResponse,
+    )
+
+# Models are imported from their modules on first access, so importing one
+# model module does not build every pydantic schema in the package.
+_LAZY = {
+    "EnrichedAveragePrice": "osrs_prices.models.enriched",
+    "EnrichedAverageResponse": "osrs_prices.models.enriched",
+    "EnrichedLatestPrice": "osrs_prices.models.enriched",
+    "EnrichedLatestResponse": "osrs_prices.models.enriched",
+    "EnrichedTimeseriesResponse": "osrs_prices.models.enriched",
+    "ItemMapping": "osrs_prices.models.items",
+    "MappingResponse": "osrs_prices.models.items",
+    "AveragePrice": "osrs_prices.models.prices",
+    "AverageResponse": "osrs_prices.models.prices",
+    "LatestPrice": "osrs_prices.models.prices",
+    "LatestResponse": "osrs_prices.models.prices",
+    "Timestep": "osrs_prices.models.timeseries",
+    "TimeseriesDataPoint": "osrs_prices.models.timeseries",
+    "TimeseriesResponse": "osrs_prices.models.timeseries",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
 
 __all__ = [
     "AveragePrice",
@@ -1,22 +1,77 @@
-"""Pandas DataFrame conversion utilities for OSRS Prices API responses."""
+"""Pandas DataFrame conversion utilities for OSRS Prices API responses.
 
+DataFrames are built column by column in a single pass over the response,
+without an intermediate record per item. `from_api` builds the same frames
+straight from decoded JSON, skipping the pydantic models entirely.
+
+Both take an optional `DtypePolicy` choosing the column dtypes. The default
+keeps pandas' own inference (int64, or float64 with NaN where values are
+missing, including columns with no values at all); `COMPACT_DTYPES` uses
+nullable integers, pyarrow-backed strings and datetime columns for trade
+times, and needs a fraction of the memory. Empty responses give empty frames
+that still have the response's index and columns.
+"""
+
+import importlib.util
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
 import pandas as pd
 
-from osrs_prices.models import (
-    AverageResponse,
-    LatestResponse,
-    MappingResponse,
-    TimeseriesResponse,
+from osrs_prices.columns import (
+    BOOL_COLUMNS,
+    STRING_COLUMNS,
+    TIME_COLUMNS,
+    Columns,
+    Response,
+    ResponseKind,
+    from_json,
+    from_response,
 )
 
 
-def to_dataframe(
-    response: MappingResponse | LatestResponse | AverageResponse | TimeseriesResponse,
-) -> pd.DataFrame:
+@dataclass(frozen=True)
+class DtypePolicy:
+    """Which dtypes DataFrame columns are built with.
+
+    Attributes:
+        integers: "numpy" for int64, or float64 with NaN when a column has
+            missing values. "Int64" for pandas' nullable integers, or "Int32"
+            for nullable 32-bit integers where a column's values fit (Int64
+            otherwise).
+        strings: "infer" to let pandas choose, "object", "string" for
+            pandas' string dtype, "pyarrow" for pyarrow-backed strings
+            (falling back to "string" without pyarrow installed), or
+            "category".
+        datetimes: If True, the `high_time` and `low_time` columns of
+            `/latest` frames hold UTC datetimes instead of Unix seconds.
+    """
+
+    integers: Literal["numpy", "Int64", "Int32"] = "numpy"
+    strings: Literal["infer", "object", "string", "pyarrow", "category"] = "infer"
+    datetimes: bool = False
+
+
+DEFAULT_DTYPES = DtypePolicy()
+"""Pandas' own inference, as for a DataFrame built from records."""
+
+COMPACT_DTYPES = DtypePolicy(integers="Int32", strings="pyarrow", datetimes=True)
+"""Nullable 32-bit integers, pyarrow-backed strings and datetime trade times."""
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+
+
+def to_dataframe(response: Response, dtypes: DtypePolicy = DEFAULT_DTYPES) -> pd.DataFrame:
     """Convert an API response to a pandas DataFrame.
 
+    Enriched latest and average responses give one frame indexed by item ID,
+    with the item metadata columns followed by the price columns. Enriched
+    timeseries frames hold the item's metadata in `df.attrs["item"]`.
+
     Args:
-        response: Any of the API response types.
+        response: Any of the API response types, plain or enriched.
+        dtypes: The column dtypes to use, e.g. `COMPACT_DTYPES`.
 
     Returns:
         A pandas DataFrame with the response data.
@@ -30,60 +85,92 @@ def to_dataframe(
         >>> with Client(user_agent="my-app/1.0") as client:
         ...     mapping = client.get_mapping()
         ...     df = to_dataframe(mapping)
+        ...     small = to_dataframe(mapping, dtypes=COMPACT_DTYPES)
     """
-    if isinstance(response, MappingResponse):
-        return _mapping_to_df(response)
-    elif isinstance(response, LatestResponse):
-        return _latest_to_df(response)
-    elif isinstance(response, AverageResponse):
-        return _average_to_df(response)
-    elif isinstance(response, TimeseriesResponse):
-        return _timeseries_to_df(response)
-    else:
-        raise TypeError(f"Unsupported response type: {type(response)}")
+    return _build(from_response(response), dtypes)
 
 
-def _mapping_to_df(response: MappingResponse) -> pd.DataFrame:
-    """Convert MappingResponse to DataFrame."""
-    records = [item.model_dump() for item in response.items]
-    df = pd.DataFrame(records)
-    if not df.empty:
-        df = df.set_index("id")
-    return df
+def from_api(data: Any, kind: ResponseKind, dtypes: DtypePolicy = DEFAULT_DTYPES) -> pd.DataFrame:
+    """Convert decoded API JSON to a DataFrame without building models.
 
+    The result matches `to_dataframe` on the parsed response. The JSON is not
+    validated, so this is best suited to trusted sources such as the API
+    itself, a proxy or a recorded cassette.
 
-def _latest_to_df(response: LatestResponse) -> pd.DataFrame:
-    """Convert LatestResponse to DataFrame."""
-    records = []
-    for item_id, price in response.data.items():
-        record = price.model_dump(by_alias=False)
-        record["item_id"] = item_id
-        records.append(record)
-    df = pd.DataFrame(records)
-    if not df.empty:
-        df = df.set_index("item_id")
-    return df
+    Args:
+        data: The decoded JSON body of a response.
+        kind: Which endpoint the body came from: "mapping", "latest", "5m",
+            "1h" or "timeseries".
+        dtypes: The column dtypes to use, e.g. `COMPACT_DTYPES`.
 
+    Returns:
+        A pandas DataFrame with the response data.
 
-def _average_to_df(response: AverageResponse) -> pd.DataFrame:
-    """Convert AverageResponse to DataFrame."""
-    records = []
-    for item_id, price in response.data.items():
-        record = price.model_dump(by_alias=False)
-        record["item_id"] = item_id
-        records.append(record)
-    df = pd.DataFrame(records)
-    if not df.empty:
-        df = df.set_index("item_id")
-        df.attrs["timestamp"] = response.timestamp
-    return df
+    Raises:
+        ValueError: If kind is not supported.
+
+    Examples:
+        >>> body = httpx.get(url, headers=headers).json()
+        >>> df = from_api(body, "latest")
+    """
+    return _build(from_json(data, kind), dtypes)
 
 
-def _timeseries_to_df(response: TimeseriesResponse) -> pd.DataFrame:
-    """Convert TimeseriesResponse to DataFrame."""
-    records = [point.model_dump(by_alias=False) for point in response.data]
-    df = pd.DataFrame(records)
-    if not df.empty:
-        df = df.set_index("timestamp")
-        df.index = pd.to_datetime(df.index, unit="s", utc=True)
+def _numeric(values: list[int | None]) -> np.ndarray:
+    """Return an int64 array, or float64 with NaN for None if any are missing.
+
+    This matches what pandas infers for records, without per-value inference.
+    """
+    if None in values:
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=np.int64)
+
+
+def _nullable(values: list[int | None], dtype: Literal["Int64", "Int32"]) -> Any:
+    """Return a pandas nullable integer array, Int64 if values overflow Int32."""
+    mask = np.fromiter((value is None for value in values), dtype=np.bool_, count=len(values))
+    data = np.array([0 if value is None else value for value in values], dtype=np.int64)
+    if dtype == "Int32" and np.all((data >= _INT32_MIN) & (data <= _INT32_MAX)):
+        return pd.arrays.IntegerArray(data.astype(np.int32), mask)
+    return pd.arrays.IntegerArray(data, mask)
+
+
+def _strings(values: list[str | None], policy: DtypePolicy, index: pd.Index) -> Any:
+    if policy.strings == "infer":
+        return values
+    if policy.strings == "object":
+        # A Series keeps object dtype, where pandas 3 would convert an array to str.
+        return pd.Series(values, index=index, dtype=object)
+    if policy.strings == "category":
+        return pd.Categorical(values)
+    storage: Literal["python", "pyarrow"] = "python"
+    if policy.strings == "pyarrow" and importlib.util.find_spec("pyarrow") is not None:
+        storage = "pyarrow"
+    return pd.array(values, dtype=pd.StringDtype(storage))
+
+
+def _typed(columns: dict[str, list[Any]], policy: DtypePolicy, index: pd.Index) -> dict[str, Any]:
+    typed: dict[str, Any] = {}
+    for column, values in columns.items():
+        if column in BOOL_COLUMNS:
+            typed[column] = np.array(values, dtype=np.bool_)
+        elif column in STRING_COLUMNS:
+            typed[column] = _strings(values, policy, index)
+        elif policy.datetimes and column in TIME_COLUMNS:
+            typed[column] = pd.to_datetime(_numeric(values), unit="s", utc=True)
+        elif policy.integers == "numpy":
+            typed[column] = _numeric(values)
+        else:
+            typed[column] = _nullable(values, policy.integers)
+    return typed
+
+
+def _build(table: Columns, policy: DtypePolicy) -> pd.DataFrame:
+    if table.index_name == "timestamp":
+        seconds = np.array(table.index, dtype=np.int64)
+        index = pd.DatetimeIndex(pd.to_datetime(seconds, unit="s", utc=True), name="timestamp")
+    else:
+        index = pd.Index(np.array(table.index, dtype=np.int64), name=table.index_name)
+    df: pd.DataFrame = pd.DataFrame(_typed(table.columns, policy, index), index=index)
+    df.attrs.update(table.attrs)
     return df
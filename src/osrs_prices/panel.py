@@ -0,0 +1,250 @@
+"""Aligned timeseries for many items on one time axis.
+
+A `TimeseriesPanel` holds each timeseries field as a 2-D float64 array of
+shape (items, timestamps). The time axis is the sorted union of every item's
+timestamps, and an item with no point (or no value) at a timestamp has NaN
+there. Every item's points are scattered into the arrays in one vectorised
+step, instead of building a DataFrame per item and concatenating and pivoting
+them.
+
+Requires numpy, which is installed with the pandas extra:
+
+    >>> panel = TimeseriesPanel.fetch(client, [4151, 11802, 2], "1h")
+    >>> panel["avg_high_price"].shape
+    (3, 365)
+    >>> df = panel.to_dataframe()  # MultiIndex (item_id, timestamp)
+"""
+
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from osrs_prices.columns import TIMESERIES_COLUMNS, Columns, from_json, from_response
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models import EnrichedTimeseriesResponse, TimeseriesResponse, Timestep
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from osrs_prices.client import Client
+
+FIELDS = tuple(TIMESERIES_COLUMNS)
+"""The timeseries fields held by every panel, in model field order."""
+
+
+class TimeseriesPanel:
+    """Timeseries of many items aligned on the union of their timestamps.
+
+    Attributes:
+        item_ids: The item ID of each row, as an int64 array.
+        timestamps: The sorted union of the items' timestamps in Unix
+            seconds, as an int64 array.
+    """
+
+    __slots__ = ("_data", "_rows", "item_ids", "timestamps")
+
+    def __init__(
+        self, item_ids: np.ndarray, timestamps: np.ndarray, data: dict[str, np.ndarray]
+    ) -> None:
+        """Initialize a panel from aligned arrays.
+
+        Args:
+            item_ids: The item ID of each row.
+            timestamps: The sorted timestamp of each column.
+            data: A (items, timestamps) float64 array for each of `FIELDS`.
+
+        Raises:
+            ValidationError: If an item ID repeats or an array has the wrong
+                shape.
+        """
+        self.item_ids = item_ids
+        self.timestamps = timestamps
+        self._rows = {int(item_id): row for row, item_id in enumerate(item_ids)}
+        if len(self._rows) != len(item_ids):
+            raise ValidationError("Item IDs in a panel must be unique")
+        shape = (len(item_ids), len(timestamps))
+        for field in FIELDS:
+            if data[field].shape != shape:
+                raise ValidationError(f"{field} has shape {data[field].shape}, expected {shape}")
+        self._data = data
+
+    @classmethod
+    def from_responses(
+        cls,
+        responses: Mapping[int, TimeseriesResponse] | Iterable[EnrichedTimeseriesResponse],
+    ) -> "TimeseriesPanel":
+        """Build a panel from parsed timeseries responses.
+
+        Args:
+            responses: Plain responses keyed by item ID, or enriched responses,
+                which carry their item.
+
+        Returns:
+            A panel with one row per response, in the order given.
+        """
+        if isinstance(responses, Mapping):
+            items = [(item_id, from_response(response)) for item_id, response in responses.items()]
+        else:
+            items = [(response.item.id, from_response(response)) for response in responses]
+        return cls._build(items)
+
+    @classmethod
+    def from_api(cls, bodies: Mapping[int, Any]) -> "TimeseriesPanel":
+        """Build a panel from decoded /timeseries JSON, without building models.
+
+        Args:
+            bodies: The decoded JSON body of each item's response, keyed by
+                item ID.
+
+        Returns:
+            A panel with one row per body, in the order given.
+        """
+        return cls._build(
+            [(item_id, from_json(body, "timeseries")) for item_id, body in bodies.items()]
+        )
+
+    @classmethod
+    def fetch(
+        cls,
+        client: "Client",
+        item_ids: Iterable[int],
+        timestep: Timestep,
+        max_workers: int = 1,
+    ) -> "TimeseriesPanel":
+        """Fetch the timeseries of several items and align them.
+
+        Responses go through `Client.get_timeseries`, so the timeseries and
+        response caches apply.
+
+        Args:
+            client: The client to fetch with.
+            item_ids: The items to fetch, one row each.
+            timestep: The time interval for data points ("5m", "1h", "6h", or "24h").
+            max_workers: Number of requests to run concurrently.
+
+        Returns:
+            A panel with one row per item, in the order given.
+        """
+        item_ids = list(item_ids)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = executor.map(
+                lambda item_id: client.get_timeseries(item_id, timestep), item_ids
+            )
+            return cls.from_responses(dict(zip(item_ids, responses)))
+
+    @classmethod
+    def _build(cls, items: list[tuple[int, Columns]]) -> "TimeseriesPanel":
+        item_ids = np.array([item_id for item_id, _ in items], dtype=np.int64)
+        counts = [len(columns.index) for _, columns in items]
+        stamps = np.fromiter(
+            chain.from_iterable(columns.index for _, columns in items),
+            dtype=np.int64,
+            count=sum(counts),
+        )
+        timestamps, cols = np.unique(stamps, return_inverse=True)
+        rows = np.repeat(np.arange(len(items)), counts)
+        data = {}
+        for field in FIELDS:
+            values = list(chain.from_iterable(columns.columns[field] for _, columns in items))
+            grid = np.full((len(items), len(timestamps)), np.nan)
+            # None becomes NaN when converted to float64.
+            grid[rows, cols] = np.array(values, dtype=np.float64)
+            data[field] = grid
+        return cls(item_ids, timestamps, data)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return the panel's (items, timestamps) shape."""
+        return len(self.item_ids), len(self.timestamps)
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._rows
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Return a field's (items, timestamps) array."""
+        return self._data[field]
+
+    def item(self, item_id: int) -> dict[str, np.ndarray]:
+        """Return one item's row of every field.
+
+        Args:
+            item_id: The item ID.
+
+        Returns:
+            A 1-D array per field, aligned with `timestamps`.
+
+        Raises:
+            KeyError: If the item is not in the panel.
+        """
+        row = self._rows[item_id]
+        return {field: self._data[field][row] for field in FIELDS}
+
+    def to_dataframe(self, dropna: bool = False) -> "pd.DataFrame":
+        """Return the panel as a pandas DataFrame in long form.
+
+        Args:
+            dropna: If True, leave out rows where an item has no values at a
+                timestamp. Otherwise every item has a row at every timestamp.
+
+        Returns:
+            A DataFrame with an (item_id, timestamp) MultiIndex, with UTC
+            datetimes for timestamps, and a float64 column per field.
+        """
+        import pandas as pd
+
+        index = pd.MultiIndex.from_product(
+            [
+                pd.Index(self.item_ids, name="item_id"),
+                pd.DatetimeIndex(
+                    pd.to_datetime(self.timestamps, unit="s", utc=True), name="timestamp"
+                ),
+            ]
+        )
+        df: pd.DataFrame = pd.DataFrame(
+            {field: self._data[field].ravel() for field in FIELDS}, index=index
+        )
+        return df.dropna(how="all") if dropna else df
+
+    def to_wide(self, field: str) -> "pd.DataFrame":
+        """Return one field as a pandas DataFrame of timestamps by items.
+
+        Args:
+            field: One of `FIELDS`.
+
+        Returns:
+            A DataFrame indexed by UTC timestamp with a column per item ID.
+        """
+        import pandas as pd
+
+        wide: pd.DataFrame = pd.DataFrame(
+            self._data[field].T,
+            index=pd.DatetimeIndex(
+                pd.to_datetime(self.timestamps, unit="s", utc=True), name="timestamp"
+            ),
+            columns=pd.Index(self.item_ids, name="item_id"),
+        )
+        return wide
+
+    def to_xarray(self) -> Any:
+        """Return the panel as an xarray Dataset (requires xarray).
+
+        Returns:
+            A Dataset with a variable per field over ("item_id", "timestamp")
+            dimensions. Timestamps are UTC datetimes without a time zone, as
+            xarray does not support time zone aware coordinates.
+        """
+        import xarray as xr
+
+        return xr.Dataset(
+            {field: (("item_id", "timestamp"), self._data[field]) for field in FIELDS},
+            coords={
+                "item_id": self.item_ids,
+                "timestamp": self.timestamps.astype("datetime64[s]"),
+            },
+        )
@@ -0,0 +1,99 @@
+"""Polars DataFrame conversion utilities for OSRS Prices API responses.
+
+Frames are built column by column from the same single pass over the response
+as `osrs_prices.pandas`, with one typed Series per column, so neither pandas
+nor pyarrow is needed. `from_api` builds the same frames straight from decoded
+JSON.
+
+Integer columns are nullable, and the row index becomes the first column
+("id", "item_id" or "timestamp"). Polars frames have no metadata, so
+response-level values such as an average's `timestamp` are not included; read
+them from the response, or use `osrs_prices.arrow` to keep them.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import polars as pl
+
+from osrs_prices.columns import (
+    BOOL_COLUMNS,
+    STRING_COLUMNS,
+    TIME_COLUMNS,
+    Columns,
+    Response,
+    ResponseKind,
+    from_json,
+    from_response,
+)
+
+
+def to_polars(response: Response, datetimes: bool = False) -> pl.DataFrame:
+    """Convert an API response to a Polars DataFrame.
+
+    Args:
+        response: Any of the API response types, plain or enriched.
+        datetimes: If True, the `high_time` and `low_time` columns hold UTC
+            datetimes instead of Unix seconds.
+
+    Returns:
+        A Polars DataFrame with the response data.
+
+    Raises:
+        TypeError: If the response type is not supported.
+
+    Examples:
+        >>> from osrs_prices import Client
+        >>> from osrs_prices.polars import to_polars
+        >>> with Client(user_agent="my-app/1.0") as client:
+        ...     df = to_polars(client.get_latest_with_mapping())
+        >>> df.filter(pl.col("members")).top_k(10, by="high")
+    """
+    return _build(from_response(response), datetimes)
+
+
+def from_api(data: Any, kind: ResponseKind, datetimes: bool = False) -> pl.DataFrame:
+    """Convert decoded API JSON to a Polars DataFrame without building models.
+
+    The result matches `to_polars` on the parsed response. The JSON is not
+    validated, so this is best suited to trusted sources such as the API
+    itself, a proxy or a recorded cassette.
+
+    Args:
+        data: The decoded JSON body of a response.
+        kind: Which endpoint the body came from: "mapping", "latest", "5m",
+            "1h" or "timeseries".
+        datetimes: If True, the `high_time` and `low_time` columns hold UTC
+            datetimes instead of Unix seconds.
+
+    Returns:
+        A Polars DataFrame with the response data.
+
+    Raises:
+        ValueError: If kind is not supported.
+    """
+    return _build(from_json(data, kind), datetimes)
+
+
+def _datetimes(name: str, seconds: Sequence[int | None]) -> pl.Series:
+    series = pl.from_epoch(pl.Series(name, seconds, dtype=pl.Int64), time_unit="s")
+    return series.dt.replace_time_zone("UTC")
+
+
+def _series(column: str, values: list[Any], datetimes: bool) -> pl.Series:
+    if column in BOOL_COLUMNS:
+        return pl.Series(column, values, dtype=pl.Boolean)
+    if column in STRING_COLUMNS:
+        return pl.Series(column, values, dtype=pl.Utf8)
+    if datetimes and column in TIME_COLUMNS:
+        return _datetimes(column, values)
+    return pl.Series(column, values, dtype=pl.Int64)
+
+
+def _build(table: Columns, datetimes: bool) -> pl.DataFrame:
+    if table.index_name == "timestamp":
+        index = _datetimes("timestamp", table.index)
+    else:
+        index = pl.Series(table.index_name, table.index, dtype=pl.Int64)
+    series = [_series(column, values, datetimes) for column, values in table.columns.items()]
+    return pl.DataFrame([index, *series])
@@ -0,0 +1,131 @@
+"""Share a warmed-up item mapping with pre-forked worker processes.
+
+Servers such as gunicorn fork their workers from a master process. Loading
+the mapping and its lookup indexes once in the master, before the fork, lets
+every worker start with them already in memory, and freezing the garbage
+collector keeps collections in the workers from touching (and so copying)
+the pages those objects live on.
+
+In the master, e.g. from gunicorn's `on_starting` or at module import with
+`preload_app = True`:
+
+    >>> from osrs_prices import prefork
+    >>> with Client(user_agent="my-app/1.0") as client:
+    ...     prefork.warm_up(client)
+
+In each worker, e.g. from gunicorn's `post_fork`:
+
+    >>> client = Client(user_agent="my-app/1.0")
+    >>> prefork.adopt(client)
+
+A client created in the master and used after the fork must drop the
+connections it inherited, since they are shared with the master. Call
+`client.reset_after_fork()` in the worker, or let `reset_on_fork` do it
+automatically in every forked child.
+"""
+
+import gc
+import os
+import weakref
+from dataclasses import dataclass
+
+from osrs_prices.client import Client
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models.items import ItemMapping, MappingResponse
+
+
+@dataclass(frozen=True, slots=True)
+class WarmMapping:
+    """An item mapping with its lookup indexes, built once and shared.
+
+    Attributes:
+        mapping: The item mapping response.
+        by_id: Item ID to ItemMapping.
+        by_name: Exact item name to item ID.
+    """
+
+    mapping: MappingResponse
+    by_id: dict[int, ItemMapping]
+    by_name: dict[str, int]
+
+    @classmethod
+    def from_mapping(cls, mapping: MappingResponse) -> "WarmMapping":
+        """Build the lookup indexes for a mapping response."""
+        return cls(
+            mapping=mapping,
+            by_id={item.id: item for item in mapping.items},
+            by_name={item.name: item.id for item in mapping.items},
+        )
+
+
+_warmed: WarmMapping | None = None
+
+
+def warm_up(client: Client, freeze: bool = True) -> WarmMapping:
+    """Load the mapping and its indexes for processes forked after this call.
+
+    The client adopts the result itself, and it is kept for `adopt` to hand
+    to clients in forked workers.
+
+    Args:
+        client: The client to fetch the mapping with.
+        freeze: If True, collect garbage and then move every tracked object
+            into the permanent generation with `gc.freeze()`, so the
+            collector in forked children never writes to their pages.
+
+    Returns:
+        The warmed mapping.
+    """
+    global _warmed
+    warm = WarmMapping.from_mapping(client.get_mapping())
+    client.adopt_mapping(warm)
+    _warmed = warm
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return warm
+
+
+def warmed() -> WarmMapping | None:
+    """Return the mapping loaded by `warm_up` in this or a parent process."""
+    return _warmed
+
+
+def adopt(client: Client) -> WarmMapping:
+    """Give a client the mapping loaded by `warm_up`.
+
+    Args:
+        client: The client to adopt the mapping, typically one created in a
+            forked worker.
+
+    Returns:
+        The adopted mapping.
+
+    Raises:
+        ValidationError: If `warm_up` has not been called in this process or
+            a parent process.
+    """
+    if _warmed is None:
+        raise ValidationError("No warmed mapping; call prefork.warm_up() before forking")
+    client.adopt_mapping(_warmed)
+    return _warmed
+
+
+def reset_on_fork(client: Client) -> None:
+    """Reset a client's HTTP connections in every child forked from now on.
+
+    The client is held by a weak reference, so registering it does not keep
+    it alive. Does nothing on platforms without `os.fork`.
+
+    Args:
+        client: The client to reset with `Client.reset_after_fork`.
+    """
+    ref = weakref.ref(client)
+
+    def reset() -> None:
+        target = ref()
+        if target is not None:
+            target.reset_after_fork()
+
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=reset)
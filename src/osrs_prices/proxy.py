@@ -0,0 +1,286 @@
+"""Caching reverse proxy for the OSRS Prices API.
+
+Run one proxy per host and point every local client at it:
+
+    python -m osrs_prices.proxy --user-agent "my-app/1.0 contact@example.com"
+
+    client = Client(user_agent="my-app/1.0", base_url="http://127.0.0.1:8765")
+
+The proxy serves `/latest`, `/mapping`, `/5m`, `/1h` and `/timeseries` with the
+same paths and query parameters as the upstream API. Responses are cached with
+endpoint-aware TTLs, concurrent requests for the same URL share one upstream
+fetch, and all upstream traffic passes through a single rate limiter.
+"""
+
+import argparse
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+from osrs_prices.cache import CachePolicy, LRUCache
+from osrs_prices.client import validate_user_agent
+from osrs_prices.constants import BASE_URL, DEFAULT_CACHE_TTL, DEFAULT_TIMEOUT
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_RATE_LIMIT = 5.0  # upstream requests per second
+DEFAULT_BURST = 10
+
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    "/latest": CachePolicy(ttl=60.0),
+    "/mapping": CachePolicy(ttl=DEFAULT_CACHE_TTL),
+    "/5m": CachePolicy(ttl=60.0),
+    "/1h": CachePolicy(ttl=300.0),
+    "/timeseries": CachePolicy(ttl=300.0),
+}
+"""Cache policy for each proxied path."""
+
+HISTORICAL_POLICY = CachePolicy(ttl=86400.0)
+"""Policy for `/5m` and `/1h` requests with a `timestamp`, which never change."""
+
+
+class RateLimiter:
+    """A thread-safe token bucket that blocks callers until a token is free."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Maximum number of tokens held at once.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+@dataclass(frozen=True)
+class ProxyResponse:
+    """A response served by the proxy."""
+
+    status: int
+    body: bytes
+    content_type: str
+    created: float
+
+
+class _Flight:
+    """An upstream fetch that concurrent requests for the same key wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: ProxyResponse | None = None
+
+
+class ProxyServer(ThreadingHTTPServer):
+    """HTTP server that proxies and caches the OSRS Prices API."""
+
+    daemon_threads = True
+    verbose = False
+
+    def __init__(
+        self,
+        user_agent: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        upstream_url: str = BASE_URL,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_BURST,
+        max_entries: int = 10_000,
+        max_bytes: int | None = 512 * 1024 * 1024,
+        upstream: httpx.Client | None = None,
+    ) -> None:
+        """Initialize and bind the proxy.
+
+        Args:
+            user_agent: Descriptive User-Agent sent upstream on behalf of all clients.
+            host: Interface to listen on.
+            port: Port to listen on. Use 0 to pick a free port.
+            upstream_url: Root URL of the upstream API.
+            rate_limit: Maximum sustained upstream requests per second.
+            burst: Maximum upstream requests sent back to back.
+            max_entries: Maximum number of cached responses.
+            max_bytes: Approximate memory budget for cached responses.
+            upstream: Optional preconfigured httpx client for upstream requests.
+                Its User-Agent header is replaced with `user_agent`.
+
+        Raises:
+            ValidationError: If the user_agent is invalid or blocked.
+        """
+        validate_user_agent(user_agent)
+        self.upstream_url = upstream_url.rstrip("/")
+        self.upstream = upstream or httpx.Client(timeout=DEFAULT_TIMEOUT)
+        self.upstream.headers["User-Agent"] = user_agent
+        self.limiter = RateLimiter(rate_limit, burst)
+        self.cache: LRUCache[str, ProxyResponse] = LRUCache(
+            max_entries=max_entries, max_bytes=max_bytes
+        )
+        self._flights: dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self.upstream_requests = 0
+        super().__init__((host, port), _Handler)
+
+    @property
+    def url(self) -> str:
+        """Return the base URL clients should use."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @staticmethod
+    def policy_for(path: str, params: dict[str, str]) -> CachePolicy:
+        """Return the cache policy for a request."""
+        if path in ("/5m", "/1h") and "timestamp" in params:
+            return HISTORICAL_POLICY
+        return CACHE_POLICIES[path]
+
+    def fetch(self, path: str, params: dict[str, str]) -> tuple[ProxyResponse, str]:
+        """Serve a request from the cache or upstream.
+
+        Args:
+            path: One of the proxied API paths.
+            params: Query parameters.
+
+        Returns:
+            The response and its cache status: "HIT", "MISS" or "COALESCED".
+        """
+        key = f"{path}?{urlencode(sorted(params.items()))}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, "HIT"
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            assert flight.response is not None
+            return flight.response, "COALESCED"
+
+        try:
+            response = self._fetch_upstream(path, params)
+            if response.status == 200:
+                ttl = self.policy_for(path, params).ttl
+                self.cache.set(key, response, ttl=ttl, size=len(response.body))
+            flight.response = response
+        finally:
+            if flight.response is None:
+                flight.response = _error_response(502, "Upstream request failed")
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+        return response, "MISS"
+
+    def _fetch_upstream(self, path: str, params: dict[str, str]) -> ProxyResponse:
+        self.limiter.acquire()
+        with self._flights_lock:
+            self.upstream_requests += 1
+        try:
+            upstream = self.upstream.get(f"{self.upstream_url}{path}", params=params or None)
+        except httpx.HTTPError as exc:
+            return _error_response(502, f"Upstream request failed: {exc}")
+        return ProxyResponse(
+            status=upstream.status_code,
+            body=upstream.content,
+            content_type=upstream.headers.get("content-type", "application/json"),
+            created=time.monotonic(),
+        )
+
+    def server_close(self) -> None:
+        """Stop listening and close the upstream client."""
+        super().server_close()
+        self.upstream.close()
+
+
+def _error_response(status: int, message: str) -> ProxyResponse:
+    return ProxyResponse(
+        status=status,
+        body=json.dumps({"error": message}).encode(),
+        content_type="application/json",
+        created=time.monotonic(),
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: ProxyServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle's algorithm on, the
+    # body of every response on a kept-alive connection waits for a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path not in CACHE_POLICIES:
+            self._send(_error_response(404, f"Unknown path: {path}"), "NONE")
+            return
+        params = dict(parse_qsl(url.query))
+        response, status = self.server.fetch(path, params)
+        self._send(response, status)
+
+    def _send(self, response: ProxyResponse, cache_status: str) -> None:
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.send_header("X-Cache", cache_status)
+        self.send_header("Age", str(int(time.monotonic() - response.created)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def main() -> None:
+    """Run the proxy until interrupted."""
+    parser = argparse.ArgumentParser(description="Run a caching proxy for the OSRS Prices API.")
+    parser.add_argument("--user-agent", required=True, help="User-Agent sent upstream")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--upstream", default=BASE_URL, help="upstream API root URL")
+    parser.add_argument("--rate-limit", type=float, default=DEFAULT_RATE_LIMIT)
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    with ProxyServer(
+        user_agent=args.user_agent,
+        host=args.host,
+        port=args.port,
+        upstream_url=args.upstream,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+    ) as server:
+        server.verbose = args.verbose
+        print(f"osrs_prices proxy listening on {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Record and replay API traffic for offline, reproducible runs.
+
+Record real responses once:
+
+    >>> from osrs_prices import Client
+    >>> from osrs_prices.replay import Cassette, RecordingTransport
+    >>> cassette = Cassette()
+    >>> with Client(user_agent="my-app/1.0", transport=RecordingTransport(cassette)) as client:
+    ...     client.get_mapping()
+    ...     client.get_5m_average()
+    >>> cassette.save("prices.cassette")
+
+then replay them without network access:
+
+    >>> from osrs_prices.replay import ReplayTransport
+    >>> transport = ReplayTransport(Cassette.load("prices.cassette"), latency=0.05)
+    >>> with Client(user_agent="my-app/1.0", transport=transport) as client:
+    ...     mapping = client.get_mapping()
+
+Requests with a `timestamp` parameter are served from the recorded snapshot
+of the same path whose timestamp is nearest to the one requested.
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+import httpx
+
+from osrs_prices.exceptions import ValidationError
+
+_FORMAT_VERSION = 1
+
+# `Response.read` returns the decoded body, so these no longer describe it.
+_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """A single recorded request and response."""
+
+    path: str
+    params: dict[str, str]
+    status: int
+    body: str
+    content_type: str = "application/json"
+    recorded_at: float = field(default_factory=time.time)
+
+    @property
+    def snapshot_time(self) -> float:
+        """Return the time the response describes.
+
+        This is the `timestamp` query parameter if present, otherwise the
+        `timestamp` field of an average response, otherwise the recording time.
+        """
+        if "timestamp" in self.params:
+            return float(self.params["timestamp"])
+        if self.path in ("/5m", "/1h") and self.status == 200:
+            timestamp = json.loads(self.body).get("timestamp")
+            if timestamp is not None:
+                return float(timestamp)
+        return self.recorded_at
+
+
+class Cassette:
+    """A thread-safe collection of recorded interactions."""
+
+    def __init__(self, interactions: list[Interaction] | None = None) -> None:
+        """Initialize the cassette.
+
+        Args:
+            interactions: Optional interactions to start with.
+        """
+        self._interactions = list(interactions or [])
+        self._lock = threading.Lock()
+
+    @property
+    def interactions(self) -> list[Interaction]:
+        """Return a copy of the recorded interactions."""
+        with self._lock:
+            return list(self._interactions)
+
+    def add(self, interaction: Interaction) -> None:
+        """Record an interaction."""
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the cassette as gzip-compressed JSON lines."""
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"version": _FORMAT_VERSION}) + "\n")
+            for interaction in self.interactions:
+                f.write(json.dumps(asdict(interaction), separators=(",", ":")) + "\n")
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "Cassette":
+        """Read a cassette written by `save`.
+
+        Raises:
+            ValidationError: If the file is not a supported cassette.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != _FORMAT_VERSION:
+                raise ValidationError(f"Unsupported cassette version: {header.get('version')}")
+            return cls([Interaction(**json.loads(line)) for line in f if line.strip()])
+
+
+def _path(request: httpx.Request, base_path: str) -> str:
+    path = request.url.path
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path) :]
+    return path or "/"
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """A transport that records every response from an inner transport."""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: httpx.BaseTransport | None = None,
+        base_path: str = "/api/v1/osrs",
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            cassette: Cassette to record into.
+            transport: Transport that performs the real requests.
+            base_path: URL path prefix stripped from recorded paths, so that
+                recordings replay against any base URL.
+        """
+        self._cassette = cassette
+        self._transport = transport or httpx.HTTPTransport()
+        self._base_path = base_path.rstrip("/")
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request and record the response."""
+        response = self._transport.handle_request(request)
+        body = response.read()
+        self._cassette.add(
+            Interaction(
+                path=_path(request, self._base_path),
+                params=dict(request.url.params),
+                status=response.status_code,
+                body=body.decode("utf-8"),
+                content_type=response.headers.get("content-type", "application/json"),
+            )
+        )
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _ENCODING_HEADERS
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+        )
+
+    def close(self) -> None:
+        """Close the inner transport."""
+        self._transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """A transport that serves responses from a cassette."""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        throughput: float | None = None,
+        base_path: str = "/api/v1/osrs",
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            cassette: Cassette to replay.
+            latency: Seconds to wait before every response.
+            throughput: Optional simulated bandwidth in bytes per second.
+            base_path: URL path prefix stripped from request paths.
+        """
+        self._latency = latency
+        self._throughput = throughput
+        self._base_path = base_path.rstrip("/")
+        # Index by (path, params without timestamp); later recordings win.
+        self._exact: dict[tuple[str, tuple[tuple[str, str], ...]], Interaction] = {}
+        # Snapshot times are computed once, since they may parse the body.
+        self._snapshots: dict[
+            tuple[str, tuple[tuple[str, str], ...]], list[tuple[float, Interaction]]
+        ] = {}
+        for interaction in cassette.interactions:
+            if interaction.status != 200:
+                continue
+            params = sorted(interaction.params.items())
+            self._exact[(interaction.path, tuple(params))] = interaction
+            key = (interaction.path, tuple(p for p in params if p[0] != "timestamp"))
+            self._snapshots.setdefault(key, []).append((interaction.snapshot_time, interaction))
+
+    def find(self, path: str, params: dict[str, str]) -> Interaction | None:
+        """Return the recorded interaction that best matches a request."""
+        items = sorted(params.items())
+        exact = self._exact.get((path, tuple(items)))
+        if exact is not None or "timestamp" not in params:
+            return exact
+
+        candidates = self._snapshots.get((path, tuple(p for p in items if p[0] != "timestamp")))
+        if not candidates:
+            return None
+        target = float(params["timestamp"])
+        return min(candidates, key=lambda c: abs(c[0] - target))[1]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve the best matching recorded response, or a 404."""
+        interaction = self.find(_path(request, self._base_path), dict(request.url.params))
+        if interaction is None:
+            status, content_type = 404, "application/json"
+            body = json.dumps({"error": f"No recording for {request.url}"}).encode()
+        else:
+            status, content_type = interaction.status, interaction.content_type
+            body = interaction.body.encode("utf-8")
+
+        delay = self._latency
+        if self._throughput:
+            delay += len(body) / self._throughput
+        if delay > 0:
+            time.sleep(delay)
+
+        return httpx.Response(
+            status, headers={"content-type": content_type}, content=body, request=request
+        )
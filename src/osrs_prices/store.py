@@ -0,0 +1,297 @@
+"""Append-only columnar storage for price snapshot history.
+
+Snapshots are stored per timestep ("5m", "1h" or "latest") in chunk directories
+that each cover a fixed span of time. Every chunk holds one binary file per
+column plus a time index, and rows within a snapshot are sorted by item ID so
+a single item can be located with a binary search. Reads are memory-mapped, so
+a range query only touches the pages it needs.
+
+Example:
+    >>> from osrs_prices import Client
+    >>> from osrs_prices.store import SnapshotStore
+    >>> store = SnapshotStore("./history")
+    >>> with Client(user_agent="my-app/1.0") as client:
+    ...     store.write_average(client.get_5m_average(), "5m")
+    >>> whip = store.query("5m", start=1704067200, item_id=4151)
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from osrs_prices.constants import NULL_INT64
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models.prices import AveragePrice, AverageResponse, LatestPrice, LatestResponse
+
+DEFAULT_CHUNK_SPAN = 86400  # 1 day in seconds
+
+AVERAGE_COLUMNS = ("avg_high_price", "high_price_volume", "avg_low_price", "low_price_volume")
+LATEST_COLUMNS = ("high", "high_time", "low", "low_time")
+
+_SCHEMAS: dict[str, tuple[str, ...]] = {
+    "5m": AVERAGE_COLUMNS,
+    "1h": AVERAGE_COLUMNS,
+    "latest": LATEST_COLUMNS,
+}
+
+_INDEX_FILE = "index.bin"
+_ID_FILE = "item_id.bin"
+_ITEMSIZE = 8
+
+
+@dataclass
+class StoreSlice:
+    """Rows returned by a range query.
+
+    Each row is one item in one snapshot. All arrays have the same length and
+    missing values are stored as `NULL_INT64`.
+    """
+
+    timestamps: array[int] = field(default_factory=lambda: array("q"))
+    item_ids: array[int] = field(default_factory=lambda: array("q"))
+    columns: dict[str, array[int]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+
+class _MappedColumn:
+    """A read-only memory map over a column file of int64 values."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._mmap).cast("q") if self._mmap is not None else None
+
+    def bisect(self, value: int, lo: int, hi: int) -> tuple[int, int]:
+        """Return the [left, right) bounds of `value` within rows lo..hi."""
+        assert self._view is not None
+        return bisect_left(self._view, value, lo, hi), bisect_right(self._view, value, lo, hi)
+
+    def read(self, start: int, stop: int, out: array[int]) -> None:
+        """Append rows start..stop to `out` without mapping anything else."""
+        if self._mmap is not None and stop > start:
+            out.frombytes(self._mmap[start * _ITEMSIZE : stop * _ITEMSIZE])
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+
+class SnapshotStore:
+    """Local append-only store for `/5m`, `/1h` and `/latest` snapshots."""
+
+    def __init__(self, root: str | os.PathLike[str], chunk_span: int = DEFAULT_CHUNK_SPAN) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the store. Created if it does not exist.
+            chunk_span: Seconds of history covered by each chunk directory.
+        """
+        if chunk_span <= 0:
+            raise ValidationError("chunk_span must be positive")
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._chunk_span = chunk_span
+        self._last_timestamp: dict[str, int | None] = {}
+
+    @property
+    def root(self) -> Path:
+        """Return the store directory."""
+        return self._root
+
+    def write_average(self, response: AverageResponse, timestep: str) -> None:
+        """Append a `/5m` or `/1h` snapshot.
+
+        Args:
+            response: The average response to store.
+            timestep: "5m" or "1h".
+
+        Raises:
+            ValidationError: If the timestep is unknown or the snapshot is not
+                newer than the last stored one.
+        """
+        if _SCHEMAS.get(timestep) is not AVERAGE_COLUMNS:
+            raise ValidationError(
+                f"Average snapshots must use timestep '5m' or '1h', got {timestep!r}"
+            )
+        self._append(timestep, response.timestamp, response.data)
+
+    def write_latest(self, response: LatestResponse, timestamp: int | None = None) -> None:
+        """Append a `/latest` snapshot.
+
+        Args:
+            response: The latest response to store.
+            timestamp: Snapshot time. Defaults to the current Unix time, since
+                `/latest` responses carry no timestamp of their own.
+
+        Raises:
+            ValidationError: If the snapshot is not newer than the last stored one.
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        self._append("latest", timestamp, response.data)
+
+    def timestamps(self, timestep: str) -> list[int]:
+        """Return the timestamps of all stored snapshots for a timestep."""
+        result: list[int] = []
+        for chunk in self._chunks(timestep):
+            index = self._read_index(chunk)
+            result.extend(index[0::3])
+        return result
+
+    def query(
+        self,
+        timestep: str,
+        start: int | None = None,
+        end: int | None = None,
+        item_id: int | None = None,
+    ) -> StoreSlice:
+        """Read stored rows for a time window.
+
+        Args:
+            timestep: "5m", "1h" or "latest".
+            start: Inclusive lower bound on snapshot timestamp.
+            end: Exclusive upper bound on snapshot timestamp.
+            item_id: Optional item ID to restrict the result to one item.
+
+        Returns:
+            The matching rows, ordered by timestamp and then item ID.
+        """
+        columns = self._schema(timestep)
+        result = StoreSlice(columns={name: array("q") for name in columns})
+
+        for chunk in self._chunks(timestep):
+            chunk_start = int(chunk.name)
+            if end is not None and chunk_start >= end:
+                break
+            if start is not None and chunk_start + self._chunk_span <= start:
+                continue
+            self._query_chunk(chunk, columns, start, end, item_id, result)
+
+        return result
+
+    def _schema(self, timestep: str) -> tuple[str, ...]:
+        columns = _SCHEMAS.get(timestep)
+        if columns is None:
+            raise ValidationError(
+                f"Unknown timestep {timestep!r}, expected one of {sorted(_SCHEMAS)}"
+            )
+        return columns
+
+    def _chunks(self, timestep: str) -> list[Path]:
+        directory = self._root / timestep
+        if not directory.is_dir():
+            return []
+        chunks = [path for path in directory.iterdir() if path.name.isdigit()]
+        return sorted(chunks, key=lambda path: int(path.name))
+
+    def _read_index(self, chunk: Path) -> array[int]:
+        index = array("q")
+        path = chunk / _INDEX_FILE
+        if path.exists():
+            raw = path.read_bytes()
+            # Ignore a trailing partial entry left behind by an interrupted write.
+            index.frombytes(raw[: len(raw) - len(raw) % (3 * _ITEMSIZE)])
+        return index
+
+    def _last(self, timestep: str) -> int | None:
+        if timestep not in self._last_timestamp:
+            chunks = self._chunks(timestep)
+            last = None
+            for chunk in reversed(chunks):
+                index = self._read_index(chunk)
+                if index:
+                    last = index[-3]
+                    break
+            self._last_timestamp[timestep] = last
+        return self._last_timestamp[timestep]
+
+    def _append(
+        self,
+        timestep: str,
+        timestamp: int,
+        data: dict[int, AveragePrice] | dict[int, LatestPrice],
+    ) -> None:
+        columns = self._schema(timestep)
+        last = self._last(timestep)
+        if last is not None and timestamp <= last:
+            raise ValidationError(
+                f"Snapshot timestamp {timestamp} is not newer than the last stored "
+                f"{timestep} snapshot ({last})"
+            )
+
+        chunk = self._root / timestep / str(timestamp - timestamp % self._chunk_span)
+        chunk.mkdir(parents=True, exist_ok=True)
+
+        item_ids = sorted(data)
+        values = {name: array("q") for name in columns}
+        for item_id in item_ids:
+            price = data[item_id]
+            for name in columns:
+                value = getattr(price, name)
+                values[name].append(NULL_INT64 if value is None else value)
+
+        # The row offset comes from the ID file rather than the index so that
+        # rows orphaned by an interrupted write are never referenced.
+        id_path = chunk / _ID_FILE
+        start_row = id_path.stat().st_size // _ITEMSIZE if id_path.exists() else 0
+        with open(id_path, "ab") as f:
+            f.truncate(start_row * _ITEMSIZE)
+            array("q", item_ids).tofile(f)
+        for name in columns:
+            with open(chunk / f"{name}.bin", "ab") as f:
+                f.truncate(start_row * _ITEMSIZE)
+                values[name].tofile(f)
+
+        # The index entry is written last and acts as the commit point.
+        with open(chunk / _INDEX_FILE, "ab") as f:
+            array("q", (timestamp, start_row, len(item_ids))).tofile(f)
+
+        self._last_timestamp[timestep] = timestamp
+
+    def _query_chunk(
+        self,
+        chunk: Path,
+        columns: tuple[str, ...],
+        start: int | None,
+        end: int | None,
+        item_id: int | None,
+        result: StoreSlice,
+    ) -> None:
+        index = self._read_index(chunk)
+        if not index:
+            return
+        snapshot_times = index[0::3]
+        lo = 0 if start is None else bisect_left(snapshot_times, start)
+        hi = len(snapshot_times) if end is None else bisect_left(snapshot_times, end)
+        if lo >= hi:
+            return
+
+        ids = _MappedColumn(chunk / _ID_FILE)
+        mapped = {name: _MappedColumn(chunk / f"{name}.bin") for name in columns}
+        try:
+            for i in range(lo, hi):
+                timestamp, row, count = index[3 * i : 3 * i + 3]
+                first, last = row, row + count
+                if item_id is not None:
+                    first, last = ids.bisect(item_id, first, last)
+                if first == last:
+                    continue
+                ids.read(first, last, result.item_ids)
+                result.timestamps.extend([timestamp] * (last - first))
+                for name in columns:
+                    mapped[name].read(first, last, result.columns[name])
+        finally:
+            ids.close()
+            for column in mapped.values():
+                column.close()
@@ -0,0 +1,199 @@
+"""Synthetic API payloads for tests and benchmarks at any scale.
+
+The generator produces raw JSON-compatible payloads shaped exactly like the
+real API: string item-id keys, nulls for missing prices, keys omitted from
+`/mapping` for untradeable values, and heavy-tailed price and volume
+distributions where cheap items trade far more often than expensive ones.
+
+    >>> from osrs_prices.models import LatestResponse, MappingResponse
+    >>> from osrs_prices.synthetic import PayloadGenerator
+    >>> gen = PayloadGenerator(items=40_000, seed=1)
+    >>> LatestResponse.from_api(gen.latest())
+    >>> MappingResponse.from_list(gen.mapping())
+
+All payloads from one generator describe the same catalog, so they can be
+enriched against each other. Output is deterministic for a given seed.
+"""
+
+import math
+import random
+from typing import Any
+
+from osrs_prices.constants import TIMESTEP_SECONDS
+from osrs_prices.models.timeseries import Timestep
+
+DEFAULT_TIMESTAMP = 1704067200  # 2024-01-01 00:00:00 UTC
+
+_ADJECTIVES = (
+    "Abyssal", "Adamant", "Ancient", "Blessed", "Bronze", "Crystal", "Dragon", "Enchanted",
+    "Golden", "Granite", "Iron", "Mithril", "Rune", "Steel", "Twisted", "Zamorak",
+)  # fmt: skip
+_NOUNS = (
+    "amulet", "arrow", "axe", "bones", "boots", "bow", "chainbody", "dagger", "gloves",
+    "helm", "hide", "logs", "ore", "potion", "ring", "scimitar", "seed", "shield", "staff",
+)  # fmt: skip
+
+
+class _Item:
+    __slots__ = ("id", "limit", "members", "name", "price", "volume")
+
+    def __init__(
+        self, id: int, name: str, price: int, volume: float, members: bool, limit: int | None
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.price = price
+        self.volume = volume
+        self.members = members
+        self.limit = limit
+
+
+class PayloadGenerator:
+    """Generates consistent synthetic payloads for one random item catalog."""
+
+    def __init__(self, items: int = 4000, seed: int = 0) -> None:
+        """Build the catalog.
+
+        Args:
+            items: Number of items in the catalog.
+            seed: Seed for the random number generator.
+        """
+        self.seed = seed
+        rng = random.Random(seed)
+        # Real item ids are sparse: roughly one in eight ids is tradeable.
+        ids = sorted(rng.sample(range(2, max(items * 8, 16)), items))
+        self._items: list[_Item] = []
+        for item_id in ids:
+            # Log-normal prices: median ~2k gp with a long tail into the billions.
+            price = max(1, min(int(rng.lognormvariate(7.5, 2.5)), 2_147_483_647))
+            # Daily volume falls with price, with Pareto noise on top.
+            volume = 2e4 / math.sqrt(price) * rng.paretovariate(1.5)
+            name = f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {item_id}"
+            limit = rng.choice((None, 8, 70, 125, 1000, 10_000, 25_000))
+            self._items.append(_Item(item_id, name, price, volume, rng.random() < 0.7, limit))
+        self._by_id = {item.id: item for item in self._items}
+
+    @property
+    def item_ids(self) -> list[int]:
+        """Return the catalog's item ids in ascending order."""
+        return [item.id for item in self._items]
+
+    def _rng(self, *salt: object) -> random.Random:
+        return random.Random(f"{self.seed}:{':'.join(map(str, salt))}")
+
+    def mapping(self) -> list[dict[str, Any]]:
+        """Return a `/mapping` payload."""
+        rng = self._rng("mapping")
+        payload = []
+        for item in self._items:
+            entry: dict[str, Any] = {
+                "examine": f"A synthetic {item.name.split()[1]}.",
+                "id": item.id,
+                "members": item.members,
+            }
+            # Untradeable-value items omit alch fields entirely, as the API does.
+            if rng.random() > 0.05:
+                value = max(1, int(item.price * rng.uniform(0.2, 1.2)))
+                entry["lowalch"] = value * 2 // 5
+                entry["highalch"] = value * 3 // 5
+                entry["value"] = value
+            else:
+                entry["value"] = 0
+            if item.limit is not None:
+                entry["limit"] = item.limit
+            entry["name"] = item.name
+            entry["icon"] = f"{item.name.replace(' ', '_')}.png"
+            payload.append(entry)
+        return payload
+
+    def latest(self, timestamp: int = DEFAULT_TIMESTAMP) -> dict[str, Any]:
+        """Return a `/latest` payload as of timestamp."""
+        rng = self._rng("latest", timestamp)
+        data: dict[str, Any] = {}
+        for item in self._items:
+            spread = max(1, int(item.price * rng.uniform(0.001, 0.03)))
+            # Illiquid items often have only one side traded recently, or neither.
+            recency = 86400 * 30 / (1 + item.volume)
+            high_age = int(rng.expovariate(1 / max(recency, 1)))
+            low_age = int(rng.expovariate(1 / max(recency, 1)))
+            traded_high = rng.random() > 0.02
+            traded_low = rng.random() > 0.02
+            data[str(item.id)] = {
+                "high": item.price + spread if traded_high else None,
+                "highTime": timestamp - high_age if traded_high else None,
+                "low": item.price if traded_low else None,
+                "lowTime": timestamp - low_age if traded_low else None,
+            }
+        return {"data": data}
+
+    def average(
+        self, timestep: Timestep = "5m", timestamp: int = DEFAULT_TIMESTAMP
+    ) -> dict[str, Any]:
+        """Return a `/5m` or `/1h` payload for the bucket starting at timestamp.
+
+        Like the API, items with no trades in the bucket are left out.
+        """
+        data = {}
+        for item in self._items:
+            bucket = self._bucket(item, timestep, timestamp)
+            if bucket["highPriceVolume"] or bucket["lowPriceVolume"]:
+                data[str(item.id)] = bucket
+        return {"data": data, "timestamp": timestamp}
+
+    def timeseries(
+        self,
+        item_id: int,
+        timestep: Timestep = "5m",
+        points: int = 365,
+        end: int = DEFAULT_TIMESTAMP,
+    ) -> dict[str, Any]:
+        """Return a `/timeseries` payload, oldest point first.
+
+        Args:
+            item_id: An id from `item_ids`.
+            timestep: The bucket size.
+            points: Number of data points (the API returns up to 365).
+            end: Timestamp of the newest point.
+
+        Raises:
+            KeyError: If item_id is not in the catalog.
+        """
+        item = self._by_id[item_id]
+        step = TIMESTEP_SECONDS[timestep]
+        start = end - (points - 1) * step
+        return {
+            "data": [
+                {"timestamp": start + i * step, **self._bucket(item, timestep, start + i * step)}
+                for i in range(points)
+            ],
+            "itemId": item_id,
+        }
+
+    def _bucket(self, item: _Item, timestep: Timestep, timestamp: int) -> dict[str, Any]:
+        rng = self._rng(item.id, timestep, timestamp)
+        expected = item.volume * TIMESTEP_SECONDS[timestep] / 86400
+        # Jitter the price around the item's base price, independently per bucket
+        # so that any bucket can be generated on its own. This is not a random
+        # walk: consecutive buckets are uncorrelated.
+        price = max(1, int(item.price * math.exp(rng.gauss(0, 0.02))))
+        high_volume = _poisson(rng, expected / 2)
+        low_volume = _poisson(rng, expected / 2)
+        return {
+            "avgHighPrice": price + max(1, price // 100) if high_volume else None,
+            "highPriceVolume": high_volume,
+            "avgLowPrice": price if low_volume else None,
+            "lowPriceVolume": low_volume,
+        }
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+    # Knuth's method is fine for small means.
+    limit, k, p = math.exp(-mean), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
@@ -0,0 +1,140 @@
+"""Optional OpenTelemetry tracing for Client calls.
+
+Requires `pip install osrs-prices[tracing]`. Without OpenTelemetry installed,
+`instrument` does nothing and returns False.
+
+    >>> from osrs_prices.tracing import instrument
+    >>> client = Client(user_agent="my-app/1.0")
+    >>> instrument(client)  # uses the global tracer provider
+    True
+
+Every public Client method then runs in its own span, e.g.
+`osrs_prices.get_latest_with_mapping`, with the item count and cache status
+as attributes. Network requests add child spans for the HTTP exchange
+(`GET /latest`), JSON decoding (`decode`) and model validation (`validate`),
+and enrichment adds an `enrich` span. Child spans are recorded from request
+hook timings, so they are exact but created once each stage has finished.
+"""
+
+import functools
+import time
+from collections.abc import Callable
+from typing import Any
+
+from osrs_prices.client import Client
+from osrs_prices.history import TimeseriesHistory
+from osrs_prices.hooks import RequestEvent
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+
+    _AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised when the extra is missing
+    _AVAILABLE = False
+
+TRACED_METHODS = (
+    "get_latest",
+    "get_mapping",
+    "get_5m_average",
+    "get_1h_average",
+    "get_timeseries",
+    "get_timeseries_history",
+    "get_item_by_name",
+    "get_latest_with_mapping",
+    "get_5m_average_with_mapping",
+    "get_1h_average_with_mapping",
+    "get_timeseries_with_mapping",
+    "enrich",
+)
+"""Client methods wrapped in a span by `instrument`."""
+
+
+def is_available() -> bool:
+    """Return True if OpenTelemetry is installed."""
+    return _AVAILABLE
+
+
+def _item_count(result: Any) -> int | None:
+    if isinstance(result, TimeseriesHistory):
+        return len(result)
+    for attr in ("items", "data"):
+        value = getattr(result, attr, None)
+        if isinstance(value, (list, dict)):
+            return len(value)
+    return None
+
+
+def instrument(client: Client, tracer_provider: Any = None) -> bool:
+    """Trace a client's public methods and requests.
+
+    Args:
+        client: The client to instrument.
+        tracer_provider: Optional OpenTelemetry TracerProvider. Uses the
+            global provider if None.
+
+    Returns:
+        True if tracing was enabled, False if OpenTelemetry is not installed.
+    """
+    if not _AVAILABLE:
+        return False
+
+    tracer = trace.get_tracer("osrs_prices", tracer_provider=tracer_provider)
+
+    def wrap(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with tracer.start_as_current_span(f"osrs_prices.{name}") as span:
+                result = method(*args, **kwargs)
+                count = _item_count(result)
+                if count is not None:
+                    span.set_attribute("osrs_prices.item_count", count)
+                return result
+
+        return traced
+
+    for name in TRACED_METHODS:
+        setattr(client, name, wrap(name, getattr(client, name)))
+
+    def child_span(
+        name: str, duration: float, attributes: dict[str, Any], error: str | None = None
+    ) -> None:
+        end = time.time_ns()
+        span = tracer.start_span(name, start_time=end - int(duration * 1e9), attributes=attributes)
+        if error is not None:
+            span.set_status(Status(StatusCode.ERROR, error))
+        span.end(end_time=end)
+
+    def on_event(event: RequestEvent) -> None:
+        kind = event.kind
+        if kind in ("cache_hit", "cache_miss"):
+            status = "hit" if kind == "cache_hit" else "miss"
+            current = trace.get_current_span()
+            current.set_attribute("osrs_prices.cache", status)
+            if event.cache is not None:
+                current.set_attribute("osrs_prices.cache_source", event.cache)
+        elif kind == "body_received":
+            attributes: dict[str, Any] = {
+                "http.request.method": "GET",
+                "url.path": event.path,
+                "http.response.status_code": event.status,
+                "http.response.body.size": event.size,
+            }
+            for key, value in event.params.items():
+                attributes[f"osrs_prices.param.{key}"] = str(value)
+            duration = event.durations["headers"] + event.durations["body"]
+            error = None if event.status == 200 else f"HTTP {event.status}"
+            child_span(f"GET {event.path}", duration, attributes, error)
+        elif kind == "json_decoded":
+            child_span("decode", event.durations["decode"], {"url.path": event.path})
+        elif kind == "model_parsed":
+            child_span("validate", event.durations["parse"], {"url.path": event.path})
+        elif kind == "enriched":
+            child_span(
+                "enrich",
+                event.durations["enrich"],
+                {"osrs_prices.kind": event.path, "osrs_prices.item_count": event.size},
+            )
+
+    client.hooks.register(on_event)
+    return True
@@ -0,0 +1,109 @@
+"""Unit tests for Arrow conversion utilities."""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from osrs_prices.arrow import from_api, metadata, to_arrow
+from osrs_prices.models import (
+    AverageResponse,
+    EnrichedLatestPrice,
+    EnrichedLatestResponse,
+    EnrichedTimeseriesResponse,
+    LatestResponse,
+    MappingResponse,
+    TimeseriesResponse,
+)
+
+
+class TestToArrow:
+    """Tests for to_arrow and from_api."""
+
+    def test_mapping(self, sample_mapping_response: list[dict]) -> None:
+        """Test that the mapping has typed, nullable columns."""
+        table = to_arrow(MappingResponse.from_list(sample_mapping_response))
+
+        assert table.column_names[:3] == ["id", "name", "examine"]
+        assert table.schema.field("id").type == pa.int64()
+        assert table.schema.field("name").type == pa.string()
+        assert table.schema.field("members").type == pa.bool_()
+        assert table.column("lowalch").to_pylist() == [28800, 2, None]
+        assert table.column("lowalch").type == pa.int64()
+
+    def test_matches_json(
+        self,
+        sample_mapping_response: list[dict],
+        sample_latest_response: dict,
+        sample_5m_response: dict,
+        sample_timeseries_response: dict,
+    ) -> None:
+        """Test that JSON gives the same tables as the parsed responses."""
+        cases = [
+            (
+                MappingResponse.from_list(sample_mapping_response),
+                sample_mapping_response,
+                "mapping",
+            ),
+            (LatestResponse.from_api(sample_latest_response), sample_latest_response, "latest"),
+            (AverageResponse.from_api(sample_5m_response), sample_5m_response, "5m"),
+            (
+                TimeseriesResponse.from_api(sample_timeseries_response),
+                sample_timeseries_response,
+                "timeseries",
+            ),
+        ]
+        for response, data, kind in cases:
+            assert from_api(data, kind).equals(to_arrow(response), check_metadata=True)
+
+    def test_average_metadata(self, sample_5m_response: dict) -> None:
+        """Test that the snapshot timestamp is kept in the schema metadata."""
+        table = to_arrow(AverageResponse.from_api(sample_5m_response))
+
+        assert metadata(table) == {"timestamp": sample_5m_response["timestamp"]}
+        assert table.column_names[0] == "item_id"
+
+    def test_timestamps(self, sample_latest_response: dict) -> None:
+        """Test timeseries and trade time columns as UTC timestamps."""
+        timeseries = from_api({"data": [{"timestamp": 1704067200}]}, "timeseries")
+        latest = from_api(sample_latest_response, "latest", datetimes=True)
+
+        assert timeseries.schema.field("timestamp").type == pa.timestamp("s", tz="UTC")
+        assert latest.schema.field("high_time").type == pa.timestamp("s", tz="UTC")
+        assert latest.schema.field("high").type == pa.int64()
+
+    def test_enriched(
+        self, sample_mapping_response: list[dict], sample_latest_response: dict
+    ) -> None:
+        """Test that enriched responses have metadata and price columns."""
+        latest = LatestResponse.from_api(sample_latest_response).data[4151].model_dump()
+        response = EnrichedLatestResponse(
+            items=[EnrichedLatestPrice.model_validate({**sample_mapping_response[0], **latest})]
+        )
+
+        table = to_arrow(response)
+
+        assert table.column_names[:2] == ["item_id", "name"]
+        assert table.column_names[-4:] == ["high", "high_time", "low", "low_time"]
+        row = {**sample_mapping_response[0], **latest}
+        assert table.to_pylist()[0] == {"item_id": row.pop("id"), **row}
+
+    def test_enriched_timeseries(
+        self, sample_mapping_response: list[dict], sample_timeseries_response: dict
+    ) -> None:
+        """Test that the item's metadata is kept in the schema metadata."""
+        response = EnrichedTimeseriesResponse(
+            item=MappingResponse.from_list(sample_mapping_response).items[0],
+            data=TimeseriesResponse.from_api(sample_timeseries_response).data,
+        )
+
+        info = metadata(to_arrow(response))
+
+        assert info["item_id"] == 4151
+        assert info["item"]["name"] == "Abyssal whip"
+
+    def test_unsupported(self) -> None:
+        """Test that unsupported types and kinds raise."""
+        with pytest.raises(TypeError, match="Unsupported response type"):
+            to_arrow("not a response")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Unsupported response kind"):
+            from_api({}, "prices")  # type: ignore[arg-type]
@@ -0,0 +1,305 @@
+"""Unit tests for cache backends."""
+
+import json
+import os
+import socket
+import stat
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osrs_prices import Client
+from osrs_prices.backends import CacheBackend, DaemonBackend, MemoryBackend, SQLiteBackend
+from osrs_prices.backends.daemon import CacheDaemon, _default_socket_path
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path) -> Iterator[str]:
+    """Run a cache daemon on a temporary Unix socket."""
+    path = str(tmp_path / "cache.sock")
+    server = CacheDaemon(path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "daemon"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[CacheBackend]:
+    """Each backend implementation."""
+    if request.param == "memory":
+        yield MemoryBackend()
+    elif request.param == "sqlite":
+        sqlite_backend = SQLiteBackend(tmp_path / "cache.db")
+        yield sqlite_backend
+        sqlite_backend.close()
+    else:
+        if not hasattr(socket, "AF_UNIX"):
+            pytest.skip("Unix sockets are not available")
+        daemon_backend = DaemonBackend(request.getfixturevalue("daemon_socket"))
+        yield daemon_backend
+        daemon_backend.close()
+
+
+class TestCacheBackends:
+    """Behaviour shared by all backends."""
+
+    def test_protocol(self, backend: CacheBackend) -> None:
+        """Test that each backend satisfies the protocol."""
+        assert isinstance(backend, CacheBackend)
+
+    def test_set_get_delete(self, backend: CacheBackend) -> None:
+        """Test basic operations."""
+        assert backend.get("key") is None
+        backend.set("key", b"value")
+        assert backend.get("key") == b"value"
+        assert backend.delete("key") is True
+        assert backend.delete("key") is False
+        assert backend.get("key") is None
+
+    def test_ttl(self, backend: CacheBackend) -> None:
+        """Test that entries expire after their TTL."""
+        backend.set("short", b"value", ttl=0.05)
+        backend.set("forever", b"value")
+        time.sleep(0.06)
+        assert backend.get("short") is None
+        assert backend.get("forever") == b"value"
+
+    def test_compare_and_set(self, backend: CacheBackend) -> None:
+        """Test compare-and-set against missing and present values."""
+        assert backend.compare_and_set("key", None, b"one") is True
+        assert backend.compare_and_set("key", None, b"two") is False
+        assert backend.compare_and_set("key", b"wrong", b"two") is False
+        assert backend.compare_and_set("key", b"one", b"two") is True
+        assert backend.get("key") == b"two"
+
+    def test_compare_and_set_expired(self, backend: CacheBackend) -> None:
+        """Test that an expired entry counts as missing."""
+        backend.set("key", b"old", ttl=0.01)
+        time.sleep(0.02)
+        assert backend.compare_and_set("key", None, b"new") is True
+
+    def test_empty_value(self, backend: CacheBackend) -> None:
+        """Test that an empty value is distinct from a missing one."""
+        backend.set("key", b"")
+        assert backend.get("key") == b""
+
+
+class TestSQLiteBackend:
+    """Tests specific to SQLiteBackend."""
+
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test that separate connections see each other's writes."""
+        SQLiteBackend(tmp_path / "cache.db").set("key", b"value")
+        assert SQLiteBackend(tmp_path / "cache.db").get("key") == b"value"
+
+    def test_purge_expired(self, tmp_path: Path) -> None:
+        """Test removing expired rows."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+        backend.set("old", b"value", ttl=-1)
+        backend.set("new", b"value")
+        assert backend.purge_expired() == 1
+
+    def test_purges_on_write(self, tmp_path: Path) -> None:
+        """Test that writes purge expired rows once the interval has passed."""
+        backend = SQLiteBackend(tmp_path / "cache.db", purge_interval=0)
+        backend.set("old", b"value", ttl=-1)
+        backend.set("new", b"value")
+        assert backend.purge_expired() == 0
+
+
+class TestMemoryBackend:
+    """Tests specific to MemoryBackend."""
+
+    def test_purge_expired(self) -> None:
+        """Test removing expired entries that are never read again."""
+        backend = MemoryBackend(purge_interval=None)
+        backend.set("old", b"value", ttl=-1)
+        backend.set("new", b"value")
+        assert len(backend) == 2
+        assert backend.purge_expired() == 1
+        assert len(backend) == 1
+
+    def test_purges_on_write(self) -> None:
+        """Test that writes purge expired entries once the interval has passed."""
+        backend = MemoryBackend(purge_interval=0)
+        backend.set("old", b"value", ttl=-1)
+        backend.set("new", b"value")
+        assert len(backend) == 1
+
+
+class TestDaemonBackend:
+    """Tests specific to DaemonBackend."""
+
+    def test_reconnects(self, daemon_socket: str) -> None:
+        """Test that a dropped connection is re-established."""
+        backend = DaemonBackend(daemon_socket)
+        backend.set("key", b"value")
+        backend._local.sock.close()
+        assert backend.get("key") == b"value"
+
+    def test_does_not_resend_after_send(self, tmp_path: Path) -> None:
+        """Test that a request the daemon may have applied is not sent twice."""
+        path = str(tmp_path / "fake.sock")
+        received: list[bytes] = []
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(path)
+            server.listen()
+            server.settimeout(1.0)
+
+            def accept() -> None:
+                for _ in range(2):
+                    try:
+                        conn, _ = server.accept()
+                    except OSError:
+                        return
+                    with conn:
+                        received.append(conn.recv(1024))
+
+            thread = threading.Thread(target=accept, daemon=True)
+            thread.start()
+            backend = DaemonBackend(path)
+            with pytest.raises(ConnectionError):
+                backend.compare_and_set("key", None, b"value")
+            backend._local.sock = None
+            thread.join(2.0)
+
+        assert len(received) == 1
+
+    def test_survives_partial_message(self, daemon_socket: str) -> None:
+        """Test that a client disconnecting mid-message does not affect others."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon_socket)
+            sock.sendall(b"\x02\x00")
+        backend = DaemonBackend(daemon_socket)
+        backend.set("key", b"value")
+        assert backend.get("key") == b"value"
+        backend.close()
+
+
+class TestCacheDaemon:
+    """Tests for CacheDaemon."""
+
+    def test_default_socket_path(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that the default socket lives in a per-user directory."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert _default_socket_path() == str(tmp_path / "osrs-prices.sock")
+
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert os.path.basename(os.path.dirname(_default_socket_path())).startswith("osrs-prices-")
+
+    def test_socket_is_private(self, daemon_socket: str) -> None:
+        """Test that only the owner can use the socket."""
+        assert stat.S_IMODE(os.stat(daemon_socket).st_mode) == 0o600
+
+    def test_replaces_stale_socket(self, tmp_path: Path) -> None:
+        """Test that a socket nobody listens on is replaced."""
+        path = str(tmp_path / "cache.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(path)
+        server = CacheDaemon(path)
+        server.server_close()
+
+    def test_keeps_live_socket(self, daemon_socket: str) -> None:
+        """Test that a running daemon's socket is not taken over."""
+        with pytest.raises(OSError, match="already listening"):
+            CacheDaemon(daemon_socket)
+
+    def test_keeps_other_files(self, tmp_path: Path) -> None:
+        """Test that a path which is not a socket is never removed."""
+        path = tmp_path / "cache.sock"
+        path.write_text("data")
+        with pytest.raises(FileExistsError):
+            CacheDaemon(path)
+        assert path.read_text() == "data"
+
+    def test_purges_while_serving(self, tmp_path: Path) -> None:
+        """Test that expired entries are purged between requests."""
+        backend = MemoryBackend(purge_interval=None)
+        backend.set("old", b"value", ttl=-1)
+        server = CacheDaemon(tmp_path / "cache.sock", backend, purge_interval=0)
+        server.service_actions()
+        server.server_close()
+        assert len(backend) == 0
+
+
+class TestClientCacheBackend:
+    """Tests for sharing responses through a backend."""
+
+    def test_mapping_shared_between_clients(self, sample_mapping_response: list[dict]) -> None:
+        """Test that a second client reads the mapping from the backend."""
+        backend = MemoryBackend()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = sample_mapping_response
+        mock_response.content = json.dumps(sample_mapping_response).encode()
+
+        with (
+            Client(user_agent="test/1.0", cache_backend=backend) as first,
+            patch.object(first._http_client, "get", return_value=mock_response),
+        ):
+            first.get_mapping()
+
+        with (
+            Client(user_agent="test/1.0", cache_backend=backend) as second,
+            patch.object(second._http_client, "get") as mock_get,
+        ):
+            mapping = second.get_mapping()
+            mock_get.assert_not_called()
+
+        assert len(mapping.items) == 3
+
+    def test_policy_endpoints_use_backend(self, sample_latest_response: dict) -> None:
+        """Test that endpoints with a cache policy store bodies in the backend."""
+        backend = MemoryBackend()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = sample_latest_response
+        mock_response.content = json.dumps(sample_latest_response).encode()
+
+        with (
+            Client(user_agent="test/1.0", cache_backend=backend) as client,
+            patch.object(client._http_client, "get", return_value=mock_response) as mock_get,
+        ):
+            client.get_latest(item_id=4151)
+            result = client.get_latest(item_id=4151)
+            assert mock_get.call_count == 1
+
+        assert backend.get("osrs_prices:/latest?id=4151") is not None
+        assert 4151 in result.data
+
+    def test_unreachable_backend_fails_open(
+        self,
+        sample_latest_response: dict,
+        sample_mapping_response: list[dict],
+        tmp_path: Path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a backend nobody listens on is logged and bypassed."""
+        backend = DaemonBackend(str(tmp_path / "nobody.sock"))
+
+        def get(url: str, params: dict | None = None) -> MagicMock:
+            body = sample_mapping_response if url.endswith("/mapping") else sample_latest_response
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = body
+            response.content = json.dumps(body).encode()
+            return response
+
+        with (
+            Client(user_agent="test/1.0", cache_backend=backend) as client,
+            patch.object(client._http_client, "get", side_effect=get) as mock_get,
+        ):
+            latest = client.get_latest(item_id=4151)
+            mapping = client.get_mapping()
+            assert mock_get.call_count == 2
+
+        assert 4151 in latest.data
+        assert len(mapping.items) == 3
+        assert "Cache backend lookup for /latest failed" in caplog.text
+        assert "Cache backend store for /mapping failed" in caplog.text
@@ -1,8 +1,14 @@
 """Unit tests for the TTL cache."""
 
+import threading
 import time
+from unittest.mock import patch
 
-from osrs_prices.cache import TTLCache
+import pytest
+
+from osrs_prices.cache import LRUCache, TimeseriesCache, TTLCache
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models import TimeseriesDataPoint, TimeseriesResponse
 
 
 class TestTTLCache:
@@ -53,3 +59,247 @@ class TestTTLCache:
         value = {"key": "value", "nested": {"a": 1}}
         cache.set(value)
         assert cache.get() == value
+
+    def test_concurrent_reads_during_writes(self) -> None:
+        """Test that readers always see a complete value while writers swap it."""
+        cache: TTLCache[tuple[int, int]] = TTLCache(ttl=60.0)
+        cache.set((0, 0))
+        stop = threading.Event()
+        torn: list[tuple[int, int]] = []
+
+        def reader() -> None:
+            while not stop.is_set():
+                value = cache.get()
+                if value is None or value[0] != value[1]:
+                    torn.append(value or (-1, -1))
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for i in range(2000):
+            cache.set((i, i))
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert torn == []
+
+
+class TestTimeseriesCache:
+    """Tests for TimeseriesCache class."""
+
+    @staticmethod
+    def _response(*timestamps: int) -> TimeseriesResponse:
+        return TimeseriesResponse(
+            item_id=4151,
+            data=[TimeseriesDataPoint(timestamp=ts, avg_high_price=ts) for ts in timestamps],
+        )
+
+    def test_get_empty_cache(self) -> None:
+        """Test get on empty cache returns None."""
+        assert TimeseriesCache().get(4151, "5m") is None
+
+    def test_expires_at_next_bucket_boundary(self) -> None:
+        """Test that entries expire when the next bucket starts."""
+        cache = TimeseriesCache()
+        with patch("osrs_prices.cache.time.time", return_value=1704067250.0):
+            cache.merge(self._response(1704066900), "5m")
+        with patch("osrs_prices.cache.time.time", return_value=1704067499.0):
+            assert cache.get(4151, "5m") is not None
+        with patch("osrs_prices.cache.time.time", return_value=1704067500.0):
+            assert cache.get(4151, "5m") is None
+
+    def test_expires_sooner_without_newest_bucket(self) -> None:
+        """Test that a fetch before the newest bucket is published retries soon."""
+        cache = TimeseriesCache(retry_interval=30.0)
+        with patch("osrs_prices.cache.time.time", return_value=1704067210.0):
+            cache.merge(self._response(1704066600), "5m")
+        with patch("osrs_prices.cache.time.time", return_value=1704067239.0):
+            assert cache.get(4151, "5m") is not None
+        with patch("osrs_prices.cache.time.time", return_value=1704067240.0):
+            assert cache.get(4151, "5m") is None
+
+    def test_keyed_by_requested_item(self) -> None:
+        """Test that the requested item wins over the response's item_id."""
+        cache = TimeseriesCache()
+        cache.merge(TimeseriesResponse(data=self._response(1704067200).data), "1h", item_id=2)
+        cache.merge(self._response(1704067200), "1h", item_id=3)
+
+        assert cache.get(2, "1h") is not None
+        assert cache.get(3, "1h") is not None
+        assert cache.get(4151, "1h") is None
+
+    def test_returns_copies(self) -> None:
+        """Test that later merges do not change a history already returned."""
+        cache = TimeseriesCache()
+        merged = cache.merge(self._response(1704066600), "5m")
+        cached = cache.get(4151, "5m")
+        cache.merge(self._response(1704066900), "5m")
+
+        assert cached is not None
+        assert list(merged.timestamps) == [1704066600]
+        assert list(cached.timestamps) == [1704066600]
+
+    def test_keyed_by_item_and_timestep(self) -> None:
+        """Test that different timesteps are cached separately."""
+        cache = TimeseriesCache()
+        cache.merge(self._response(1704067200), "1h")
+        assert cache.get(4151, "1h") is not None
+        assert cache.get(4151, "5m") is None
+        assert cache.get(2, "1h") is None
+
+    def test_merge_keeps_history_after_expiry(self) -> None:
+        """Test that a refresh after expiry extends the existing history."""
+        cache = TimeseriesCache()
+        with patch("osrs_prices.cache.time.time", return_value=1704067250.0):
+            cache.merge(self._response(1704066600, 1704066900), "5m")
+        with patch("osrs_prices.cache.time.time", return_value=1704067550.0):
+            history = cache.merge(self._response(1704066900, 1704067200), "5m")
+
+        assert list(history.timestamps) == [1704066600, 1704066900, 1704067200]
+
+    def test_merge_requires_item_id(self) -> None:
+        """Test that responses without an item_id are rejected."""
+        with pytest.raises(ValidationError):
+            TimeseriesCache().merge(TimeseriesResponse(), "5m")
+
+    def test_invalidate(self) -> None:
+        """Test manual cache invalidation."""
+        cache = TimeseriesCache()
+        cache.merge(self._response(1704067200), "24h")
+        cache.invalidate()
+        assert cache.get(4151, "24h") is None
+
+
+class TestLRUCache:
+    """Tests for LRUCache class."""
+
+    def test_set_and_get(self) -> None:
+        """Test basic keyed set and get operations."""
+        cache: LRUCache[str, int] = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        assert cache.get("b") == 2
+        assert cache.get("c") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache: LRUCache[str, int] = LRUCache(max_entries=2, shards=1)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget(self) -> None:
+        """Test that entries are evicted to stay within the byte budget."""
+        cache: LRUCache[str, str] = LRUCache(max_bytes=100, shards=1)
+        cache.set("a", "x", size=60)
+        cache.set("b", "y", size=30)
+        cache.set("c", "z", size=30)
+
+        assert cache.get("a") is None
+        assert cache.stats().bytes == 60
+
+    def test_oversized_value_not_admitted(self) -> None:
+        """Test that a value larger than the budget is not cached."""
+        cache: LRUCache[str, str] = LRUCache(max_bytes=100, shards=1)
+        cache.set("a", "x", size=10)
+        cache.set("big", "y", size=500)
+        assert cache.get("big") is None
+        assert cache.get("a") == "x"
+
+    def test_entry_limit_is_global(self) -> None:
+        """Test that a sharded cache holds no more than max_entries."""
+        cache: LRUCache[int, int] = LRUCache(max_entries=10)
+        for key in range(100):
+            cache.set(key, key)
+
+        assert len(cache) == 10
+        assert cache.stats().entries == 10
+        assert all(cache.get(key) == key for key in range(90, 100))
+
+    def test_colliding_keys_use_free_capacity(self) -> None:
+        """Test that keys hashing to one shard are kept while the cache has room."""
+        cache: LRUCache[int, int] = LRUCache(max_entries=16, shards=8)
+        keys = [i * 8 for i in range(16)]
+        for key in keys:
+            cache.set(key, key)
+
+        assert all(cache.get(key) == key for key in keys)
+        assert cache.stats().evictions == 0
+
+    def test_evicts_least_recently_used_across_shards(self) -> None:
+        """Test that eviction picks the oldest entry of the whole cache."""
+        cache: LRUCache[int, int] = LRUCache(max_entries=3, shards=3)
+        cache.set(0, 0)
+        cache.set(1, 1)
+        cache.set(2, 2)
+        cache.get(0)
+        cache.set(3, 3)
+
+        assert cache.get(1) is None
+        assert [cache.get(key) for key in (0, 2, 3)] == [0, 2, 3]
+
+    def test_value_up_to_byte_budget_admitted(self) -> None:
+        """Test that a sharded cache admits any value within max_bytes."""
+        cache: LRUCache[str, str] = LRUCache(max_bytes=100)
+        cache.set("a", "x", size=10)
+        cache.set("big", "y", size=95)
+
+        assert cache.get("big") == "y"
+        assert cache.get("a") is None
+        assert cache.stats().bytes == 95
+
+    def test_per_entry_ttl(self) -> None:
+        """Test that each entry expires after its own TTL."""
+        cache: LRUCache[str, str] = LRUCache(ttl=60.0)
+        cache.set("short", "value", ttl=0.05)
+        cache.set("long", "value")
+        time.sleep(0.06)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == "value"
+        assert cache.stats().expirations == 1
+
+    def test_none_ttl_never_expires(self) -> None:
+        """Test that an explicit ttl of None overrides the cache default."""
+        cache: LRUCache[str, str] = LRUCache(ttl=0.01)
+        cache.set("forever", "value", ttl=None)
+        cache.set("default", "value")
+        time.sleep(0.02)
+
+        assert cache.get("forever") == "value"
+        assert cache.get("default") is None
+
+    def test_delete_and_clear(self) -> None:
+        """Test removing entries."""
+        cache: LRUCache[str, int] = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_stats(self) -> None:
+        """Test hit and miss accounting."""
+        cache: LRUCache[str, int] = LRUCache()
+        cache.set("a", 1, size=10)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (2, 1, 1, 10)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_invalid_max_entries(self) -> None:
+        """Test that a non-positive entry limit is rejected."""
+        with pytest.raises(ValidationError):
+            LRUCache(max_entries=0)
@@ -0,0 +1,121 @@
+"""Unit tests for the shared-memory item catalog."""
+
+import subprocess
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from osrs_prices import ValidationError
+from osrs_prices.catalog import CatalogItem, SharedCatalog
+from osrs_prices.models import MappingResponse
+
+
+@pytest.fixture
+def catalog(sample_mapping_response: list[dict]) -> Iterator[SharedCatalog]:
+    with SharedCatalog.publish(MappingResponse.from_list(sample_mapping_response)) as catalog:
+        yield catalog
+
+
+class TestSharedCatalog:
+    """Tests for publishing and reading a catalog."""
+
+    def test_lookup(self, catalog: SharedCatalog) -> None:
+        """Test that items are read back with every field."""
+        assert catalog[4151] == CatalogItem(
+            id=4151,
+            name="Abyssal whip",
+            members=True,
+            lowalch=28800,
+            highalch=43200,
+            limit=70,
+            value=72000,
+        )
+        assert catalog.get_name(2) == "Cannonball"
+
+    def test_missing_values(self, catalog: SharedCatalog) -> None:
+        """Test that None fields survive the round trip."""
+        godsword = catalog[11802]
+        assert godsword.lowalch is None
+        assert godsword.highalch is None
+
+    def test_unknown_ids(self, catalog: SharedCatalog) -> None:
+        """Test lookups of IDs that are not in the catalog."""
+        assert catalog.get(3) is None
+        assert catalog.get(-1) is None
+        assert catalog.get(10**6) is None
+        assert 3 not in catalog
+        assert 4151 in catalog
+        with pytest.raises(KeyError):
+            catalog[3]
+
+    def test_iteration(self, catalog: SharedCatalog, sample_mapping_response: list[dict]) -> None:
+        """Test that items iterate in ascending ID order."""
+        ids = sorted(item["id"] for item in sample_mapping_response)
+        assert len(catalog) == len(ids)
+        assert catalog.ids() == ids
+        assert [item.id for item in catalog] == ids
+
+    def test_unicode_names(self) -> None:
+        """Test that non-ASCII names are stored as UTF-8."""
+        mapping = MappingResponse.from_list(
+            [{"id": 1, "name": "Ðragon scimitar ✓", "members": False, "icon": "x.png"}]
+        )
+        with SharedCatalog.publish(mapping) as catalog:
+            assert catalog.get_name(1) == "Ðragon scimitar ✓"
+
+    def test_empty_mapping(self) -> None:
+        """Test that an empty mapping publishes an empty catalog."""
+        with SharedCatalog.publish(MappingResponse()) as catalog:
+            assert len(catalog) == 0
+            assert catalog.get(0) is None
+
+    def test_value_out_of_range_raises(self) -> None:
+        """Test that values beyond 32 bits are rejected."""
+        mapping = MappingResponse.from_list(
+            [{"id": 1, "name": "Coins", "members": False, "value": 2**40, "icon": "x.png"}]
+        )
+        with pytest.raises(ValidationError, match="does not fit"):
+            SharedCatalog.publish(mapping)
+
+
+class TestAttach:
+    """Tests for attaching to a published catalog."""
+
+    def test_attach_is_read_only(self, catalog: SharedCatalog) -> None:
+        """Test that an attached catalog reads the same block without copying it."""
+        with SharedCatalog.attach(catalog.name) as attached:
+            assert attached[4151] == catalog[4151]
+            assert attached._buf.readonly
+            with pytest.raises(ValidationError, match="publishing process"):
+                attached.unlink()
+
+        # Detaching leaves the block for the publisher.
+        assert catalog[2].name == "Cannonball"
+
+    def test_attach_from_another_process(self, catalog: SharedCatalog) -> None:
+        """Test that a separate interpreter reads the catalog by name."""
+        code = (
+            "from osrs_prices.catalog import SharedCatalog\n"
+            f"with SharedCatalog.attach({catalog.name!r}) as catalog:\n"
+            "    print(catalog[4151].name)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "Abyssal whip"
+        assert catalog.get_name(4151) == "Abyssal whip"
+
+    def test_attach_to_other_block_raises(self, catalog: SharedCatalog) -> None:
+        """Test that attaching to a block that is not a catalog raises."""
+        buf = catalog._shm.buf
+        assert buf is not None
+        buf[:8] = b"NOTACATL"
+        with pytest.raises(ValidationError, match="not an item catalog"):
+            SharedCatalog.attach(catalog.name)
+
+    def test_attach_missing_block_raises(self) -> None:
+        """Test that attaching to an unknown name raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            SharedCatalog.attach("osrs_prices_missing_catalog")
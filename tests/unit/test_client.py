@@ -6,6 +6,7 @@ import httpx
 import pytest
 
 from osrs_prices import Client, ValidationError
+from osrs_prices.cache import CachePolicy, LRUCache
 from osrs_prices.models import LatestResponse, MappingResponse
 
 
@@ -276,3 +277,185 @@ class TestClientMethods:
             assert mock_get.call_count == 2
 
         mock_client.close()
+
+
+class TestClientTimeseriesCache:
+    """Tests for the opt-in timeseries cache."""
+
+    @staticmethod
+    def _mock_response(*timestamps: int) -> MagicMock:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "data": [{"timestamp": ts, "avgHighPrice": 100} for ts in timestamps]
+        }
+        return mock_response
+
+    def test_cache_reused_until_bucket_boundary(self) -> None:
+        """Test that repeated calls within a bucket hit the cache."""
+        client = Client(user_agent="test/1.0", timeseries_cache=True)
+
+        with patch.object(
+            client._http_client, "get", return_value=self._mock_response(300, 600)
+        ) as mock_get:
+            first = client.get_timeseries(4151, "5m")
+            second = client.get_timeseries(4151, "5m")
+
+            assert mock_get.call_count == 1
+            assert first == second
+
+        client.close()
+
+    def test_full_history_merges_refreshes(self) -> None:
+        """Test that full_history returns more than the API window."""
+        client = Client(user_agent="test/1.0", timeseries_cache=True)
+
+        with patch.object(
+            client._http_client,
+            "get",
+            side_effect=[self._mock_response(300, 600), self._mock_response(600, 900)],
+        ):
+            client.get_timeseries(4151, "5m")
+            window = client.get_timeseries(4151, "5m", force_refresh=True)
+            full = client.get_timeseries(4151, "5m", full_history=True)
+
+        assert [p.timestamp for p in window.data] == [600, 900]
+        assert [p.timestamp for p in full.data] == [300, 600, 900]
+        history = client.get_timeseries_history(4151, "5m")
+        assert list(history.timestamps) == [300, 600, 900]
+
+        client.close()
+
+    def test_refresh_bypasses_response_cache(self) -> None:
+        """Test that refreshing held history does not reuse a cached response."""
+        client = Client(user_agent="test/1.0", timeseries_cache=True, response_cache=LRUCache())
+
+        with patch.object(
+            client._http_client,
+            "get",
+            side_effect=[self._mock_response(300, 600), self._mock_response(600, 900)],
+        ) as mock_get:
+            client.get_timeseries(4151, "5m")
+            refreshed = client.get_timeseries(4151, "5m", force_refresh=True)
+
+            assert mock_get.call_count == 2
+            assert [p.timestamp for p in refreshed.data] == [600, 900]
+
+        client.close()
+
+    def test_force_refresh_without_timeseries_cache(self) -> None:
+        """Test that force_refresh bypasses the response cache."""
+        client = Client(user_agent="test/1.0", response_cache=LRUCache())
+
+        with patch.object(
+            client._http_client, "get", return_value=self._mock_response(300)
+        ) as mock_get:
+            client.get_timeseries(4151, "5m")
+            client.get_timeseries(4151, "5m")
+            client.get_timeseries(4151, "5m", force_refresh=True)
+
+            assert mock_get.call_count == 2
+
+        client.close()
+
+    def test_full_history_requires_cache(self) -> None:
+        """Test that full_history without the cache raises ValidationError."""
+        with (
+            Client(user_agent="test/1.0") as client,
+            pytest.raises(ValidationError, match="timeseries_cache"),
+        ):
+            client.get_timeseries(4151, "5m", full_history=True)
+
+
+class TestClientResponseCache:
+    """Tests for the shared response cache."""
+
+    def test_response_cache_shared_by_endpoints(
+        self, sample_latest_response: dict
+    ) -> None:
+        """Test that endpoints with a cache policy use the shared cache."""
+        cache: LRUCache = LRUCache()
+        client = Client(user_agent="test/1.0", response_cache=cache)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = sample_latest_response
+
+        with patch.object(
+            client._http_client, "get", return_value=mock_response
+        ) as mock_get:
+            client.get_latest()
+            client.get_latest()
+            client.get_latest(item_id=4151)
+
+            assert mock_get.call_count == 2
+            assert cache.stats().hits == 1
+
+        client.close()
+
+    def test_cache_policy_override(self, sample_latest_response: dict) -> None:
+        """Test that cache_policies can opt an endpoint out or change its TTL."""
+        client = Client(
+            user_agent="test/1.0",
+            response_cache=LRUCache(),
+            cache_policies={"/latest": None, "/5m": CachePolicy(ttl=1.0)},
+        )
+
+        assert client._latest.cache_policy is None
+        assert client._five_minute.cache_policy == CachePolicy(ttl=1.0)
+        assert client._one_hour.cache_policy is not None
+
+        client.close()
+
+
+class TestClientHTTPOptions:
+    """Tests for base URL and HTTP client configuration."""
+
+    def test_transport_and_base_url(self, sample_latest_response: dict) -> None:
+        """Test that requests go through an injected transport to the base URL."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=sample_latest_response)
+
+        with Client(
+            user_agent="test/1.0",
+            base_url="http://mirror.local/api/",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            result = client.get_latest()
+
+        assert 4151 in result.data
+        assert str(requests[0].url) == "http://mirror.local/api/latest"
+        assert requests[0].headers["User-Agent"] == "test/1.0"
+
+    def test_injected_http_client_not_closed(self, sample_latest_response: dict) -> None:
+        """Test that an injected http_client is used and left open."""
+        http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=sample_latest_response)
+            )
+        )
+
+        with Client(user_agent="test/1.0", http_client=http_client) as client:
+            client.get_latest()
+
+        assert http_client.headers["User-Agent"] == "test/1.0"
+        assert not http_client.is_closed
+        http_client.close()
+
+    def test_limits(self) -> None:
+        """Test that connection pool limits are accepted."""
+        limits = httpx.Limits(
+            max_connections=50, max_keepalive_connections=10, keepalive_expiry=30
+        )
+        with Client(user_agent="test/1.0", limits=limits) as client:
+            assert not client._http_client.is_closed
+
+    def test_conflicting_options(self) -> None:
+        """Test that http_client cannot be combined with other HTTP options."""
+        with pytest.raises(ValidationError, match="http_client"):
+            Client(user_agent="test/1.0", http_client=httpx.Client(), limits=httpx.Limits())
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        with pytest.raises(ValidationError, match="transport"):
+            Client(user_agent="test/1.0", transport=transport, http2=True)
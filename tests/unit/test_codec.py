@@ -0,0 +1,91 @@
+"""Unit tests for the binary price history codec."""
+
+import io
+
+import pytest
+
+from osrs_prices.codec import (
+    KIND_AVERAGE,
+    Decoder,
+    Encoder,
+    decode_averages,
+    decode_timeseries,
+    encode_averages,
+    encode_timeseries,
+)
+from osrs_prices.exceptions import CodecError
+from osrs_prices.models import AveragePrice, TimeseriesDataPoint, TimeseriesResponse
+
+
+class TestCodec:
+    """Tests for encoding and decoding price history."""
+
+    def test_timeseries_round_trip(self, sample_timeseries_response: dict) -> None:
+        """Test that timeseries points survive a round trip unchanged."""
+        points = TimeseriesResponse.from_api(sample_timeseries_response).data
+        assert decode_timeseries(encode_timeseries(points)) == points
+
+    def test_null_fields_round_trip(self) -> None:
+        """Test that missing values are preserved via the null bitmap."""
+        points = [
+            TimeseriesDataPoint(timestamp=1704067200, avg_high_price=100),
+            TimeseriesDataPoint(timestamp=1704067500, avg_low_price=90, low_price_volume=3),
+            TimeseriesDataPoint(timestamp=1704067800),
+            TimeseriesDataPoint(timestamp=1704068100, avg_high_price=95, avg_low_price=80),
+        ]
+        assert decode_timeseries(encode_timeseries(points)) == points
+
+    def test_averages_round_trip(self, sample_5m_response: dict) -> None:
+        """Test that per-bucket average snapshots survive a round trip."""
+        snapshots = [
+            (1704067200, AveragePrice.model_validate(sample_5m_response["data"]["4151"])),
+            (1704067500, AveragePrice(avg_high_price=1496000, high_price_volume=12)),
+        ]
+        assert decode_averages(encode_averages(snapshots)) == snapshots
+
+    def test_regular_series_is_compact(self) -> None:
+        """Test that a fixed-step, slowly moving series encodes to a few bytes a point."""
+        points = [
+            TimeseriesDataPoint(
+                timestamp=1704067200 + i * 300,
+                avg_high_price=1500000 + i % 3,
+                avg_low_price=1490000 - i % 2,
+                high_price_volume=10,
+                low_price_volume=12,
+            )
+            for i in range(1000)
+        ]
+        assert len(encode_timeseries(points)) < 8 * len(points)
+
+    def test_streaming_with_small_chunks(self) -> None:
+        """Test that the decoder handles records spanning read boundaries."""
+        stream = io.BytesIO()
+        encoder = Encoder(stream, KIND_AVERAGE)
+        for i in range(200):
+            encoder.write(1704067200 + i * 3600, 2**40 + i, None, i, None)
+        encoder.flush()
+        stream.seek(0)
+
+        decoder = Decoder(stream, chunk_size=7)
+        records = list(decoder)
+
+        assert decoder.kind == KIND_AVERAGE
+        assert len(records) == 200
+        assert records[-1] == (1704067200 + 199 * 3600, 2**40 + 199, None, 199, None)
+
+    def test_kind_mismatch(self) -> None:
+        """Test that decoding the wrong record kind is rejected."""
+        data = encode_averages([(1704067200, AveragePrice())])
+        with pytest.raises(CodecError, match="kind"):
+            decode_timeseries(data)
+
+    def test_invalid_header(self) -> None:
+        """Test that data without the stream header is rejected."""
+        with pytest.raises(CodecError, match="Not an osrs_prices"):
+            decode_timeseries(b"{}")
+
+    def test_truncated_stream(self) -> None:
+        """Test that a truncated record raises CodecError."""
+        data = encode_timeseries([TimeseriesDataPoint(timestamp=1704067200, avg_high_price=2**30)])
+        with pytest.raises(CodecError, match="Truncated"):
+            decode_timeseries(data[:-1])
@@ -0,0 +1,95 @@
+"""Unit tests for the compact mapping and latest price representations."""
+
+import json
+
+import pytest
+
+from osrs_prices.compact import CompactLatest, CompactMapping
+from osrs_prices.models import LatestPrice, LatestResponse, MappingResponse
+
+
+class TestCompactMapping:
+    """Tests for CompactMapping."""
+
+    def test_matches_models(self, sample_mapping_response: list[dict]) -> None:
+        """Test that every item converts back to the same ItemMapping."""
+        mapping = MappingResponse.from_list(sample_mapping_response)
+        compact = CompactMapping.from_list(sample_mapping_response)
+
+        assert len(compact) == len(mapping.items)
+        assert sorted(mapping.items, key=lambda i: i.id) == [item.to_model() for item in compact]
+        assert compact.to_response() == MappingResponse(
+            items=sorted(mapping.items, key=lambda i: i.id)
+        )
+
+    def test_from_response(self, sample_mapping_response: list[dict]) -> None:
+        """Test building from parsed models."""
+        mapping = MappingResponse.from_list(sample_mapping_response)
+        compact = CompactMapping.from_response(mapping)
+
+        whip = compact[4151]
+        assert whip.name == "Abyssal whip"
+        assert whip.examine == "A weapon from the abyss."
+        assert whip.icon == "Abyssal_whip.png"
+        assert whip.limit == 70
+
+    def test_lookup(self, sample_mapping_response: list[dict]) -> None:
+        """Test lookups by ID and name."""
+        compact = CompactMapping.from_list(sample_mapping_response)
+
+        assert 2 in compact
+        assert 3 not in compact
+        assert compact.get(3) is None
+        assert compact.get(99999) is None
+        with pytest.raises(KeyError):
+            compact[3]
+        cannonball = compact.get_by_name("Cannonball")
+        assert cannonball is not None and cannonball.id == 2
+        assert compact.get_by_name("Nothing") is None
+
+    def test_missing_values(self, sample_mapping_response: list[dict]) -> None:
+        """Test that None fields and examine text are preserved."""
+        data = [*sample_mapping_response, {"id": 5, "name": "Blank", "members": False, "icon": ""}]
+        compact = CompactMapping.from_list(data)
+
+        assert compact[11802].lowalch is None
+        assert compact[5].examine is None
+        assert compact[5].value is None
+
+    def test_items_are_slotted(self, sample_mapping_response: list[dict]) -> None:
+        """Test that items have no per-instance dict and share interned names."""
+        first = CompactMapping.from_list(sample_mapping_response)
+        second = CompactMapping.from_list(json.loads(json.dumps(sample_mapping_response)))
+
+        assert not hasattr(first[4151], "__dict__")
+        assert first[4151].name is second[4151].name
+
+
+class TestCompactLatest:
+    """Tests for CompactLatest."""
+
+    def test_matches_models(self, sample_latest_response: dict) -> None:
+        """Test that the snapshot converts back to the same LatestResponse."""
+        latest = LatestResponse.from_api(sample_latest_response)
+        compact = CompactLatest.from_api(sample_latest_response)
+
+        assert len(compact) == 2
+        assert compact.ids() == [2, 4151]
+        assert compact[4151] == latest.data[4151]
+        assert compact.to_response() == latest
+        assert CompactLatest.from_response(latest).to_response() == latest
+
+    def test_missing_values(self) -> None:
+        """Test that missing prices and times round-trip as None."""
+        compact = CompactLatest.from_api({"data": {"7": {"high": 10, "highTime": 1}}})
+
+        assert compact[7] == LatestPrice(high=10, highTime=1, low=None, lowTime=None)
+
+    def test_unknown_item(self, sample_latest_response: dict) -> None:
+        """Test lookups of items without prices."""
+        compact = CompactLatest.from_api(sample_latest_response)
+
+        assert compact.get(3) is None
+        assert 3 not in compact
+        with pytest.raises(KeyError):
+            compact[3]
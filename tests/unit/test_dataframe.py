@@ -1,8 +1,13 @@
 """Unit tests for DataFrame conversion utilities."""
 
+from collections.abc import Iterator
+
+import httpx
+import pandas as pd
 import pytest
 
-from osrs_prices.pandas import to_dataframe
+from osrs_prices import Client
+from osrs_prices.pandas import COMPACT_DTYPES, DtypePolicy, from_api, to_dataframe
 from osrs_prices.models import (
     AveragePrice,
     AverageResponse,
@@ -113,20 +118,233 @@ class TestToDataFrame:
         assert "UTC" in str(df.index.dtype)
 
     def test_empty_responses(self) -> None:
-        """Test converting empty responses."""
+        """Test that empty responses keep their index and columns."""
         mapping_df = to_dataframe(MappingResponse(items=[]))
         assert len(mapping_df) == 0
+        assert mapping_df.index.name == "id"
 
         latest_df = to_dataframe(LatestResponse(data={}))
         assert len(latest_df) == 0
+        assert latest_df.index.name == "item_id"
+        assert list(latest_df.columns) == ["high", "high_time", "low", "low_time"]
+        assert (latest_df.dtypes == "int64").all()
 
         average_df = to_dataframe(AverageResponse(data={}, timestamp=0))
         assert len(average_df) == 0
+        assert average_df.index.name == "item_id"
+        assert list(average_df.columns) == [
+            "avg_high_price",
+            "high_price_volume",
+            "avg_low_price",
+            "low_price_volume",
+        ]
+        assert average_df.attrs == {"timestamp": 0}
 
         timeseries_df = to_dataframe(TimeseriesResponse(data=[]))
         assert len(timeseries_df) == 0
+        assert isinstance(timeseries_df.index, pd.DatetimeIndex)
+
+    def test_all_missing_column_is_float(self) -> None:
+        """Test that a column with no values is float64 NaN, not object None."""
+        df = to_dataframe(LatestResponse(data={1: LatestPrice(high=5)}))
+
+        assert df["high"].dtype == "int64"
+        assert df["low"].dtype == "float64"
+        assert df["low"].isna().all()
 
     def test_unsupported_type(self) -> None:
         """Test that unsupported types raise TypeError."""
         with pytest.raises(TypeError, match="Unsupported response type"):
             to_dataframe("not a response")  # type: ignore[arg-type]
+
+
+class TestFromApi:
+    """Tests for building DataFrames straight from decoded JSON."""
+
+    def test_mapping(self, sample_mapping_response: list[dict]) -> None:
+        """Test that mapping JSON gives the same frame as the parsed response."""
+        expected = to_dataframe(MappingResponse.from_list(sample_mapping_response))
+
+        pd.testing.assert_frame_equal(from_api(sample_mapping_response, "mapping"), expected)
+
+    def test_latest(self, sample_latest_response: dict) -> None:
+        """Test that latest JSON gives the same frame as the parsed response."""
+        expected = to_dataframe(LatestResponse.from_api(sample_latest_response))
+
+        df = from_api(sample_latest_response, "latest")
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["high"].dtype == "int64"
+
+    def test_average(self) -> None:
+        """Test that average JSON keeps the snapshot timestamp."""
+        data = {
+            "data": {"4151": {"avgHighPrice": 1495000, "highPriceVolume": 50}},
+            "timestamp": 1704067200,
+        }
+        expected = to_dataframe(AverageResponse.from_api(data))
+
+        for kind in ("5m", "1h"):
+            df = from_api(data, kind)  # type: ignore[arg-type]
+            pd.testing.assert_frame_equal(df, expected)
+            assert df.attrs["timestamp"] == 1704067200
+
+    def test_timeseries(self) -> None:
+        """Test that timeseries JSON gives the same frame as the parsed response."""
+        data = {
+            "data": [
+                {"timestamp": 1704063600, "avgHighPrice": 1490000, "highPriceVolume": 3},
+                {"timestamp": 1704067200, "avgLowPrice": 1480000, "highPriceVolume": 5},
+            ]
+        }
+        expected = to_dataframe(TimeseriesResponse.from_api(data))
+
+        pd.testing.assert_frame_equal(from_api(data, "timeseries"), expected)
+
+    def test_missing_values_become_nan(self) -> None:
+        """Test that integer columns with missing values become float64 with NaN."""
+        data = {"data": {"1": {"high": 10}, "2": {"high": 20, "low": 15}}}
+
+        df = from_api(data, "latest")
+
+        assert df["high"].dtype == "int64"
+        assert df["low"].dtype == "float64"
+        assert pd.isna(df.loc[1, "low"])
+
+    def test_unsupported_kind(self) -> None:
+        """Test that unknown kinds raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported response kind"):
+            from_api({}, "prices")  # type: ignore[arg-type]
+
+
+class TestDtypePolicy:
+    """Tests for DataFrame dtype policies."""
+
+    def test_nullable_integers(self) -> None:
+        """Test that missing integers are NA in nullable integer columns."""
+        response = LatestResponse(data={1: LatestPrice(high=10), 2: LatestPrice(high=20, low=15)})
+
+        df = to_dataframe(response, dtypes=DtypePolicy(integers="Int64"))
+
+        assert df["high"].dtype == "Int64"
+        assert df["low"].dtype == "Int64"
+        assert df.loc[1, "low"] is pd.NA
+        assert df.loc[2, "low"] == 15
+
+    def test_int32_falls_back_to_int64(self) -> None:
+        """Test that Int32 columns whose values overflow are built as Int64."""
+        data = {"data": {"1": {"high": 10, "low": 2**40}}}
+
+        df = from_api(data, "latest", DtypePolicy(integers="Int32"))
+
+        assert df["high"].dtype == "Int32"
+        assert df["low"].dtype == "Int64"
+        assert df.loc[1, "low"] == 2**40
+
+    @pytest.mark.parametrize(
+        ("strings", "dtype"),
+        [("object", "object"), ("string", "string"), ("category", "category")],
+    )
+    def test_strings(self, sample_mapping_response: list[dict], strings: str, dtype: str) -> None:
+        """Test the string column dtypes."""
+        policy = DtypePolicy(strings=strings)  # type: ignore[arg-type]
+
+        df = from_api(sample_mapping_response, "mapping", policy)
+
+        assert df["name"].dtype == dtype
+        assert df["members"].dtype == "bool"
+        assert df.loc[4151, "name"] == "Abyssal whip"
+
+    def test_pyarrow_strings(self, sample_mapping_response: list[dict]) -> None:
+        """Test that pyarrow-backed strings are used when pyarrow is installed."""
+        pytest.importorskip("pyarrow")
+
+        df = from_api(sample_mapping_response, "mapping", DtypePolicy(strings="pyarrow"))
+
+        assert df["name"].dtype == pd.StringDtype("pyarrow")
+
+    def test_datetimes(self, sample_latest_response: dict) -> None:
+        """Test that trade times become UTC datetimes."""
+        data = {"data": {**sample_latest_response["data"], "7": {"high": 1}}}
+
+        df = from_api(data, "latest", DtypePolicy(datetimes=True))
+
+        assert str(df["high_time"].dtype).startswith("datetime64")
+        assert df.loc[4151, "high_time"] == pd.Timestamp(1704067200, unit="s", tz="UTC")
+        assert pd.isna(df.loc[7, "low_time"])
+
+    def test_compact_matches_default_values(self, sample_mapping_response: list[dict]) -> None:
+        """Test that the compact policy changes dtypes but not values."""
+        response = MappingResponse.from_list(sample_mapping_response)
+
+        default = to_dataframe(response)
+        compact = to_dataframe(response, dtypes=COMPACT_DTYPES)
+
+        assert compact["value"].dtype == "Int32"
+        assert list(compact.index) == list(default.index)
+
+        def values(df: pd.DataFrame) -> dict:
+            return df.astype(object).where(df.notna(), None).to_dict("list")
+
+        assert values(compact) == values(default)
+
+
+class TestEnrichedDataFrames:
+    """Tests for DataFrames of enriched responses."""
+
+    @pytest.fixture
+    def client(
+        self, sample_mapping_response: list[dict], sample_latest_response: dict
+    ) -> Iterator[Client]:
+        bodies = {
+            "/api/v1/osrs/mapping": sample_mapping_response,
+            "/api/v1/osrs/latest": sample_latest_response,
+            "/api/v1/osrs/5m": {
+                "data": {"4151": {"avgHighPrice": 1495000, "highPriceVolume": 50}},
+                "timestamp": 1704067200,
+            },
+            "/api/v1/osrs/timeseries": {
+                "data": [{"timestamp": 1704067200, "avgHighPrice": 1500000}]
+            },
+        }
+        transport = httpx.MockTransport(lambda r: httpx.Response(200, json=bodies[r.url.path]))
+        with Client(user_agent="test/1.0", transport=transport) as client:
+            yield client
+
+    def test_enriched_latest(self, client: Client) -> None:
+        """Test that the frame matches joining the mapping and latest frames."""
+        df = to_dataframe(client.get_latest_with_mapping())
+
+        mapping = to_dataframe(client.get_mapping())
+        latest = to_dataframe(client.get_latest())
+        joined = mapping.join(latest, how="inner").rename_axis("item_id")
+        # The mapping's missing alch values are not in the join, so its dtypes differ.
+        pd.testing.assert_frame_equal(df.sort_index(), joined.sort_index(), check_dtype=False)
+        assert df.loc[4151, "name"] == "Abyssal whip"
+        assert df.loc[4151, "high"] == 1500000
+
+    def test_enriched_average(self, client: Client) -> None:
+        """Test that enriched averages keep the snapshot timestamp."""
+        df = to_dataframe(client.get_5m_average_with_mapping())
+
+        assert list(df.index) == [4151]
+        assert df.index.name == "item_id"
+        assert df.loc[4151, "avg_high_price"] == 1495000
+        assert df.loc[4151, "limit"] == 70
+        assert df.attrs["timestamp"] == 1704067200
+
+    def test_enriched_timeseries(self, client: Client) -> None:
+        """Test that the item's metadata is carried in attrs."""
+        df = to_dataframe(client.get_timeseries_with_mapping(4151, "5m"))
+
+        assert len(df) == 1
+        assert df.index.name == "timestamp"
+        assert df.attrs["item_id"] == 4151
+        assert df.attrs["item"]["name"] == "Abyssal whip"
+
+    def test_enriched_dtypes(self, client: Client) -> None:
+        """Test that dtype policies apply to enriched frames."""
+        df = to_dataframe(client.get_latest_with_mapping(), dtypes=COMPACT_DTYPES)
+
+        assert df["limit"].dtype == "Int32"
+        assert str(df["high_time"].dtype).startswith("datetime64")
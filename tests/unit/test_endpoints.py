@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import httpx
 import pytest
 
+from osrs_prices.cache import CachePolicy, LRUCache
 from osrs_prices.endpoints import (
     FiveMinuteEndpoint,
     LatestEndpoint,
@@ -46,6 +47,59 @@ class TestBaseEndpointErrors:
         assert exc_info.value.status_code == 500
 
 
+class TestBaseEndpointResponseCache:
+    """Tests for the shared response cache in base endpoint."""
+
+    @staticmethod
+    def _mock_client(data: dict) -> MagicMock:
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = data
+        mock_response.content = b"x" * 128
+        mock_client.get.return_value = mock_response
+        return mock_client
+
+    def test_cached_per_params(self, sample_timeseries_response: dict) -> None:
+        """Test that responses are cached separately for each set of params."""
+        mock_client = self._mock_client(sample_timeseries_response)
+        cache: LRUCache = LRUCache()
+        endpoint = TimeseriesEndpoint(mock_client, cache)
+
+        first = endpoint.fetch(item_id=4151, timestep="1h")
+        second = endpoint.fetch(item_id=4151, timestep="1h")
+        endpoint.fetch(item_id=4151, timestep="5m")
+
+        assert first is second
+        assert mock_client.get.call_count == 2
+        assert cache.stats().entries == 2
+        assert cache.stats().bytes == 256
+
+    def test_no_policy_bypasses_cache(self, sample_latest_response: dict) -> None:
+        """Test that an endpoint without a cache policy never uses the cache."""
+        mock_client = self._mock_client(sample_latest_response)
+        cache: LRUCache = LRUCache()
+        endpoint = LatestEndpoint(mock_client, cache)
+        endpoint.cache_policy = None
+
+        endpoint.fetch()
+        endpoint.fetch()
+
+        assert mock_client.get.call_count == 2
+        assert len(cache) == 0
+
+    def test_policy_ttl(self, sample_5m_response: dict) -> None:
+        """Test that the policy TTL is applied to cached responses."""
+        mock_client = self._mock_client(sample_5m_response)
+        endpoint = FiveMinuteEndpoint(mock_client, LRUCache())
+        endpoint.cache_policy = CachePolicy(ttl=0.0)
+
+        endpoint.fetch()
+        endpoint.fetch()
+
+        assert mock_client.get.call_count == 2
+
+
 class TestLatestEndpoint:
     """Tests for LatestEndpoint."""
 
@@ -0,0 +1,206 @@
+"""Unit tests for streaming snapshot export."""
+
+import csv
+import gzip
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.export import CSVExporter, NDJSONExporter, ParquetExporter, export
+from osrs_prices.models import (
+    AveragePrice,
+    AverageResponse,
+    EnrichedAveragePrice,
+    EnrichedAverageResponse,
+    LatestResponse,
+)
+
+# 2023-12-31 23:50 to 2024-01-01 00:05 UTC, in 5 minute steps.
+TIMESTAMPS = [1704066600, 1704066900, 1704067200, 1704067500]
+
+
+def snapshots() -> Iterator[AverageResponse]:
+    """Two items per snapshot, either side of midnight."""
+    for i, timestamp in enumerate(TIMESTAMPS):
+        yield AverageResponse(
+            data={
+                4151: AveragePrice(avg_high_price=1000 + i, high_price_volume=i),
+                2: AveragePrice(avg_low_price=5),
+            },
+            timestamp=timestamp,
+        )
+
+
+@pytest.fixture
+def pq() -> Any:
+    """The pyarrow.parquet module, skipping the test without pyarrow."""
+    return pytest.importorskip("pyarrow.parquet")
+
+
+class TestParquetExporter:
+    """Tests for ParquetExporter."""
+
+    def test_partitions(self, pq: Any, tmp_path: Path) -> None:
+        """Test that files are partitioned by timestep and date."""
+        with ParquetExporter(tmp_path, "5m") as exporter:
+            exporter.write_all(snapshots())
+
+        assert [path.relative_to(tmp_path).as_posix() for path in exporter.paths] == [
+            "timestep=5m/date=2023-12-31/part-1704066600.parquet",
+            "timestep=5m/date=2024-01-01/part-1704067200.parquet",
+        ]
+
+    def test_rows(self, pq: Any, tmp_path: Path) -> None:
+        """Test that every item in every snapshot is a row with its timestamp."""
+        paths = export(snapshots(), tmp_path, "5m")
+
+        table = pq.read_table(paths[1])
+
+        assert table.column_names == [
+            "timestamp",
+            "item_id",
+            "avg_high_price",
+            "high_price_volume",
+            "avg_low_price",
+            "low_price_volume",
+        ]
+        assert str(table.schema.field("timestamp").type).startswith("timestamp")
+        rows = table.to_pylist()
+        assert [row["timestamp"].timestamp() for row in rows] == [1704067200] * 2 + [1704067500] * 2
+        assert rows[0]["avg_high_price"] == 1002
+        assert rows[1]["avg_high_price"] is None
+
+    def test_row_groups(self, pq: Any, tmp_path: Path) -> None:
+        """Test that whole snapshots are grouped until the row group is full."""
+        paths = export(snapshots(), tmp_path, "5m", row_group_size=1)
+        grouped = export(snapshots(), tmp_path / "grouped", "5m", row_group_size=4)
+
+        assert pq.ParquetFile(paths[0]).metadata.num_row_groups == 2
+        assert pq.ParquetFile(grouped[0]).metadata.num_row_groups == 1
+
+    def test_empty_snapshots(self, pq: Any, tmp_path: Path) -> None:
+        """Test that empty snapshots add no row groups and do not break the file."""
+        empty = [AverageResponse(data={}, timestamp=timestamp) for timestamp in TIMESTAMPS[2:]]
+        only_empty = export(empty, tmp_path / "empty", "5m", row_group_size=1)
+        responses = [*snapshots()]
+        mixed = export(
+            [responses[2], empty[0], responses[3]], tmp_path / "mixed", "5m", row_group_size=1
+        )
+
+        assert pq.read_table(only_empty[0]).num_rows == 0
+        assert pq.ParquetFile(only_empty[0]).metadata.num_row_groups == 0
+        assert pq.read_table(mixed[0]).num_rows == 4
+        assert pq.ParquetFile(mixed[0]).metadata.num_row_groups == 2
+
+    def test_dataset(self, pq: Any, tmp_path: Path) -> None:
+        """Test that the partitions read back as a Hive-partitioned dataset."""
+        export(snapshots(), tmp_path, "5m")
+
+        table = pq.read_table(tmp_path, partitioning="hive")
+
+        assert table.num_rows == 8
+        assert set(table.column("date").to_pylist()) == {"2023-12-31", "2024-01-01"}
+
+    def test_enriched(self, pq: Any, tmp_path: Path, sample_mapping_response: list[dict]) -> None:
+        """Test that enriched snapshots keep the item metadata."""
+        item = EnrichedAveragePrice.model_validate(
+            {**sample_mapping_response[0], "avg_high_price": 7}
+        )
+        paths = export(
+            [EnrichedAverageResponse(items=[item], timestamp=TIMESTAMPS[0])], tmp_path, "1h"
+        )
+
+        row = pq.read_table(paths[0]).to_pylist()[0]
+
+        assert row["name"] == "Abyssal whip"
+        assert row["avg_high_price"] == 7
+
+
+class TestTextExporters:
+    """Tests for CSVExporter and NDJSONExporter."""
+
+    def test_csv(self, tmp_path: Path) -> None:
+        """Test gzip CSV output with empty fields for missing values."""
+        with CSVExporter(tmp_path, "5m") as exporter:
+            exporter.write_all(snapshots())
+
+        assert exporter.paths[0].name == "part-1704066600.csv.gz"
+        with gzip.open(exporter.paths[0], "rt", newline="") as file:
+            rows = list(csv.reader(file))
+        assert rows[0][:3] == ["timestamp", "item_id", "avg_high_price"]
+        assert rows[1][:4] == ["1704066600", "4151", "1000", "0"]
+        assert rows[2] == ["1704066600", "2", "", "", "5", ""]
+        assert len(rows) == 5
+
+    def test_ndjson(self, tmp_path: Path) -> None:
+        """Test gzip NDJSON output with null for missing values."""
+        paths = export(snapshots(), tmp_path, "5m", format="ndjson")
+
+        with gzip.open(paths[1], "rt") as file:
+            rows = [json.loads(line) for line in file]
+        assert len(rows) == 4
+        assert rows[0] == {
+            "timestamp": 1704067200,
+            "item_id": 4151,
+            "avg_high_price": 1002,
+            "high_price_volume": 2,
+            "avg_low_price": None,
+            "low_price_volume": None,
+        }
+
+    def test_reopen_after_close(self, tmp_path: Path) -> None:
+        """Test that writing after close starts a new file."""
+        exporter = NDJSONExporter(tmp_path, "5m")
+        responses = list(snapshots())
+        exporter.write(responses[0])
+        exporter.close()
+        exporter.write(responses[1])
+        exporter.close()
+
+        assert [path.name for path in exporter.paths] == [
+            "part-1704066600.ndjson.gz",
+            "part-1704066900.ndjson.gz",
+        ]
+
+    def test_existing_parts_are_kept(self, tmp_path: Path) -> None:
+        """Test that a part with the same name gets a sequence number."""
+        first = export(snapshots(), tmp_path, "5m", format="csv")
+        exporter = CSVExporter(tmp_path, "5m")
+        responses = list(snapshots())
+        exporter.write(responses[0])
+        exporter.close()
+        exporter.write(responses[0])
+        exporter.close()
+
+        assert [path.name for path in exporter.paths] == [
+            "part-1704066600-1.csv.gz",
+            "part-1704066600-2.csv.gz",
+        ]
+        with gzip.open(first[0], "rt", newline="") as file:
+            assert len(list(csv.reader(file))) == 5
+
+
+class TestExportErrors:
+    """Tests for rejected input."""
+
+    def test_unsupported_response(self, tmp_path: Path) -> None:
+        """Test that snapshots without a timestamp are rejected."""
+        with pytest.raises(TypeError, match="Unsupported response type"):
+            export([LatestResponse(data={})], tmp_path, "5m", format="csv")
+
+    def test_mixed_responses(self, tmp_path: Path, sample_mapping_response: list[dict]) -> None:
+        """Test that plain and enriched snapshots cannot be mixed."""
+        item = EnrichedAveragePrice.model_validate(sample_mapping_response[0])
+        enriched = EnrichedAverageResponse(items=[item], timestamp=TIMESTAMPS[1])
+
+        with pytest.raises(ValidationError, match="mixed"):
+            export([next(snapshots()), enriched], tmp_path, "5m", format="csv")
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            export(snapshots(), tmp_path, "5m", format="xlsx")  # type: ignore[arg-type]
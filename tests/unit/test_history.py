@@ -0,0 +1,71 @@
+"""Unit tests for compact timeseries history."""
+
+from osrs_prices.constants import NULL_INT64
+from osrs_prices.history import TimeseriesHistory
+from osrs_prices.models import TimeseriesDataPoint, TimeseriesResponse
+
+
+def _point(timestamp: int, price: int | None = 100) -> TimeseriesDataPoint:
+    return TimeseriesDataPoint(timestamp=timestamp, avg_high_price=price, high_price_volume=5)
+
+
+class TestTimeseriesHistory:
+    """Tests for TimeseriesHistory."""
+
+    def test_merge_sorts_points(self, sample_timeseries_response: dict) -> None:
+        """Test that merged points are stored oldest first."""
+        history = TimeseriesHistory(4151, "1h")
+        response = TimeseriesResponse.from_api(sample_timeseries_response)
+
+        assert history.merge(response.data) == 3
+        assert list(history.timestamps) == [1704060000, 1704063600, 1704067200]
+        assert history.tail == 1704067200
+        assert history.window == 3
+
+    def test_merge_appends_only_new_points(self) -> None:
+        """Test that a refresh only appends points newer than the tail."""
+        history = TimeseriesHistory(4151, "5m")
+        history.merge([_point(300), _point(600)])
+
+        appended = history.merge([_point(600, price=999), _point(900), _point(1200)])
+
+        assert appended == 2
+        assert list(history.timestamps) == [300, 600, 900, 1200]
+        assert list(history.avg_high_price) == [100, 100, 100, 100]
+
+    def test_merge_deduplicates_by_timestamp(self) -> None:
+        """Test that duplicate timestamps within a response are stored once."""
+        history = TimeseriesHistory(4151, "5m")
+        assert history.merge([_point(300), _point(300), _point(600)]) == 2
+        assert len(history) == 2
+
+    def test_nulls_round_trip(self) -> None:
+        """Test that missing values are stored as the sentinel and restored as None."""
+        history = TimeseriesHistory(4151, "5m")
+        points = [_point(300), _point(600, price=None)]
+        history.merge(points)
+
+        assert history.avg_high_price[1] == NULL_INT64
+        assert history.to_points() == points
+
+    def test_to_response_last(self) -> None:
+        """Test limiting a response to the newest points."""
+        history = TimeseriesHistory(4151, "5m")
+        history.merge([_point(300), _point(600), _point(900)])
+
+        response = history.to_response(last=2)
+
+        assert response.item_id == 4151
+        assert [p.timestamp for p in response.data] == [600, 900]
+
+    def test_copy_is_independent(self) -> None:
+        """Test that merging into a history does not change its copies."""
+        history = TimeseriesHistory(4151, "5m")
+        history.merge([_point(300), _point(600)])
+
+        copy = history.copy()
+        history.merge([_point(900)])
+
+        assert list(copy.timestamps) == [300, 600]
+        assert copy.to_points() == [_point(300), _point(600)]
+        assert copy.window == 2
@@ -0,0 +1,152 @@
+"""Unit tests for request lifecycle hooks."""
+
+import httpx
+import pytest
+
+from osrs_prices import APIError, Client, Hooks, RequestEvent
+from osrs_prices.backends import MemoryBackend
+from osrs_prices.cache import LRUCache
+
+
+def _client(handler: object, **kwargs: object) -> Client:
+    return Client(
+        user_agent="test/1.0",
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestHooks:
+    """Tests for the Hooks registry."""
+
+    def test_empty_registry_is_falsy(self) -> None:
+        """Test that an empty registry is falsy so endpoints can skip it."""
+        hooks = Hooks()
+        assert not hooks
+
+        hooks.register(print)
+        assert hooks
+        assert len(hooks) == 1
+
+    def test_kinds_filter(self) -> None:
+        """Test that callbacks only see the kinds they subscribed to."""
+        hooks = Hooks()
+        seen: list[str] = []
+        hooks.register(lambda e: seen.append(e.kind), kinds={"cache_hit"})
+
+        hooks.emit(RequestEvent("request_start", "/latest", {}))
+        hooks.emit(RequestEvent("cache_hit", "/latest", {}))
+
+        assert seen == ["cache_hit"]
+
+    def test_unregister(self) -> None:
+        """Test that unregistered callbacks stop receiving events."""
+        hooks = Hooks()
+        seen: list[RequestEvent] = []
+        hooks.register(seen.append)
+        hooks.unregister(seen.append)
+
+        hooks.emit(RequestEvent("request_start", "/latest", {}))
+
+        assert seen == []
+        assert not hooks
+
+
+class TestClientHooks:
+    """Tests for events emitted by client requests."""
+
+    def test_request_lifecycle(self, sample_latest_response: dict) -> None:
+        """Test that a network request emits every stage with timings."""
+        events: list[RequestEvent] = []
+        with _client(lambda r: httpx.Response(200, json=sample_latest_response)) as client:
+            client.hooks.register(events.append)
+            client.get_latest(item_id=4151)
+
+        assert [e.kind for e in events] == [
+            "request_start",
+            "response_headers",
+            "body_received",
+            "json_decoded",
+            "model_parsed",
+        ]
+        assert all(e.path == "/latest" and e.params == {"id": "4151"} for e in events)
+        final = events[-1]
+        assert final.status == 200
+        assert final.size is not None and final.size > 0
+        assert set(final.durations) == {"headers", "body", "decode", "parse", "total"}
+        assert final.durations["total"] >= final.durations["parse"]
+
+    def test_error_response(self) -> None:
+        """Test that error responses emit events up to body_received."""
+        events: list[RequestEvent] = []
+        with _client(lambda r: httpx.Response(500, text="boom")) as client:
+            client.hooks.register(events.append)
+            with pytest.raises(APIError):
+                client.get_latest()
+
+        assert [e.kind for e in events][-1] == "body_received"
+        assert events[-1].status == 500
+
+    def test_connection_error(self) -> None:
+        """Test that a request failing without a response emits request_failed."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        events: list[RequestEvent] = []
+        with _client(handler) as client:
+            client.hooks.register(events.append)
+            with pytest.raises(httpx.ConnectError):
+                client.get_latest()
+
+        assert [e.kind for e in events] == ["request_start", "request_failed"]
+        assert events[-1].error == "ConnectError"
+        assert events[-1].status is None
+
+    def test_cache_events(self, sample_latest_response: dict) -> None:
+        """Test cache miss, memory hit and backend hit events."""
+        backend = MemoryBackend()
+        events: list[RequestEvent] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=sample_latest_response)
+
+        with _client(handler, response_cache=LRUCache(), cache_backend=backend) as client:
+            client.hooks.register(events.append, kinds={"cache_hit", "cache_miss"})
+            client.get_latest()
+            client.get_latest()
+        with _client(handler, cache_backend=backend) as client:
+            client.hooks.register(events.append, kinds={"cache_hit", "cache_miss"})
+            client.get_latest()
+
+        assert [(e.kind, e.cache) for e in events] == [
+            ("cache_miss", None),
+            ("cache_hit", "memory"),
+            ("cache_hit", "backend"),
+        ]
+        assert events[-1].size is not None
+
+    def test_mapping_cache_events(self, sample_mapping_response: list[dict]) -> None:
+        """Test that the mapping's own cache reports hits and misses."""
+        kinds: list[str] = []
+        with _client(lambda r: httpx.Response(200, json=sample_mapping_response)) as client:
+            client.hooks.register(lambda e: kinds.append(e.kind), kinds={"cache_hit", "cache_miss"})
+            client.get_mapping()
+            client.get_mapping()
+
+        assert kinds == ["cache_miss", "cache_hit"]
+
+    def test_shared_registry(self, sample_latest_response: dict) -> None:
+        """Test that a registry passed to several clients sees all their events."""
+        hooks = Hooks()
+        paths: list[str] = []
+        hooks.register(lambda e: paths.append(e.path), kinds={"model_parsed"})
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=sample_latest_response)
+
+        with _client(handler, hooks=hooks) as first, _client(handler, hooks=hooks) as second:
+            first.get_latest()
+            second.get_latest()
+
+        assert paths == ["/latest", "/latest"]
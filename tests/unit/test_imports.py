@@ -0,0 +1,76 @@
+"""Unit tests for lazy package imports and the import-time budget."""
+
+import subprocess
+import sys
+
+import pytest
+
+import osrs_prices
+import osrs_prices.backends
+import osrs_prices.endpoints
+import osrs_prices.models
+
+IMPORT_BUDGET_US = 30_000
+"""Maximum cumulative `import osrs_prices` time in microseconds."""
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    # Lines look like "import time:   self |  cumulative | [indent]module".
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not in importtime output")
+
+
+class TestLazyImports:
+    """Tests for module-level lazy loading."""
+
+    def test_import_does_not_load_heavy_dependencies(self) -> None:
+        """Test that importing the package leaves httpx and pydantic unloaded."""
+        result = _run(
+            "import sys, osrs_prices; "
+            "print(sorted(m for m in ('httpx', 'pydantic', 'osrs_prices.client') "
+            "if m in sys.modules))"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_model_import_is_granular(self) -> None:
+        """Test that one model does not import every model module."""
+        result = _run(
+            "import sys; from osrs_prices.models import LatestResponse; "
+            "print('osrs_prices.models.enriched' in sys.modules)"
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.parametrize(
+        "package",
+        [osrs_prices, osrs_prices.models, osrs_prices.endpoints, osrs_prices.backends],
+        ids=lambda p: p.__name__,
+    )
+    def test_public_api_intact(self, package: object) -> None:
+        """Test that every exported name resolves and is listed by dir()."""
+        for name in package.__all__:  # type: ignore[attr-defined]
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            osrs_prices.NotAThing  # noqa: B018
+
+    def test_import_time_budget(self) -> None:
+        """Test that `import osrs_prices` stays within the import-time budget."""
+        best = min(
+            _cumulative_us(_run("import osrs_prices").stderr, "osrs_prices") for _ in range(3)
+        )
+        assert best <= IMPORT_BUDGET_US, f"import osrs_prices took {best} us"
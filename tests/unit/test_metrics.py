@@ -0,0 +1,147 @@
+"""Unit tests for the metrics registry."""
+
+import httpx
+import pytest
+
+from osrs_prices import APIError, Client, RateLimitError, ValidationError
+from osrs_prices.metrics import CONTENT_TYPE, MetricsRegistry, _Metric, serve_metrics
+
+
+def _client(registry: MetricsRegistry, handler: object) -> Client:
+    return Client(
+        user_agent="test/1.0",
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+        metrics=registry,
+    )
+
+
+class TestMetricTypes:
+    """Tests for counters, gauges and histograms."""
+
+    def test_counter_render(self) -> None:
+        """Test that counters render with a _total suffix and labels."""
+        registry = MetricsRegistry(namespace="t")
+        counter = registry.counter("jobs", "Jobs run.", ("queue",))
+        counter.inc(queue="a")
+        counter.inc(2, queue='b"c')
+
+        text = registry.render()
+        assert "# TYPE jobs counter\n# HELP jobs Jobs run.\n" in text
+        assert 'jobs_total{queue="a"} 1\n' in text
+        assert 'jobs_total{queue="b\\"c"} 2\n' in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test histogram bucket, sum and count lines."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1\n' in text
+        assert 'latency_seconds_bucket{le="1.0"} 3\n' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "latency_seconds_sum 6.05\n" in text
+        assert "latency_seconds_count 4\n" in text
+
+    def test_wrong_labels(self) -> None:
+        """Test that mismatched label names raise ValidationError."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs", "Jobs run.", ("queue",))
+
+        with pytest.raises(ValidationError):
+            counter.inc(host="x")
+
+    def test_reregister_returns_existing(self) -> None:
+        """Test that registering a name twice returns the same metric."""
+        registry = MetricsRegistry()
+        assert registry.counter("jobs", "Jobs.") is registry.counter("jobs", "Jobs.")
+        with pytest.raises(ValidationError):
+            registry.gauge("jobs", "Jobs.")
+
+
+class TestClientMetrics:
+    """Tests for metrics collected from a Client."""
+
+    def test_request_metrics(
+        self, sample_latest_response: dict, sample_mapping_response: list[dict]
+    ) -> None:
+        """Test request, byte, timing, cache and enrichment metrics."""
+        registry = MetricsRegistry()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/mapping"):
+                return httpx.Response(200, json=sample_mapping_response)
+            return httpx.Response(200, json=sample_latest_response)
+
+        with _client(registry, handler) as client:
+            client.get_latest_with_mapping()
+            client.get_latest_with_mapping()
+
+        assert registry.requests.value(endpoint="/latest") == 2
+        assert registry.requests.value(endpoint="/mapping") == 1
+        assert registry.response_bytes.value(endpoint="/latest") > 0
+        assert registry.decode_seconds.count(endpoint="/latest") == 2
+        assert registry.validation_seconds.count(endpoint="/latest") == 2
+        assert registry.enrichment_seconds.count(kind="latest") == 2
+        assert registry.cache_misses.value(endpoint="/mapping") == 1
+        assert registry.mapping_cache_bytes.value() > 0
+
+    def test_error_metrics(self) -> None:
+        """Test that 429s and other errors are counted separately."""
+        registry = MetricsRegistry()
+        statuses = iter([429, 503])
+
+        with _client(registry, lambda r: httpx.Response(next(statuses))) as client:
+            with pytest.raises(RateLimitError):
+                client.get_latest()
+            with pytest.raises(APIError):
+                client.get_latest()
+
+        assert registry.rate_limited.value(endpoint="/latest") == 1
+        assert registry.errors.value(endpoint="/latest", status="503") == 1
+        assert registry.errors.value(endpoint="/latest", status="429") == 0
+
+    def test_connection_error_metrics(self) -> None:
+        """Test that requests failing without a response are counted."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        registry = MetricsRegistry()
+        with _client(registry, handler) as client, pytest.raises(httpx.ReadTimeout):
+            client.get_latest()
+
+        assert registry.requests.value(endpoint="/latest") == 1
+        assert registry.connection_errors.value(endpoint="/latest", error="ReadTimeout") == 1
+        assert 'osrs_prices_connection_errors_total{endpoint="/latest",error="ReadTimeout"} 1' in (
+            registry.render()
+        )
+
+    def test_metric_requires_samples(self) -> None:
+        """Test that a metric type must implement samples."""
+        with pytest.raises(TypeError):
+            _Metric("name", "help")  # type: ignore[abstract]
+
+
+class TestServeMetrics:
+    """Tests for the metrics HTTP endpoint."""
+
+    def test_scrape(self) -> None:
+        """Test that /metrics serves the rendered registry."""
+        registry = MetricsRegistry()
+        registry.requests.inc(endpoint="/latest")
+        server = serve_metrics(registry, port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            response = httpx.get(f"{url}/metrics")
+            missing = httpx.get(f"{url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert 'osrs_prices_requests_total{endpoint="/latest"} 1' in response.text
+        assert missing.status_code == 404
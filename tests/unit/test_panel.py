@@ -0,0 +1,175 @@
+"""Unit tests for multi-item timeseries panels."""
+
+import random
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+
+from osrs_prices import Client, ValidationError
+from osrs_prices.models import EnrichedTimeseriesResponse, MappingResponse, TimeseriesResponse
+from osrs_prices.pandas import to_dataframe
+from osrs_prices.panel import FIELDS, TimeseriesPanel
+
+
+@pytest.fixture
+def bodies() -> dict[int, dict]:
+    """Two items with partly overlapping timestamps and a missing value."""
+    return {
+        4151: {
+            "data": [
+                {"timestamp": 100, "avgHighPrice": 10, "highPriceVolume": 1},
+                {"timestamp": 200, "avgHighPrice": 20, "avgLowPrice": 19, "highPriceVolume": 2},
+            ]
+        },
+        2: {
+            "data": [
+                {"timestamp": 200, "avgHighPrice": 5, "avgLowPrice": 4},
+                {"timestamp": 300, "avgHighPrice": 6, "lowPriceVolume": 7},
+            ]
+        },
+    }
+
+
+class TestTimeseriesPanel:
+    """Tests for TimeseriesPanel."""
+
+    def test_alignment(self, bodies: dict[int, dict]) -> None:
+        """Test that items are aligned on the union of their timestamps."""
+        panel = TimeseriesPanel.from_api(bodies)
+
+        assert panel.shape == (2, 3)
+        assert panel.item_ids.tolist() == [4151, 2]
+        assert panel.timestamps.tolist() == [100, 200, 300]
+        np.testing.assert_array_equal(
+            panel["avg_high_price"], [[10.0, 20.0, np.nan], [np.nan, 5.0, 6.0]]
+        )
+        np.testing.assert_array_equal(
+            panel["avg_low_price"], [[np.nan, 19.0, np.nan], [np.nan, 4.0, np.nan]]
+        )
+        np.testing.assert_array_equal(panel.item(2)["low_price_volume"], [np.nan, np.nan, 7.0])
+
+    def test_from_responses(self, bodies: dict[int, dict]) -> None:
+        """Test that parsed responses give the same panel as JSON."""
+        expected = TimeseriesPanel.from_api(bodies)
+        panel = TimeseriesPanel.from_responses(
+            {item_id: TimeseriesResponse.from_api(body) for item_id, body in bodies.items()}
+        )
+
+        assert panel.item_ids.tolist() == expected.item_ids.tolist()
+        for field in FIELDS:
+            np.testing.assert_array_equal(panel[field], expected[field])
+
+    def test_from_enriched(
+        self, sample_mapping_response: list[dict], sample_timeseries_response: dict
+    ) -> None:
+        """Test that enriched responses supply their own item IDs."""
+        mapping = MappingResponse.from_list(sample_mapping_response)
+        points = TimeseriesResponse.from_api(sample_timeseries_response).data
+        responses = [EnrichedTimeseriesResponse(item=item, data=points) for item in mapping.items]
+
+        panel = TimeseriesPanel.from_responses(responses)
+
+        assert panel.item_ids.tolist() == [4151, 2, 11802]
+        assert 11802 in panel
+        assert panel.timestamps.tolist() == sorted(p.timestamp for p in points)
+
+    def test_to_dataframe(self, bodies: dict[int, dict]) -> None:
+        """Test the long MultiIndex DataFrame."""
+        panel = TimeseriesPanel.from_api(bodies)
+
+        df = panel.to_dataframe()
+        dense = panel.to_dataframe(dropna=True)
+
+        assert df.index.names == ["item_id", "timestamp"]
+        assert len(df) == 6
+        assert len(dense) == 4
+        assert df.loc[(2, pd.Timestamp(300, unit="s", tz="UTC")), "avg_high_price"] == 6
+        assert list(df.columns) == list(FIELDS)
+
+    def test_to_dataframe_timestamp_dtype(self, bodies: dict[int, dict]) -> None:
+        """Test that the timestamp level holds UTC datetimes, not objects."""
+        df = TimeseriesPanel.from_api(bodies).to_dataframe()
+
+        # datetime64[ns, UTC] on pandas 2; pandas 3 keeps the seconds resolution.
+        dtype = df.index.get_level_values("timestamp").dtype
+        assert isinstance(dtype, pd.DatetimeTZDtype)
+        assert str(dtype.tz) == "UTC"
+        assert dtype == pd.to_datetime(np.array([0]), unit="s", utc=True).dtype
+
+    def test_matches_single_item_frames(self, sample_timeseries_response: dict) -> None:
+        """Test that an item's rows match its own timeseries DataFrame."""
+        panel = TimeseriesPanel.from_api({4151: sample_timeseries_response})
+        expected = to_dataframe(TimeseriesResponse.from_api(sample_timeseries_response))
+
+        df = panel.to_dataframe().loc[4151]
+
+        pd.testing.assert_frame_equal(df, expected.sort_index(), check_dtype=False)
+
+    def test_to_wide(self, bodies: dict[int, dict]) -> None:
+        """Test the timestamps by items DataFrame for one field."""
+        wide = TimeseriesPanel.from_api(bodies).to_wide("avg_high_price")
+
+        assert list(wide.columns) == [4151, 2]
+        assert wide.index.name == "timestamp"
+        assert wide[2].tolist()[1:] == [5.0, 6.0]
+
+    def test_to_xarray(self, bodies: dict[int, dict]) -> None:
+        """Test the xarray Dataset."""
+        pytest.importorskip("xarray")
+
+        ds = TimeseriesPanel.from_api(bodies).to_xarray()
+
+        assert ds["avg_high_price"].dims == ("item_id", "timestamp")
+        assert float(ds["avg_high_price"].sel(item_id=2)[-1]) == 6.0
+
+    def test_empty(self) -> None:
+        """Test a panel without items."""
+        panel = TimeseriesPanel.from_api({})
+
+        assert panel.shape == (0, 0)
+        assert len(panel.to_dataframe()) == 0
+
+    def test_invalid(self, bodies: dict[int, dict]) -> None:
+        """Test that duplicate items and misshapen arrays are rejected."""
+        panel = TimeseriesPanel.from_api(bodies)
+        data = {field: panel[field] for field in FIELDS}
+
+        with pytest.raises(ValidationError, match="unique"):
+            TimeseriesPanel(np.array([1, 1]), panel.timestamps, data)
+        with pytest.raises(ValidationError, match="shape"):
+            TimeseriesPanel(panel.item_ids, panel.timestamps[:2], data)
+
+    def test_fetch(self, bodies: dict[int, dict]) -> None:
+        """Test fetching several items concurrently."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=bodies[int(request.url.params["id"])])
+
+        with Client(user_agent="test/1.0", transport=httpx.MockTransport(handler)) as client:
+            panel = TimeseriesPanel.fetch(client, [2, 4151], "5m", max_workers=2)
+
+        assert panel.item_ids.tolist() == [2, 4151]
+        np.testing.assert_array_equal(panel.item(4151)["avg_high_price"], [10.0, 20.0, np.nan])
+
+    def test_fetch_concurrently_with_cache(self) -> None:
+        """Test that concurrent fetches keep each item's data with its own ID."""
+        item_ids = list(range(1, 41))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            item_id = int(request.url.params["id"])
+            time.sleep(random.uniform(0, 0.005))
+            return httpx.Response(
+                200, json={"data": [{"timestamp": 300, "avgHighPrice": item_id * 10}]}
+            )
+
+        transport = httpx.MockTransport(handler)
+        with Client(user_agent="test/1.0", transport=transport, timeseries_cache=True) as client:
+            panel = TimeseriesPanel.fetch(client, item_ids, "5m", max_workers=8)
+            histories = [client.get_timeseries_history(item_id, "5m") for item_id in item_ids]
+
+        assert panel["avg_high_price"][:, 0].tolist() == [item_id * 10.0 for item_id in item_ids]
+        assert [history.item_id for history in histories] == item_ids
+        assert [history.avg_high_price[0] for history in histories] == [i * 10 for i in item_ids]
@@ -0,0 +1,93 @@
+"""Unit tests for Polars conversion utilities."""
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from osrs_prices.models import (
+    AverageResponse,
+    EnrichedAveragePrice,
+    EnrichedAverageResponse,
+    LatestResponse,
+    MappingResponse,
+    TimeseriesResponse,
+)
+from osrs_prices.polars import from_api, to_polars
+
+
+class TestToPolars:
+    """Tests for to_polars and from_api."""
+
+    def test_mapping(self, sample_mapping_response: list[dict]) -> None:
+        """Test that the mapping has typed, nullable columns."""
+        df = to_polars(MappingResponse.from_list(sample_mapping_response))
+
+        assert df.columns[:3] == ["id", "name", "examine"]
+        assert df.schema["id"] == pl.Int64
+        assert df.schema["name"] == pl.Utf8
+        assert df.schema["members"] == pl.Boolean
+        assert df["lowalch"].to_list() == [28800, 2, None]
+        assert df.schema["lowalch"] == pl.Int64
+
+    def test_matches_json(
+        self,
+        sample_mapping_response: list[dict],
+        sample_latest_response: dict,
+        sample_5m_response: dict,
+        sample_timeseries_response: dict,
+    ) -> None:
+        """Test that JSON gives the same frames as the parsed responses."""
+        cases = [
+            (
+                MappingResponse.from_list(sample_mapping_response),
+                sample_mapping_response,
+                "mapping",
+            ),
+            (LatestResponse.from_api(sample_latest_response), sample_latest_response, "latest"),
+            (AverageResponse.from_api(sample_5m_response), sample_5m_response, "5m"),
+            (
+                TimeseriesResponse.from_api(sample_timeseries_response),
+                sample_timeseries_response,
+                "timeseries",
+            ),
+        ]
+        for response, data, kind in cases:
+            assert from_api(data, kind).equals(to_polars(response))
+
+    def test_timestamps(self, sample_latest_response: dict) -> None:
+        """Test timeseries and trade time columns as UTC datetimes."""
+        timeseries = from_api({"data": [{"timestamp": 1704067200}]}, "timeseries")
+        latest = from_api(sample_latest_response, "latest", datetimes=True)
+
+        assert timeseries.schema["timestamp"] == pl.Datetime("us", "UTC")
+        assert timeseries["timestamp"][0].timestamp() == 1704067200
+        assert latest.schema["high_time"] == pl.Datetime("us", "UTC")
+        assert latest.schema["high"] == pl.Int64
+
+    def test_matches_arrow(self, sample_5m_response: dict) -> None:
+        """Test that the frame has the same values as the Arrow table."""
+        arrow = pytest.importorskip("osrs_prices.arrow")
+
+        df = from_api(sample_5m_response, "5m")
+
+        assert df.to_dicts() == arrow.from_api(sample_5m_response, "5m").to_pylist()
+
+    def test_enriched(self, sample_mapping_response: list[dict], sample_5m_response: dict) -> None:
+        """Test that enriched responses have metadata and price columns."""
+        average = AverageResponse.from_api(sample_5m_response).data[4151].model_dump()
+        response = EnrichedAverageResponse(
+            items=[EnrichedAveragePrice.model_validate({**sample_mapping_response[0], **average})],
+            timestamp=sample_5m_response["timestamp"],
+        )
+
+        df = to_polars(response)
+
+        assert df.columns[:2] == ["item_id", "name"]
+        assert df["avg_high_price"][0] == average["avg_high_price"]
+
+    def test_unsupported(self) -> None:
+        """Test that unsupported types and kinds raise."""
+        with pytest.raises(TypeError, match="Unsupported response type"):
+            to_polars("not a response")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Unsupported response kind"):
+            from_api({}, "prices")  # type: ignore[arg-type]
@@ -0,0 +1,129 @@
+"""Unit tests for sharing a warmed-up mapping with forked workers."""
+
+import gc
+import os
+import weakref
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from osrs_prices import Client, ValidationError, prefork
+
+
+@pytest.fixture(autouse=True)
+def _reset_warmed() -> Iterator[None]:
+    yield
+    prefork._warmed = None
+
+
+def _client(calls: list[str], sample_mapping_response: list[dict]) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=sample_mapping_response)
+
+    return Client(user_agent="test/1.0", transport=httpx.MockTransport(handler))
+
+
+class TestWarmUp:
+    """Tests for warm_up and adopt."""
+
+    def test_adopted_client_makes_no_requests(self, sample_mapping_response: list[dict]) -> None:
+        """Test that a client adopting the warmed mapping never fetches it."""
+        calls: list[str] = []
+        with _client(calls, sample_mapping_response) as master:
+            warm = prefork.warm_up(master, freeze=False)
+        assert calls == ["/api/v1/osrs/mapping"]
+        assert prefork.warmed() is warm
+
+        with _client(calls, sample_mapping_response) as worker:
+            assert prefork.adopt(worker) is warm
+            assert worker.get_mapping() is warm.mapping
+            assert worker._get_mapping_lookup() is warm.by_id
+            whip = worker.get_item_by_name("Abyssal whip")
+
+        assert whip is not None and whip.id == 4151
+        assert calls == ["/api/v1/osrs/mapping"]
+
+    def test_indexes(self, sample_mapping_response: list[dict]) -> None:
+        """Test that the indexes cover every item."""
+        with _client([], sample_mapping_response) as client:
+            warm = prefork.warm_up(client, freeze=False)
+
+        assert set(warm.by_id) == {item["id"] for item in sample_mapping_response}
+        assert warm.by_name["Cannonball"] == 2
+
+    def test_freeze(self, sample_mapping_response: list[dict]) -> None:
+        """Test that warm_up moves tracked objects to the permanent generation."""
+        try:
+            with _client([], sample_mapping_response) as client:
+                prefork.warm_up(client)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+    def test_adopt_without_warm_up_raises(self) -> None:
+        """Test that adopting before warm_up raises ValidationError."""
+        with (
+            Client(user_agent="test/1.0") as client,
+            pytest.raises(ValidationError, match="warm_up"),
+        ):
+            prefork.adopt(client)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+    def test_forked_child_adopts(self, sample_mapping_response: list[dict]) -> None:
+        """Test that a forked child can adopt the mapping warmed in the parent."""
+        with _client([], sample_mapping_response) as master:
+            prefork.warm_up(master, freeze=False)
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            code = 1
+            try:
+                failing = httpx.MockTransport(lambda r: httpx.Response(500))
+                with Client(user_agent="test/1.0", transport=failing) as worker:
+                    prefork.adopt(worker)
+                    if worker.get_item_by_name("Cannonball") is not None:
+                        code = 0
+            finally:
+                os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+
+class TestResetAfterFork:
+    """Tests for replacing inherited HTTP connections."""
+
+    def test_replaces_owned_http_client(self) -> None:
+        """Test that an owned HTTP client is replaced on every endpoint."""
+        with Client(user_agent="test/1.0", timeout=5.0) as client:
+            old = client._http_client
+            client.reset_after_fork()
+            new = client._http_client
+
+            assert new is not old
+            assert new.headers["User-Agent"] == "test/1.0"
+            assert new.timeout == httpx.Timeout(5.0)
+            assert all(endpoint._client is new for endpoint in client._endpoints())
+        old.close()
+
+    def test_keeps_caller_http_client(self) -> None:
+        """Test that an http_client passed by the caller is left alone."""
+        http_client = httpx.Client()
+        with Client(user_agent="test/1.0", http_client=http_client) as client:
+            client.reset_after_fork()
+            assert client._http_client is http_client
+        http_client.close()
+
+    def test_reset_on_fork_holds_weak_reference(self) -> None:
+        """Test that registering a client does not keep it alive."""
+        client = Client(user_agent="test/1.0")
+        prefork.reset_on_fork(client)
+        ref = weakref.ref(client)
+        client.close()
+        del client
+        gc.collect()
+
+        assert ref() is None
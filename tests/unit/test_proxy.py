@@ -0,0 +1,137 @@
+"""Unit tests for the caching proxy server."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from osrs_prices import Client, ValidationError
+from osrs_prices.proxy import HISTORICAL_POLICY, ProxyServer, RateLimiter
+
+
+def _upstream(handler: object) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def upstream_calls() -> list[httpx.Request]:
+    """Requests seen by the mocked upstream API."""
+    return []
+
+
+@pytest.fixture
+def proxy(
+    upstream_calls: list[httpx.Request], sample_latest_response: dict
+) -> Iterator[ProxyServer]:
+    """Run a proxy on a free port in front of a mocked upstream."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        upstream_calls.append(request)
+        if request.url.path.endswith("/5m"):
+            time.sleep(0.1)  # Slow enough for concurrent requests to overlap
+        if request.url.path.endswith("/1h"):
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json=sample_latest_response)
+
+    server = ProxyServer(user_agent="proxy-test/1.0", port=0, upstream=_upstream(handler))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestProxyServer:
+    """Tests for ProxyServer."""
+
+    def test_client_through_proxy(
+        self, proxy: ProxyServer, upstream_calls: list[httpx.Request]
+    ) -> None:
+        """Test that a Client pointed at the proxy gets upstream data, cached."""
+        with Client(user_agent="test/1.0", base_url=proxy.url) as client:
+            first = client.get_latest(item_id=4151)
+            second = client.get_latest(item_id=4151)
+
+        assert first == second
+        assert 4151 in first.data
+        assert len(upstream_calls) == 1
+        assert upstream_calls[0].url.params["id"] == "4151"
+        assert upstream_calls[0].headers["User-Agent"] == "proxy-test/1.0"
+
+    def test_cache_headers(self, proxy: ProxyServer) -> None:
+        """Test that responses report their cache status."""
+        first = httpx.get(f"{proxy.url}/latest")
+        second = httpx.get(f"{proxy.url}/latest")
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+
+    def test_keep_alive_latency(self, proxy: ProxyServer) -> None:
+        """Test that cache hits on a reused connection are not delayed."""
+        with httpx.Client(base_url=proxy.url) as http:
+            http.get("/latest")
+            timings = []
+            for _ in range(10):
+                start = time.perf_counter()
+                response = http.get("/latest")
+                timings.append(time.perf_counter() - start)
+                assert response.headers["X-Cache"] == "HIT"
+
+        # A delayed ACK stalls each response for about 40 ms.
+        assert sorted(timings)[len(timings) // 2] < 0.02
+
+    def test_coalesces_concurrent_requests(
+        self, proxy: ProxyServer, upstream_calls: list[httpx.Request]
+    ) -> None:
+        """Test that concurrent requests for one URL share an upstream fetch."""
+        statuses: list[str] = []
+
+        def request() -> None:
+            statuses.append(httpx.get(f"{proxy.url}/5m").headers["X-Cache"])
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(upstream_calls) == 1
+        assert statuses.count("MISS") == 1
+
+    def test_errors_passed_through_not_cached(
+        self, proxy: ProxyServer, upstream_calls: list[httpx.Request]
+    ) -> None:
+        """Test that upstream errors are returned and not cached."""
+        assert httpx.get(f"{proxy.url}/1h").status_code == 500
+        assert httpx.get(f"{proxy.url}/1h").status_code == 500
+        assert len(upstream_calls) == 2
+
+    def test_unknown_path(self, proxy: ProxyServer) -> None:
+        """Test that unknown paths return 404 without an upstream request."""
+        response = httpx.get(f"{proxy.url}/nope")
+        assert response.status_code == 404
+        assert "error" in json.loads(response.content)
+
+    def test_historical_policy(self) -> None:
+        """Test that timestamped average requests use the long-lived policy."""
+        assert ProxyServer.policy_for("/5m", {"timestamp": "1704067200"}) is HISTORICAL_POLICY
+        assert ProxyServer.policy_for("/5m", {}) is not HISTORICAL_POLICY
+
+    def test_requires_valid_user_agent(self) -> None:
+        """Test that the proxy refuses a blocked User-Agent."""
+        with pytest.raises(ValidationError):
+            ProxyServer(user_agent="python-httpx/0.27", port=0)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_burst_then_throttle(self) -> None:
+        """Test that requests beyond the burst wait for tokens."""
+        limiter = RateLimiter(rate=20.0, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.09
@@ -0,0 +1,142 @@
+"""Unit tests for the record and replay transports."""
+
+import gzip
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from osrs_prices import APIError, Client, ValidationError
+from osrs_prices.replay import Cassette, Interaction, RecordingTransport, ReplayTransport
+
+
+def _snapshot(timestamp: int, price: int) -> Interaction:
+    body = {"data": {"4151": {"avgHighPrice": price}}, "timestamp": timestamp}
+    return Interaction(path="/5m", params={}, status=200, body=json.dumps(body))
+
+
+@pytest.fixture
+def recorded(
+    sample_latest_response: dict, sample_mapping_response: list[dict], sample_5m_response: dict
+) -> Cassette:
+    """Record a session against a mocked API."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/mapping"):
+            return httpx.Response(200, json=sample_mapping_response)
+        if request.url.path.endswith("/5m"):
+            return httpx.Response(200, json=sample_5m_response)
+        return httpx.Response(200, json=sample_latest_response)
+
+    cassette = Cassette()
+    transport = RecordingTransport(cassette, transport=httpx.MockTransport(handler))
+    with Client(user_agent="test/1.0", transport=transport) as client:
+        client.get_latest_with_mapping()
+        client.get_5m_average()
+    return cassette
+
+
+class TestRecordingTransport:
+    """Tests for RecordingTransport."""
+
+    def test_records_paths_and_params(self, recorded: Cassette) -> None:
+        """Test that paths are stored relative to the API root."""
+        assert [i.path for i in recorded.interactions] == ["/latest", "/mapping", "/5m"]
+        assert all(i.status == 200 for i in recorded.interactions)
+
+    def test_save_and_load(self, recorded: Cassette, tmp_path: Path) -> None:
+        """Test that a cassette round-trips through a file."""
+        path = tmp_path / "session.cassette"
+        recorded.save(path)
+
+        assert Cassette.load(path).interactions == recorded.interactions
+
+    def test_load_rejects_unknown_version(self, tmp_path: Path) -> None:
+        """Test that an unsupported cassette raises ValidationError."""
+
+        path = tmp_path / "bad.cassette"
+        with gzip.open(path, "wt") as f:
+            f.write('{"version": 99}\n')
+
+        with pytest.raises(ValidationError):
+            Cassette.load(path)
+
+    def test_records_gzip_responses(self, sample_latest_response: dict) -> None:
+        """Test that a compressed response reaches the client decoded once."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = gzip.compress(json.dumps(sample_latest_response).encode())
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/json", "content-encoding": "gzip"},
+                content=body,
+            )
+
+        cassette = Cassette()
+        transport = RecordingTransport(cassette, transport=httpx.MockTransport(handler))
+        with Client(user_agent="test/1.0", transport=transport) as client:
+            latest = client.get_latest()
+
+        assert 4151 in latest.data
+        assert json.loads(cassette.interactions[0].body) == sample_latest_response
+
+
+class TestReplayTransport:
+    """Tests for ReplayTransport."""
+
+    def test_client_runs_offline(self, recorded: Cassette, tmp_path: Path) -> None:
+        """Test that an unchanged Client works from a replayed cassette."""
+        recorded.save(tmp_path / "session.cassette")
+        transport = ReplayTransport(Cassette.load(tmp_path / "session.cassette"))
+
+        with Client(user_agent="test/1.0", transport=transport) as client:
+            enriched = client.get_latest_with_mapping()
+            averages = client.get_5m_average()
+
+        assert {item.name for item in enriched.items} >= {"Abyssal whip"}
+        assert averages.timestamp == 1704067200
+
+    def test_missing_recording_is_404(self, recorded: Cassette) -> None:
+        """Test that an unrecorded request fails like an API error."""
+        with (
+            Client(user_agent="test/1.0", transport=ReplayTransport(recorded)) as client,
+            pytest.raises(APIError) as exc_info,
+        ):
+            client.get_1h_average()
+
+        assert exc_info.value.status_code == 404
+
+    def test_time_travel_picks_nearest_snapshot(self) -> None:
+        """Test that a timestamp is mapped to the nearest recorded snapshot."""
+        cassette = Cassette([_snapshot(1000, 10), _snapshot(1300, 13), _snapshot(1600, 16)])
+
+        with Client(user_agent="test/1.0", transport=ReplayTransport(cassette)) as client:
+            assert client.get_5m_average(timestamp=1290).data[4151].avg_high_price == 13
+            assert client.get_5m_average(timestamp=9999).data[4151].avg_high_price == 16
+            assert client.get_5m_average(timestamp=0).data[4151].avg_high_price == 10
+
+    def test_exact_params_match_first(self) -> None:
+        """Test that an exact recording wins over the nearest snapshot."""
+        exact = Interaction(
+            path="/5m",
+            params={"timestamp": "1300"},
+            status=200,
+            body=json.dumps({"data": {}, "timestamp": 1300}),
+        )
+        transport = ReplayTransport(Cassette([_snapshot(1300, 13), exact]))
+
+        assert transport.find("/5m", {"timestamp": "1300"}) is exact
+
+    def test_latency_and_throughput(self, recorded: Cassette) -> None:
+        """Test that simulated latency and bandwidth delay responses."""
+        transport = ReplayTransport(recorded, latency=0.05, throughput=10_000)
+        body_size = len(recorded.interactions[0].body)
+
+        with Client(user_agent="test/1.0", transport=transport) as client:
+            start = time.perf_counter()
+            client.get_latest()
+            elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.05 + body_size / 10_000
@@ -0,0 +1,93 @@
+"""Unit tests for the columnar snapshot store."""
+
+from pathlib import Path
+
+import pytest
+
+from osrs_prices.constants import NULL_INT64
+from osrs_prices.exceptions import ValidationError
+from osrs_prices.models import AveragePrice, AverageResponse, LatestPrice, LatestResponse
+from osrs_prices.store import SnapshotStore
+
+
+def _average(timestamp: int, offset: int = 0) -> AverageResponse:
+    return AverageResponse(
+        timestamp=timestamp,
+        data={
+            4151: AveragePrice(avg_high_price=1500000 + offset, high_price_volume=50),
+            2: AveragePrice(avg_high_price=150 + offset, avg_low_price=145, low_price_volume=9),
+        },
+    )
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore."""
+
+    def test_write_and_query_all(self, tmp_path: Path) -> None:
+        """Test that a written snapshot is returned sorted by item ID."""
+        store = SnapshotStore(tmp_path)
+        store.write_average(_average(1704067200), "5m")
+
+        result = store.query("5m")
+
+        assert len(result) == 2
+        assert list(result.item_ids) == [2, 4151]
+        assert list(result.timestamps) == [1704067200, 1704067200]
+        assert list(result.columns["avg_high_price"]) == [150, 1500000]
+        assert list(result.columns["avg_low_price"]) == [145, NULL_INT64]
+
+    def test_query_single_item_over_window(self, tmp_path: Path) -> None:
+        """Test a range query for one item across snapshots and chunks."""
+        store = SnapshotStore(tmp_path, chunk_span=600)
+        for i in range(6):
+            store.write_average(_average(1704067200 + i * 300, offset=i), "5m")
+
+        result = store.query("5m", start=1704067200 + 300, end=1704067200 + 1500, item_id=4151)
+
+        assert list(result.item_ids) == [4151] * 4
+        assert list(result.timestamps) == [1704067200 + i * 300 for i in range(1, 5)]
+        assert list(result.columns["avg_high_price"]) == [1500000 + i for i in range(1, 5)]
+        assert len(list((tmp_path / "5m").iterdir())) == 3
+
+    def test_query_missing_item(self, tmp_path: Path) -> None:
+        """Test that querying an unknown item returns no rows."""
+        store = SnapshotStore(tmp_path)
+        store.write_average(_average(1704067200), "1h")
+        assert len(store.query("1h", item_id=999)) == 0
+
+    def test_write_latest(self, tmp_path: Path) -> None:
+        """Test writing a LatestResponse snapshot."""
+        store = SnapshotStore(tmp_path)
+        latest = LatestResponse(data={4151: LatestPrice(high=1500000, high_time=1704067200)})
+        store.write_latest(latest, timestamp=1704067205)
+
+        result = store.query("latest", item_id=4151)
+
+        assert list(result.columns["high"]) == [1500000]
+        assert list(result.columns["low"]) == [NULL_INT64]
+        assert store.timestamps("latest") == [1704067205]
+
+    def test_rejects_out_of_order_snapshot(self, tmp_path: Path) -> None:
+        """Test that snapshots must be appended in time order."""
+        store = SnapshotStore(tmp_path)
+        store.write_average(_average(1704067500), "5m")
+        with pytest.raises(ValidationError, match="not newer"):
+            store.write_average(_average(1704067200), "5m")
+
+    def test_reopen_store(self, tmp_path: Path) -> None:
+        """Test that history persists across store instances."""
+        SnapshotStore(tmp_path).write_average(_average(1704067200), "5m")
+
+        store = SnapshotStore(tmp_path)
+        with pytest.raises(ValidationError):
+            store.write_average(_average(1704067200), "5m")
+        store.write_average(_average(1704067500), "5m")
+        assert store.timestamps("5m") == [1704067200, 1704067500]
+
+    def test_unknown_timestep(self, tmp_path: Path) -> None:
+        """Test that unknown timesteps are rejected."""
+        store = SnapshotStore(tmp_path)
+        with pytest.raises(ValidationError, match="Unknown timestep"):
+            store.query("6h")
+        with pytest.raises(ValidationError):
+            store.write_average(_average(1704067200), "latest")
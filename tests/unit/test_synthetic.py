@@ -0,0 +1,89 @@
+"""Unit tests for the synthetic payload generator."""
+
+from itertools import pairwise
+
+import pytest
+
+from osrs_prices.models import (
+    AverageResponse,
+    LatestResponse,
+    MappingResponse,
+    TimeseriesResponse,
+)
+from osrs_prices.synthetic import DEFAULT_TIMESTAMP, PayloadGenerator
+
+
+@pytest.fixture(scope="module")
+def gen() -> PayloadGenerator:
+    """A small generator shared by the tests."""
+    return PayloadGenerator(items=500, seed=7)
+
+
+class TestPayloadGenerator:
+    """Tests for PayloadGenerator."""
+
+    def test_deterministic(self, gen: PayloadGenerator) -> None:
+        """Test that the same seed produces the same payloads."""
+        other = PayloadGenerator(items=500, seed=7)
+
+        assert other.mapping() == gen.mapping()
+        assert other.latest() == gen.latest()
+        assert PayloadGenerator(items=500, seed=8).latest() != gen.latest()
+
+    def test_mapping_matches_schema(self, gen: PayloadGenerator) -> None:
+        """Test that /mapping parses and omits alch fields for some items."""
+        payload = gen.mapping()
+        mapping = MappingResponse.from_list(payload)
+
+        assert [item.id for item in mapping.items] == gen.item_ids
+        assert any("highalch" not in entry for entry in payload)
+        assert any("limit" not in entry for entry in payload)
+
+    def test_latest_matches_schema(self, gen: PayloadGenerator) -> None:
+        """Test that /latest uses string keys and includes nulls."""
+        payload = gen.latest()
+        latest = LatestResponse.from_api(payload)
+
+        assert all(isinstance(key, str) for key in payload["data"])
+        assert set(latest.data) == set(gen.item_ids)
+        assert any(price.high is None for price in latest.data.values())
+        assert all(
+            price.high_time is None or price.high_time <= DEFAULT_TIMESTAMP
+            for price in latest.data.values()
+        )
+
+    @pytest.mark.parametrize("timestep", ["5m", "1h"])
+    def test_average_matches_schema(self, gen: PayloadGenerator, timestep: str) -> None:
+        """Test that averages skip untraded items and null one-sided prices."""
+        payload = gen.average(timestep, timestamp=1700000000)  # type: ignore[arg-type]
+        averages = AverageResponse.from_api(payload)
+
+        assert averages.timestamp == 1700000000
+        assert 0 < len(averages.data) <= len(gen.item_ids)
+        for price in averages.data.values():
+            assert price.high_price_volume or price.low_price_volume
+            assert (price.avg_high_price is None) == (price.high_price_volume == 0)
+
+    def test_skewed_prices(self) -> None:
+        """Test that prices are heavy-tailed rather than uniform."""
+        latest = LatestResponse.from_api(PayloadGenerator(items=2000, seed=1).latest())
+        prices = sorted(p.low for p in latest.data.values() if p.low is not None)
+
+        median = prices[len(prices) // 2]
+        assert prices[-1] > 100 * median
+
+    def test_timeseries(self, gen: PayloadGenerator) -> None:
+        """Test that timeseries points are evenly spaced and end at `end`."""
+        item_id = gen.item_ids[3]
+        payload = gen.timeseries(item_id, "1h", points=1000, end=1700000000)
+        series = TimeseriesResponse.from_api(payload, item_id=item_id)
+
+        timestamps = [point.timestamp for point in series.data]
+        assert len(timestamps) == 1000
+        assert timestamps[-1] == 1700000000
+        assert {b - a for a, b in pairwise(timestamps)} == {3600}
+
+    def test_timeseries_unknown_item(self, gen: PayloadGenerator) -> None:
+        """Test that an item outside the catalog raises KeyError."""
+        with pytest.raises(KeyError):
+            gen.timeseries(1)
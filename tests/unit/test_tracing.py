@@ -0,0 +1,101 @@
+"""Unit tests for optional OpenTelemetry tracing."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from osrs_prices import APIError, Client, tracing
+
+
+def _client(handler: object) -> Client:
+    return Client(
+        user_agent="test/1.0",
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+
+
+def _handler(latest: dict, mapping: list[dict]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/mapping"):
+            return httpx.Response(200, json=mapping)
+        if request.url.path.endswith("/1h"):
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json=latest)
+
+    return handler
+
+
+class TestWithoutOpenTelemetry:
+    """Tests for behaviour when OpenTelemetry is not installed."""
+
+    def test_instrument_is_noop(
+        self, monkeypatch: pytest.MonkeyPatch, sample_latest_response: dict
+    ) -> None:
+        """Test that instrument returns False and leaves the client untouched."""
+        monkeypatch.setattr(tracing, "_AVAILABLE", False)
+        client = _client(lambda r: httpx.Response(200, json=sample_latest_response))
+
+        assert tracing.instrument(client) is False
+        assert not tracing.is_available()
+        assert not client.hooks
+        assert "get_latest" not in vars(client)
+        client.close()
+
+
+@pytest.fixture
+def exporter() -> Iterator[Any]:
+    """An in-memory span exporter, skipping if the SDK is not installed."""
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+    in_memory = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    exporter.provider = provider
+    yield exporter
+    provider.shutdown()
+
+
+class TestWithOpenTelemetry:
+    """Tests for spans recorded through an in-memory exporter."""
+
+    def test_method_and_stage_spans(
+        self, exporter: Any, sample_latest_response: dict, sample_mapping_response: list[dict]
+    ) -> None:
+        """Test the span tree for an enriched request."""
+        with _client(_handler(sample_latest_response, sample_mapping_response)) as client:
+            assert tracing.instrument(client, tracer_provider=exporter.provider)
+            client.get_latest_with_mapping()
+
+        finished = exporter.get_finished_spans()
+        spans = {span.name: span for span in finished}
+        root = spans["osrs_prices.get_latest_with_mapping"]
+        assert root.parent is None
+        assert root.attributes["osrs_prices.item_count"] == len(sample_latest_response["data"])
+
+        latest = spans["osrs_prices.get_latest"]
+        assert latest.parent.span_id == root.context.span_id
+        stages = [s for s in finished if s.attributes.get("url.path") == "/latest"]
+        assert [s.name for s in stages] == ["GET /latest", "decode", "validate"]
+        assert all(s.parent.span_id == latest.context.span_id for s in stages)
+        assert spans["GET /latest"].attributes["http.response.status_code"] == 200
+        assert spans["enrich"].parent.span_id == root.context.span_id
+        assert spans["osrs_prices.get_mapping"].attributes["osrs_prices.cache"] == "miss"
+
+    def test_error_status(
+        self, exporter: Any, sample_latest_response: dict, sample_mapping_response: list[dict]
+    ) -> None:
+        """Test that failed requests mark their spans as errors."""
+        from opentelemetry.trace import StatusCode
+
+        with _client(_handler(sample_latest_response, sample_mapping_response)) as client:
+            tracing.instrument(client, tracer_provider=exporter.provider)
+            with pytest.raises(APIError):
+                client.get_1h_average()
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert spans["GET /1h"].status.status_code == StatusCode.ERROR
+        assert spans["osrs_prices.get_1h_average"].status.status_code == StatusCode.ERROR